@@ -0,0 +1 @@
+"""파싱/DB 저장 경로 벤치마크 (python -m benchmarks.run)"""
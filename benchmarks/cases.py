@@ -0,0 +1,209 @@
+"""
+벤치마크 케이스 - 각 케이스는 (setup, 측정 함수)로 구성
+setup은 한 번만 실행되고, 측정 함수는 러너가 반복 실행해 1회당 소요 시간을 잰다
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, List
+
+from src.__mock__.postgrest_server import LOCAL_KEY, LocalPostgrest
+from src.__mock__.synthetic_catalog import SyntheticCatalog
+from src.crawlers.burger_king import BurgerKingCrawler
+from src.crawlers.lotteria import LotteriaCrawler
+from src.async_database import AsyncSupabaseManager
+from src.database import SupabaseManager
+
+
+class BenchmarkCase:
+    def __init__(
+        self, name: str, setup: Callable[[], Callable[[], Any]], number: int
+    ):
+        self.name = name
+        # setup()은 측정할 함수를 반환 (픽스처 생성은 측정에서 제외)
+        self.setup = setup
+        # 반복 1회(round)당 최소 호출 횟수 (러너가 라운드 시간에 맞춰 늘림)
+        self.number = number
+
+
+CASES: List[BenchmarkCase] = []
+
+
+def benchmark(name: str, number: int = 100):
+    def register(setup: Callable[[], Callable[[], Any]]):
+        CASES.append(BenchmarkCase(name, setup, number))
+        return setup
+
+    return register
+
+
+def _plist_html(count: int) -> str:
+    """롯데리아 메뉴 페이지 형식의 HTML (버거 2/3, 그 외 1/3)"""
+    items = [
+        {
+            "presPrdId": f"P{index:05d}",
+            "presPrdNm": f"테스트 버거 {index}",
+            "dispNm": f"육즙 가득한 패티와 특제 소스 {index}",
+            "sellPrice": 5000 + index * 100,
+            "displayCategoryNm": "버거" if index % 3 else "디저트",
+            "imgPath": "/upload/product/",
+            "imgSystemFileNm": f"img_{index}",
+            "imgExtsn": "png",
+        }
+        for index in range(count)
+    ]
+    filler = "<div class='menu-item'><span>메뉴</span></div>" * 200
+    return (
+        f"<html><head><script>var pList = {json.dumps(items, ensure_ascii=False)};"
+        f"</script></head><body>{filler}</body></html>"
+    )
+
+
+def _nutrition_html() -> str:
+    """롯데리아 상세 페이지 형식의 HTML (영양 정보 테이블 포함)"""
+    rows = [
+        ("총중량(g)", "229"),
+        ("열량(kcal)", "564"),
+        ("단백질(g)", "25"),
+        ("나트륨(mg)", "979"),
+        ("당류(g)", "12"),
+        ("포화지방(g)", "10.5"),
+    ]
+    table = "".join(f"<tr><th>{key}</th><td>{value}</td></tr>" for key, value in rows)
+    filler = "<section><p>알레르기 유발 성분: 밀, 대두, 우유</p></section>" * 50
+    return (
+        f"<html><body>{filler}<table class='tbl-row-info'><tbody>{table}</tbody>"
+        f"</table>{filler}</body></html>"
+    )
+
+
+def _burger_data(index: int) -> Dict[str, Any]:
+    return {
+        "name": f"벤치마크 버거 {index}",
+        "brand_name": "벤치마크",
+        "brand_name_eng": "benchmark",
+        "description": "벤치마크용 버거",
+        "description_full": "벤치마크용 버거 상세 설명",
+        "image_url": f"https://example.com/images/{index}.png",
+        "price": 5000 + index,
+        "set_price": 7000 + index,
+        "available": True,
+        "category": "버거",
+        "shop_url": f"https://example.com/menu/{index}",
+        "released_at": datetime(2024, 1, 1),
+        "patty": "meat",
+        "nutrition": {
+            "calories": 500 + index % 300,
+            "fat": 10.5,
+            "protein": 25.0,
+            "sugar": 8.0,
+            "sodium": 900,
+        }
+        if index % 2
+        else None,
+    }
+
+
+@benchmark("lotteria.plist_extract", number=20)
+def lotteria_plist_extract():
+    crawler = LotteriaCrawler()
+    html = _plist_html(300)
+    return lambda: crawler._parse_product_list(html)
+
+
+@benchmark("lotteria.nutrition_table", number=50)
+def lotteria_nutrition_table():
+    crawler = LotteriaCrawler()
+    html = _nutrition_html()
+    return lambda: crawler._parse_nutrition_table(html)
+
+
+@benchmark("burger_king.nutrition_cells", number=2000)
+def burger_king_nutrition_cells():
+    crawler = BurgerKingCrawler()
+    cells = ["와퍼", "616", "27(49%)", "1,084(54%)", "14", "13(87%)", "-"]
+    return lambda: crawler._parse_nutrition_cells(cells)
+
+
+@benchmark("base.extract_price", number=2000)
+def base_extract_price():
+    crawler = LotteriaCrawler()
+    texts = ["7,100원", "12000", "₩ 8,900", "가격 미정", "", "세트 9,800원"]
+
+    def run():
+        for text in texts:
+            crawler.extract_price(text)
+
+    return run
+
+
+@benchmark("base.clean_text", number=2000)
+def base_clean_text():
+    crawler = LotteriaCrawler()
+    texts = ["  불고기 버거\n", "\t한우 버거\t세트 ", "치즈\n버거\n", "", "새우 버거"]
+
+    def run():
+        for text in texts:
+            crawler.clean_text(text)
+
+    return run
+
+
+@benchmark("database.serialize_data", number=2000)
+def database_serialize_data():
+    row = {
+        "product_id": 1,
+        "name": "벤치마크 버거",
+        "price": 7100,
+        "calories": Decimal("564"),
+        "fat": Decimal("10.5"),
+        "released_at": datetime(2024, 1, 1),
+        "description": None,
+        "available": True,
+    }
+    # 클라이언트 생성만 하고 요청은 보내지 않음
+    manager = SupabaseManager(url="http://127.0.0.1", key=LOCAL_KEY)
+    return lambda: manager._serialize_data(row)
+
+
+@benchmark("database.bulk_insert_500", number=3)
+def database_bulk_insert():
+    # 로컬 PostgREST 대체 서버는 프로세스가 끝날 때까지 유지 (데몬 스레드)
+    server = LocalPostgrest()
+    server.start()
+    manager = SupabaseManager(url=server.url, key=LOCAL_KEY)
+    data_list = [_burger_data(index) for index in range(500)]
+
+    def insert():
+        # 반복할수록 테이블이 커지지 않도록 매번 같은 상태에서 삽입 (브랜드는 유지)
+        server.reset("Product", "Nutrition")
+        manager.insert_burger_batch(data_list, batch_size=100)
+
+    return insert
+
+
+@benchmark("async_database.bulk_insert_500", number=3)
+def async_database_bulk_insert():
+    server = LocalPostgrest()
+    server.start()
+    data_list = [_burger_data(index) for index in range(500)]
+
+    async def insert():
+        # 클라이언트는 이벤트 루프에 묶이므로 호출마다 생성 (연결 수립 포함)
+        async with AsyncSupabaseManager(url=server.url, key=LOCAL_KEY) as manager:
+            await manager.insert_burger_batch(data_list, batch_size=100)
+
+    def run():
+        server.reset("Product", "Nutrition")
+        asyncio.run(insert())
+
+    return run
+
+
+@benchmark("synthetic_catalog.chunk_1000", number=5)
+def synthetic_catalog_chunk():
+    # 제품마다 해시를 계산하는 경로 (벡터화되지 않음) - 제품당 비용의 회귀만 확인
+    catalog = SyntheticCatalog(seed=42)
+    return lambda: catalog.chunk(100000, 101000, revision=3)
@@ -0,0 +1,205 @@
+"""
+벤치마크 러너 - 저장된 기준값(baseline.json)과 비교해 성능 저하 표시
+
+python -m benchmarks.run                    # 실행 후 기준값과 비교 (저하 시 종료 코드 1)
+python -m benchmarks.run --update-baseline  # 현재 결과를 기준값으로 저장
+python -m benchmarks.run --filter lotteria  # 이름에 lotteria가 포함된 케이스만
+"""
+
+import argparse
+import gc
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# config를 불러오기 전에 벤치마크용 기본 환경 변수 설정 (실제 Supabase/캐시 사용 안 함)
+os.environ.setdefault("SUPABASE_URL", "http://127.0.0.1")
+os.environ.setdefault("SUPABASE_KEY", "local.postgrest.stand-in")
+os.environ.setdefault("HTTP_CACHE_ENABLED", "false")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from loguru import logger  # noqa: E402
+
+from benchmarks.cases import CASES, BenchmarkCase  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# 기준값보다 이 비율 이상 느려지면 성능 저하로 표시
+DEFAULT_THRESHOLD = 0.2
+
+# 1회 호출이 이보다 짧은 케이스는 잡음 비중이 커서 더 넓은 기준 적용
+MICRO_CASE_SECONDS = 1e-5
+MICRO_THRESHOLD = 0.35
+
+# 라운드 1회가 이 시간 이상 걸리도록 호출 횟수를 늘림 (timeit autorange 방식)
+# 짧은 케이스도 타이머 해상도/스케줄링 잡음보다 충분히 길게 측정
+MIN_ROUND_SECONDS = 0.2
+
+
+def _time_calls(func: Callable[[], Any], number: int) -> float:
+    # timeit과 같이 측정 중에는 GC를 꺼서 수집 시점에 따른 편차 제거
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        return time.perf_counter() - started
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def calibrate(func: Callable[[], Any], number: int) -> int:
+    """라운드가 MIN_ROUND_SECONDS 이상 걸리는 호출 횟수 (number부터 두 배씩)"""
+    while _time_calls(func, number) < MIN_ROUND_SECONDS:
+        number *= 2
+    return number
+
+
+def reference_workload() -> int:
+    """머신 속도 보정용 고정 작업 (순수 파이썬 dict/문자열 연산)"""
+    table = {}
+    for i in range(20000):
+        table[str(i)] = i * i
+    return sum(table.values())
+
+
+class Reference:
+    """
+    케이스의 각 라운드 직후 기준 작업을 같은 시간만큼 실행해 그 비율(relative)을 기록
+    공유 머신에서 전체 속도가 출렁여도 케이스와 기준 작업이 함께 느려지므로 비율은 유지됨
+    """
+
+    def __init__(self):
+        self.number = calibrate(reference_workload, 1)
+
+    def measure(self) -> float:
+        return _time_calls(reference_workload, self.number) / self.number
+
+
+def run_case(
+    case: BenchmarkCase, rounds: int, reference: Reference
+) -> Dict[str, float]:
+    """
+    케이스를 rounds번 반복 측정해 1회 호출당 소요 시간(초) 통계 반환
+    relative: 라운드별 (케이스 시간 / 기준 작업 시간)의 중앙값
+    """
+    func = case.setup()
+    func()  # 워밍업
+    number = calibrate(func, case.number)
+
+    samples: List[float] = []
+    ratios: List[float] = []
+    for _ in range(rounds):
+        sample = _time_calls(func, number) / number
+        samples.append(sample)
+        ratios.append(sample / reference.measure())
+
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "relative": statistics.median(ratios),
+        "rounds": rounds,
+        "number": number,
+    }
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """
+    기준값 대비 threshold 이상 느려진 케이스 이름 (마이크로 케이스는 MICRO_THRESHOLD)
+    기준 작업 대비 비율(relative)로 비교 (없는 기준값은 최솟값 min으로 비교)
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            print(f"{name:32s} {_format(result['min']):>12s}   (no baseline)")
+            continue
+
+        key = "relative" if "relative" in base else "min"
+        ratio = result[key] / base[key] - 1
+        limit = threshold
+        if base["min"] < MICRO_CASE_SECONDS:
+            limit = max(threshold, MICRO_THRESHOLD)
+        flag = ""
+        if ratio > limit:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < -limit:
+            flag = "  improved"
+        print(
+            f"{name:32s} {_format(result['min']):>12s}  "
+            f"baseline {_format(base['min']):>12s}  {ratio:+7.1%}{flag}"
+        )
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, Any]]):
+    # 다른 케이스만 실행한 경우 기존 기준값은 유지
+    merged = {**load_baseline(path), **results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"python": sys.version.split()[0], "results": merged},
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+        f.write("\n")
+
+
+def _format(seconds: float) -> str:
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} us"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Burger crawler benchmarks")
+    parser.add_argument("--filter", default="", help="run cases whose name contains this")
+    parser.add_argument("--rounds", type=int, default=7)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level=os.environ["LOG_LEVEL"])
+
+    reference = Reference()
+    results = {
+        case.name: run_case(case, args.rounds, reference)
+        for case in CASES
+        if args.filter in case.name
+    }
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results)
+        for name, result in results.items():
+            print(f"{name:32s} {_format(result['min']):>12s}")
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
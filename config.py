@@ -28,13 +28,69 @@ class Settings(BaseSettings):
     # Supabase
     supabase_url: str
     supabase_key: str
+    db_batch_size: int = 500
+    db_retry_attempts: int = 3
+    db_retry_base_delay: float = 0.5
+    db_retry_max_delay: float = 8.0
+    db_circuit_failure_threshold: int = 5
+    db_circuit_reset_seconds: int = 60
+    db_max_concurrency: int = 8
 
     # Selenium
     headless_mode: bool = True
+    driver_pool_size: int = 3
+    driver_max_uses: int = 20
+    driver_max_memory_growth_mb: int = 300
+    nutrition_workers: int = 3
+    block_resources: bool = True
 
     # Crawling
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
     request_delay: int = 1
+    incremental_crawl: bool = True
+    detect_changes: bool = True
+    track_price_history: bool = True
+
+    # Write-ahead spool
+    spool_enabled: bool = True
+    spool_path: str = ".cache/crawl_spool.jsonl"
+    spool_replay_attempts: int = 3
+    spool_retry_backoff_seconds: float = 2.0
+
+    # Local product index
+    use_product_index: bool = True
+    product_index_path: str = ".cache/product_index.sqlite3"
+    product_index_max_age_hours: int = 24
+    http_cache_enabled: bool = True
+    http_cache_dir: str = ".cache/http"
+    http_cache_ttl_hours: int = 24
+    http_cache_max_mb: int = 50
+
+    # Concurrency (crawl_mode: sequential | concurrent | async)
+    crawl_mode: str = "concurrent"
+    max_crawl_workers: int = 4
+    crawl_timeout_seconds: int = 900
+    crawl_run_timeout_seconds: int = 3600
+    async_max_connections: int = 20
+    async_per_host_limit: int = 4
+
+    # Offline record/replay
+    fixtures_dir: str = "fixtures"
+
+    # Load test (local PostgREST stand-in)
+    load_test_latency_ms: float = 0.0
+    load_test_jitter_ms: float = 0.0
+    load_test_error_rate: float = 0.0
+    load_test_lost_write_rate: float = 0.0
+    load_test_seed: int = 42
+    load_test_brand_count: int = 20
+    load_test_collision_rate: float = 0.02
+    load_test_chunk_size: int = 10000
+
+    # Metrics
+    metrics_enabled: bool = True
+    metrics_report_path: str = "logs/run_report.json"
+    metrics_prometheus_path: str = "logs/burger_crawler.prom"
 
     # Logging
     log_level: str = "INFO"
@@ -14,6 +14,8 @@ load_dotenv()
 from src.scheduler import CrawlerScheduler
 from src.crawlers import get_crawler, get_available_brands
 from src.database import SupabaseManager
+from src.replay import record_brand, replay_brand
+from src.load_test import run_load_test
 from src.__mock__.dummy_data import create_dummy_burger_data, get_brand_dummy_data
 from config import settings
 
@@ -163,6 +165,32 @@ def main():
         elif command == "run-once":
             scheduler = CrawlerScheduler()
             scheduler.run_all_crawlers()
+        elif command == "replay-spool":
+            scheduler = CrawlerScheduler()
+            stats = scheduler.replay_spool()
+            logger.info(
+                f"Replayed {stats['replayed']} spooled items, {stats['failed']} still pending"
+            )
+        elif command == "rebuild-index":
+            scheduler = CrawlerScheduler()
+            rebuilt = scheduler.rebuild_product_index()
+            logger.info(f"Rebuilt product index for {rebuilt} brands")
+        elif command == "record":
+            if len(sys.argv) > 2:
+                record_brand(sys.argv[2])
+            else:
+                logger.error("Please specify a brand")
+                logger.info("Available brands: " + ", ".join(get_available_brands()))
+        elif command == "replay":
+            if len(sys.argv) > 2:
+                rounds = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+                replay_brand(sys.argv[2], rounds)
+            else:
+                logger.error("Please specify a brand")
+                logger.info("Available brands: " + ", ".join(get_available_brands()))
+        elif command == "load-test":
+            count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+            run_load_test(count)
         elif command == "scheduler":
             scheduler = CrawlerScheduler()
             scheduler.start_scheduler()
@@ -187,8 +215,13 @@ Commands:
   scheduler       - Start the scheduler (default)
   run-once        - Run all crawlers once
   crawl <brand>   - Run single brand crawler once and save to DB
+  replay-spool    - Save crawl results left in the spool by a failed DB write
+  rebuild-index   - Rebuild local product index from the database
+  record <brand>  - Crawl live site once and record fixtures (no DB save)
+  replay <brand> [rounds] - Replay recorded fixtures offline and report throughput
   test-db         - Test database connection
   test-dummy      - Test with dummy data
+  load-test [count] - Load-test DB writes against a local PostgREST stand-in (default 10000)
   test-crawler <brand>  - Test specific crawler (no DB save)
   
 Available brands: """
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import random
 
@@ -45,7 +45,7 @@ def create_dummy_burger_data() -> List[Dict[str, Any]]:
             'category': random.choice(['버거', '치킨버거', '프리미엄버거']),
             'shop_url': f"{brand['url']}/menu/burger_{i+1}",
             'released_at': datetime.now(),
-            'patty': random.choice(['beef', 'chicken', 'pork', 'undefined']),
+            'patty': random.choice(['meat', 'chicken', 'shrimp', 'undefined']),
             'brand_description': f"{brand['name']} 브랜드 설명",
             'brand_logo_url': f"{brand['url']}/logo.png",
             'brand_website_url': brand['url'],
@@ -63,8 +63,12 @@ def create_dummy_burger_data() -> List[Dict[str, Any]]:
     return dummy_data
 
 
-def get_brand_dummy_data(brand_name: str, count: int = 5) -> List[Dict[str, Any]]:
-    """특정 브랜드의 더미 데이터 생성"""
+def get_brand_dummy_data(brand_name: str, count: int = 5, seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    특정 브랜드의 더미 데이터 생성
+    메뉴 수보다 많이 요청하면 메뉴명에 번호를 붙여 반복, seed를 주면 항상 같은 값 생성
+    대규모 데이터는 synthetic_catalog.SyntheticCatalog 사용
+    """
     
     brand_info = {
         'lotteria': {'name': '롯데리아', 'name_eng': 'lotteria', 'url': 'https://www.lotteria.com'},
@@ -88,31 +92,38 @@ def get_brand_dummy_data(brand_name: str, count: int = 5) -> List[Dict[str, Any]
     
     dummy_data = []
     menus = brand_menus.get(brand_name, ['버거1', '버거2', '버거3', '버거4', '버거5'])
+    rng = random.Random(seed)
     
-    for i in range(min(count, len(menus))):
+    for i in range(count):
+        menu = menus[i % len(menus)]
+        if i >= len(menus):
+            menu = f"{menu} {i // len(menus) + 1}"
+        
         burger_data = {
-            'name': menus[i],
+            'name': menu,
             'brand_name': brand['name'],
             'brand_name_eng': brand['name_eng'],
-            'description': f"{brand['name']}의 대표 메뉴 {menus[i]}",
-            'description_full': f"{menus[i]}는 {brand['name']}에서 가장 인기 있는 메뉴 중 하나입니다.",
-            'image_url': f"{brand['url']}/images/{menus[i].lower()}.jpg",
-            'price': random.randint(4000, 12000),
-            'set_price': random.randint(6000, 15000),
+            'description': f"{brand['name']}의 대표 메뉴 {menu}",
+            'description_full': f"{menu}는 {brand['name']}에서 가장 인기 있는 메뉴 중 하나입니다.",
+            'image_url': f"{brand['url']}/images/{menu.lower()}.jpg",
+            'price': rng.randint(4000, 12000),
+            'set_price': rng.randint(6000, 15000),
             'available': True,
             'category': '치킨버거' if 'kfc' in brand_name else '버거',
-            'shop_url': f"{brand['url']}/menu/{menus[i].lower()}",
+            'shop_url': f"{brand['url']}/menu/{menu.lower()}",
             'released_at': datetime.now(),
-            'patty': 'chicken' if 'kfc' in brand_name else random.choice(['beef', 'chicken', 'pork']),
+            'patty': 'chicken' if 'kfc' in brand_name else rng.choice(['meat', 'chicken', 'shrimp']),
             'brand_description': f"{brand['name']} 브랜드",
             'brand_logo_url': f"{brand['url']}/logo.png",
             'brand_website_url': brand['url'],
+            # 크롤링 실패 시 대체 데이터 - 변경 감지/가격 이력에서 제외
+            'is_dummy': True,
             'nutrition': {
-                'calories': random.randint(300, 800),
-                'fat': round(random.uniform(10.0, 40.0), 1),
-                'protein': round(random.uniform(15.0, 35.0), 1),
-                'sugar': round(random.uniform(2.0, 15.0), 1),
-                'sodium': random.randint(500, 1500)
+                'calories': rng.randint(300, 800),
+                'fat': round(rng.uniform(10.0, 40.0), 1),
+                'protein': round(rng.uniform(15.0, 35.0), 1),
+                'sugar': round(rng.uniform(2.0, 15.0), 1),
+                'sodium': rng.randint(500, 1500)
             }
         }
         
@@ -0,0 +1,560 @@
+"""
+로컬 PostgREST 대체 서버 - SupabaseManager가 사용하는 테이블 요청을 메모리에서 처리
+벤치마크와 부하 테스트에서 실제 Supabase 프로젝트 대신 사용
+지연 시간과 오류(일시적 오류, 응답 유실)를 주입할 수 있다
+"""
+
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# SupabaseManager(url=..., key=...)에 넘길 키 (JWT 형식 검사만 통과하면 됨)
+LOCAL_KEY = "local.postgrest.stand-in"
+
+REST_PREFIX = "/rest/v1/"
+
+# Prisma 스키마의 enum Patty
+PATTY_VALUES = ["meat", "shrimp", "chicken", "squid", "vegan", "undefined"]
+
+# README의 DB 스키마 중 저장 경로에서 쓰는 제약 조건만 반영 (enum 값 포함)
+TABLES: Dict[str, Dict[str, Any]] = {
+    "Brand": {
+        "primary_key": "id",
+        "autoincrement": True,
+        "unique": ["name", "name_eng"],
+        "indexed": [],
+        "timestamp": "created_at",
+        "foreign_keys": {},
+        "enums": {},
+    },
+    "Product": {
+        "primary_key": "product_id",
+        "autoincrement": True,
+        "unique": [],
+        "indexed": ["brand_name"],
+        "timestamp": "created_at",
+        "foreign_keys": {"brand_name": ("Brand", "name")},
+        "enums": {"patty": ("Patty", PATTY_VALUES)},
+    },
+    "Nutrition": {
+        "primary_key": "product_id",
+        "autoincrement": False,
+        "unique": [],
+        "indexed": [],
+        "timestamp": "created_at",
+        "foreign_keys": {"product_id": ("Product", "product_id")},
+        "enums": {},
+    },
+    "PriceHistory": {
+        "primary_key": "id",
+        "autoincrement": True,
+        "unique": [],
+        "indexed": ["product_id"],
+        "timestamp": "observed_at",
+        "foreign_keys": {"product_id": ("Product", "product_id")},
+        "enums": {},
+    },
+}
+
+
+class PostgrestError(Exception):
+    """PostgREST 오류 응답 (status, SQLSTATE/PGRST 코드)"""
+
+    def __init__(self, status: int, code: str, message: str):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+    def body(self) -> Dict[str, Any]:
+        return {"code": self.code, "message": self.message, "details": None, "hint": None}
+
+
+class Table:
+    """기본 키 순서로 행을 보관하고 unique/보조 인덱스를 유지하는 메모리 테이블"""
+
+    def __init__(self, name: str, schema: Dict[str, Any]):
+        self.name = name
+        self.primary_key: str = schema["primary_key"]
+        self.autoincrement: bool = schema["autoincrement"]
+        self.unique: List[str] = schema["unique"]
+        self.indexed: List[str] = schema["indexed"]
+        self.timestamp: Optional[str] = schema["timestamp"]
+        self.foreign_keys: Dict[str, Tuple[str, str]] = schema["foreign_keys"]
+        # 컬럼 -> (enum 타입명, 허용 값)
+        self.enums: Dict[str, Tuple[str, List[str]]] = schema["enums"]
+        self.reset()
+
+    def reset(self):
+        # 기본 키 -> 행 (삽입 순서 유지)
+        self.rows: Dict[Any, Dict[str, Any]] = {}
+        self.sequence = 0
+        # 컬럼 -> {값: 기본 키}
+        self.unique_index: Dict[str, Dict[Any, Any]] = {
+            column: {} for column in self.unique
+        }
+        # 컬럼 -> {문자열 값: {기본 키}}
+        self.secondary_index: Dict[str, Dict[str, Dict[Any, None]]] = {
+            column: {} for column in self.indexed
+        }
+
+    def put(self, row: Dict[str, Any]):
+        key = row[self.primary_key]
+        old = self.rows.get(key)
+        if old is not None:
+            self._unindex(key, old)
+        self.rows[key] = row
+        for column in self.unique:
+            if row.get(column) is not None:
+                self.unique_index[column][row[column]] = key
+        for column in self.indexed:
+            self.secondary_index[column].setdefault(_format(row.get(column)), {})[
+                key
+            ] = None
+
+    def candidates(self, filters: List[Tuple[str, str, str]]) -> List[Dict[str, Any]]:
+        """인덱스를 쓸 수 있는 필터로 후보 행을 먼저 좁힘 (없으면 전체)"""
+        for column, operator, operand in filters:
+            if column == self.primary_key and operator in ("eq", "in"):
+                keys = _split_list(operand) if operator == "in" else [operand]
+                rows = (self.rows.get(_coerce_key(_unquote(key))) for key in keys)
+                return [row for row in rows if row is not None]
+            if column in self.secondary_index and operator in ("eq", "in"):
+                keys = _split_list(operand) if operator == "in" else [operand]
+                rows = []
+                for key in keys:
+                    rows.extend(
+                        self.rows[pk]
+                        for pk in self.secondary_index[column].get(_unquote(key), {})
+                    )
+                return rows
+        return list(self.rows.values())
+
+    def _unindex(self, key: Any, row: Dict[str, Any]):
+        for column in self.unique:
+            if self.unique_index[column].get(row.get(column)) == key:
+                del self.unique_index[column][row[column]]
+        for column in self.indexed:
+            self.secondary_index[column].get(_format(row.get(column)), {}).pop(key, None)
+
+
+class LocalPostgrest:
+    """
+    127.0.0.1의 임시 포트에서 PostgREST 형식의 요청을 처리하는 메모리 DB
+    select(eq/neq/gt/gte/lt/lte/in/is 필터, order, limit/offset, Range 헤더),
+    insert와 upsert(on_conflict) 지원
+
+    latency: 요청마다 추가할 지연(초), jitter: 지연에 더할 최대 무작위 값(초)
+    error_rate: 처리 전에 503(PGRST000)으로 실패시킬 요청 비율
+    lost_write_rate: 쓰기를 반영한 뒤 응답만 503으로 실패시킬 비율 (응답 유실)
+    shuffle_returning: 쓰기 응답 행 순서를 섞음 (PostgREST는 입력 순서를 보장하지 않음)
+    seed: 지연/오류 주입 난수 시드
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        lost_write_rate: float = 0.0,
+        shuffle_returning: bool = False,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.lost_write_rate = lost_write_rate
+        self.shuffle_returning = shuffle_returning
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.tables: Dict[str, Table] = {
+            name: Table(name, schema) for name, schema in TABLES.items()
+        }
+        self._stats: Dict[str, int] = {
+            "requests": 0,
+            "reads": 0,
+            "writes": 0,
+            "rows_written": 0,
+            "injected_errors": 0,
+            "lost_writes": 0,
+            "constraint_errors": 0,
+        }
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """SupabaseManager에 넘길 프로젝트 URL"""
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def __enter__(self) -> "LocalPostgrest":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def reset(self, *tables: str):
+        """테이블 비우기 (이름을 주지 않으면 모든 테이블)"""
+        with self._lock:
+            for name in tables or self.tables:
+                self.tables[name].reset()
+
+    def rows(self, table: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self.tables[table].rows.values()]
+
+    def stats(self) -> Dict[str, int]:
+        """요청/쓰기/주입된 오류 횟수와 테이블별 행 수"""
+        with self._lock:
+            stats = dict(self._stats)
+            for name, table in self.tables.items():
+                stats[f"rows_{name}"] = len(table.rows)
+        return stats
+
+    def select(
+        self,
+        table: str,
+        params: List[Tuple[str, str]],
+        row_range: Optional[Tuple[int, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        columns = "*"
+        order: Optional[str] = None
+        limit: Optional[int] = None
+        offset = 0
+        filters = []
+        for name, value in params:
+            if name == "select":
+                columns = value
+            elif name == "order":
+                order = value
+            elif name == "limit":
+                limit = int(value)
+            elif name == "offset":
+                offset = int(value)
+            else:
+                operator, _, operand = value.partition(".")
+                filters.append((name, operator, operand))
+
+        with self._lock:
+            rows = [
+                row
+                for row in self.tables[table].candidates(filters)
+                if _matches(row, filters)
+            ]
+        if order:
+            for part in reversed(order.split(",")):
+                column, _, direction = part.strip().partition(".")
+                rows.sort(
+                    key=lambda row: _sort_key(row.get(column)),
+                    reverse=direction.startswith("desc"),
+                )
+        if row_range:
+            rows = rows[row_range[0] : row_range[1] + 1]
+        if offset:
+            rows = rows[offset:]
+        if limit is not None:
+            rows = rows[:limit]
+        return [_project(row, columns) for row in rows]
+
+    def insert(
+        self, table: str, payload: Any, on_conflict: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        다중 행 insert (on_conflict가 있으면 해당 컬럼 기준 upsert)
+        PostgREST처럼 한 요청은 하나의 트랜잭션 - 제약 조건 위반 시 아무 행도 반영하지 않음
+        """
+        rows = payload if isinstance(payload, list) else [payload]
+        with self._lock:
+            target = self.tables[table]
+            now = datetime.now(timezone.utc).isoformat()
+            staged: List[Dict[str, Any]] = []
+            staged_keys = set()
+            sequence = target.sequence
+            for row in rows:
+                existing_key = self._conflict_key(target, row, on_conflict)
+                if existing_key is not None:
+                    # upsert - 요청에 없는 컬럼은 기존 값 유지
+                    row = {**target.rows[existing_key], **row}
+                    row[target.primary_key] = existing_key
+                else:
+                    row = dict(row)
+                    if target.autoincrement and row.get(target.primary_key) is None:
+                        sequence += 1
+                        row[target.primary_key] = sequence
+                    if target.timestamp and row.get(target.timestamp) is None:
+                        row[target.timestamp] = now
+                    self._check_unique(target, row, staged_keys)
+                self._check_enums(target, row)
+                self._check_foreign_keys(target, row)
+                staged_keys.add(row[target.primary_key])
+                staged.append(row)
+
+            target.sequence = sequence
+            for row in staged:
+                target.put(row)
+            self._stats["rows_written"] += len(staged)
+            returning = [dict(row) for row in staged]
+            if self.shuffle_returning:
+                self._random.shuffle(returning)
+            return returning
+
+    def _conflict_key(
+        self, target: Table, row: Dict[str, Any], on_conflict: Optional[str]
+    ) -> Optional[Any]:
+        if on_conflict is None:
+            return None
+        value = row.get(on_conflict)
+        if on_conflict == target.primary_key:
+            return value if value in target.rows else None
+        return target.unique_index.get(on_conflict, {}).get(value)
+
+    def _check_unique(self, target: Table, row: Dict[str, Any], staged_keys: set):
+        key = row[target.primary_key]
+        if key in target.rows or key in staged_keys:
+            raise self._constraint_error(
+                "23505",
+                f'duplicate key value violates unique constraint "{target.name}_pkey"',
+            )
+        for column in target.unique:
+            if row.get(column) in target.unique_index[column]:
+                raise self._constraint_error(
+                    "23505",
+                    f'duplicate key value violates unique constraint "{target.name}_{column}_key"',
+                )
+
+    def _check_enums(self, target: Table, row: Dict[str, Any]):
+        for column, (type_name, values) in target.enums.items():
+            value = row.get(column)
+            if value is not None and value not in values:
+                self._stats["constraint_errors"] += 1
+                raise PostgrestError(
+                    400,
+                    "22P02",
+                    f'invalid input value for enum "{type_name}": "{value}"',
+                )
+
+    def _check_foreign_keys(self, target: Table, row: Dict[str, Any]):
+        for column, (table, referenced) in target.foreign_keys.items():
+            value = row.get(column)
+            if value is None:
+                continue
+            parent = self.tables[table]
+            if referenced == parent.primary_key:
+                exists = value in parent.rows
+            else:
+                exists = value in parent.unique_index[referenced]
+            if not exists:
+                raise self._constraint_error(
+                    "23503",
+                    f'insert or update on table "{target.name}" violates foreign key constraint "{target.name}_{column}_fkey"',
+                )
+
+    def _constraint_error(self, code: str, message: str) -> PostgrestError:
+        self._stats["constraint_errors"] += 1
+        return PostgrestError(409, code, message)
+
+    def _draw(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+
+    def _delay(self) -> float:
+        if self.jitter <= 0:
+            return self.latency
+        with self._lock:
+            return self.latency + self._random.uniform(0, self.jitter)
+
+    def _count(self, name: str):
+        with self._lock:
+            self._stats[name] += 1
+
+    def _handler(self):
+        db = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # 헤더와 본문을 따로 쓰므로 Nagle 지연 방지
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                self._handle(write=False)
+
+            def do_POST(self):
+                self._handle(write=True)
+
+            def _handle(self, write: bool):
+                db._count("requests")
+                # keep-alive 연결이므로 GET 요청의 본문({})도 항상 읽어서 비움
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+
+                delay = db._delay()
+                if delay > 0:
+                    time.sleep(delay)
+
+                parts = urlsplit(self.path)
+                table = parts.path[len(REST_PREFIX) :]
+                if not parts.path.startswith(REST_PREFIX) or table not in db.tables:
+                    self._reply_error(
+                        PostgrestError(404, "42P01", f'relation "{table}" does not exist')
+                    )
+                    return
+                if db._draw(db.error_rate):
+                    db._count("injected_errors")
+                    self._reply_error(
+                        PostgrestError(503, "PGRST000", "Injected transient failure")
+                    )
+                    return
+
+                params = parse_qsl(parts.query, keep_blank_values=True)
+                try:
+                    if write:
+                        db._count("writes")
+                        rows = db.insert(
+                            table,
+                            json.loads(body) if body else [],
+                            self._on_conflict(table, params),
+                        )
+                        if db._draw(db.lost_write_rate):
+                            # 쓰기는 반영되었지만 클라이언트는 실패로 받음
+                            db._count("lost_writes")
+                            raise PostgrestError(503, "PGRST000", "Injected lost response")
+                        minimal = "return=minimal" in self.headers.get("Prefer", "")
+                        self._reply(201, None if minimal else rows)
+                    else:
+                        db._count("reads")
+                        self._reply(200, db.select(table, params, self._range()))
+                except PostgrestError as e:
+                    self._reply_error(e)
+
+            def _on_conflict(
+                self, table: str, params: List[Tuple[str, str]]
+            ) -> Optional[str]:
+                if "resolution=merge-duplicates" not in self.headers.get("Prefer", ""):
+                    return None
+                return dict(params).get("on_conflict") or TABLES[table]["primary_key"]
+
+            def _range(self) -> Optional[Tuple[int, int]]:
+                value = self.headers.get("Range")
+                if not value:
+                    return None
+                start, _, end = value.partition("-")
+                return int(start), int(end)
+
+            def _reply_error(self, error: PostgrestError):
+                self._reply(error.status, error.body())
+
+            def _reply(self, status: int, body: Any):
+                content = b"" if body is None else json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def _matches(row: Dict[str, Any], filters: List[Tuple[str, str, str]]) -> bool:
+    for column, operator, operand in filters:
+        value = row.get(column)
+        if operator == "eq":
+            if _format(value) != _unquote(operand):
+                return False
+        elif operator == "neq":
+            if _format(value) == _unquote(operand):
+                return False
+        elif operator == "in":
+            if _format(value) not in {_unquote(key) for key in _split_list(operand)}:
+                return False
+        elif operator == "is":
+            if _format(value) != operand:
+                return False
+        elif operator in ("gt", "gte", "lt", "lte"):
+            if value is None:
+                return False
+            left, right = _comparable(value, _unquote(operand))
+            if operator == "gt" and not left > right:
+                return False
+            if operator == "gte" and not left >= right:
+                return False
+            if operator == "lt" and not left < right:
+                return False
+            if operator == "lte" and not left <= right:
+                return False
+    return True
+
+
+def _format(value: Any) -> str:
+    """쿼리 문자열 값과 비교할 수 있도록 문자열로 변환"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1]
+    return value
+
+
+def _split_list(operand: str) -> List[str]:
+    """in 필터 값 (1,2,"a,b") -> ['1', '2', '"a,b"']"""
+    inner = operand[1:-1] if operand.startswith("(") else operand
+    values, current, quoted = [], "", False
+    for char in inner:
+        if char == '"':
+            quoted = not quoted
+        if char == "," and not quoted:
+            values.append(current)
+            current = ""
+        else:
+            current += char
+    if inner:
+        values.append(current)
+    return values
+
+
+def _coerce_key(value: str) -> Any:
+    return int(value) if value.lstrip("-").isdigit() else value
+
+
+def _comparable(value: Any, operand: str) -> Tuple[Any, Any]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value, float(operand)
+    return str(value), operand
+
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    # None은 뒤로
+    return (value is None, value if value is not None else 0)
+
+
+def _project(row: Dict[str, Any], columns: str) -> Dict[str, Any]:
+    if columns == "*":
+        return dict(row)
+    return {
+        column.strip(): row.get(column.strip()) for column in columns.split(",")
+    }
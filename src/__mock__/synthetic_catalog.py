@@ -0,0 +1,233 @@
+"""
+시드 기반 합성 카탈로그 - 수백만 개 규모의 버거 데이터를 결정적으로, 청크 단위로 지연 생성
+중복 제거/변경 감지/일괄 삽입 경로를 실제 메뉴보다 훨씬 큰 규모로 시험하기 위한 데이터
+
+각 값은 (시드, 제품 번호, 필드) 해시로 계산하므로 순서와 무관하게 같은 결과가 나오고,
+어느 청크든 앞 청크를 만들지 않고 바로 생성할 수 있다
+청크 단위로 배열을 한 번에 만드는 벡터화된 경로가 아니므로 생성 비용은 제품 수에 비례한다
+"""
+
+from bisect import bisect
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional
+
+_MASK = (1 << 64) - 1
+_FULLWIDTH_DIGITS = str.maketrans("0123456789", "０１２３４５６７８９")
+
+# 필드별 해시 구분값
+_SALT_BRAND = 1
+_SALT_COLLISION = 2
+_SALT_COLLISION_TARGET = 3
+_SALT_VARIANT = 4
+_SALT_NAME = 5
+_SALT_PRICE = 6
+_SALT_SET_PRICE = 7
+_SALT_CATEGORY = 8
+_SALT_PATTY = 9
+_SALT_RELEASED = 10
+_SALT_NUTRITION = 11
+_SALT_PRICE_CHANGE = 12
+_SALT_AVAILABILITY = 13
+
+# 실제 크롤링 대상 브랜드 (나머지는 합성 브랜드)
+BASE_BRANDS = [
+    {"name": "롯데리아", "name_eng": "lotteria", "url": "https://www.lotteria.com"},
+    {"name": "버거킹", "name_eng": "burger_king", "url": "https://www.burgerking.co.kr"},
+    {"name": "노브랜드 버거", "name_eng": "nobrand_burger", "url": "https://www.nobrand.co.kr"},
+    {"name": "KFC", "name_eng": "kfc", "url": "https://www.kfc.co.kr"},
+]
+
+ADJECTIVES = [
+    "스파이시", "더블", "트리플", "클래식", "시그니처", "리얼", "크리스피", "골드",
+    "블랙", "화이트", "갈릭", "허니", "트러플", "할라피뇨", "바베큐", "데리",
+]
+MAINS = [
+    "불고기", "새우", "치킨", "한우", "베이컨", "치즈", "모짜렐라", "통새우",
+    "비프", "포크", "머쉬룸", "아보카도", "에그", "양념치킨", "징거",
+]
+SUFFIXES = ["버거", "버거 디럭스", "킹", "버거 플러스"]
+DESCRIPTIONS = [
+    "맛있는 패티와 신선한 야채가 들어간 버거",
+    "육즙 가득한 고기와 특제 소스의 조화",
+    "바삭한 치킨과 크리미한 마요네즈",
+    "진한 치즈와 부드러운 빵의 완벽한 조합",
+    "매콤달콤한 소스가 일품인 버거",
+]
+CATEGORIES = ["버거", "버거", "버거", "치킨버거", "프리미엄버거"]
+# DB enum Patty 값 (중복으로 비중 조절)
+PATTIES = [
+    "meat", "meat", "meat", "chicken", "chicken", "shrimp", "squid", "vegan", "undefined",
+]
+
+RELEASED_FROM = datetime(2020, 1, 1)
+
+
+def _mix(seed: int, *values: int) -> int:
+    """splitmix64 기반 해시 - (시드, 값...)마다 고르게 분포된 64비트 정수"""
+    z = seed & _MASK
+    for value in values:
+        z = (z ^ (value & _MASK)) + 0x9E3779B97F4A7C15 & _MASK
+        z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & _MASK
+        z = (z ^ (z >> 27)) * 0x94D049BB133111EB & _MASK
+        z ^= z >> 31
+    return z
+
+
+def _uniform(seed: int, *values: int) -> float:
+    """[0, 1) 균등 분포 값"""
+    return _mix(seed, *values) / (_MASK + 1)
+
+
+class SyntheticCatalog:
+    """
+    시드 기반 합성 카탈로그
+
+    brand_count: 브랜드 수 (앞 4개는 실제 브랜드, 제품 수는 순위에 반비례)
+    collision_rate: 앞서 나온 제품을 이름 표기만 바꿔 다시 내보낼 비율 (중복 제거 대상)
+    price_change_rate: 리비전마다 가격이 바뀌는 제품 비율
+    availability_change_rate: 리비전마다 판매 여부가 바뀌는 제품 비율
+    missing_nutrition_rate: 영양정보가 없는 제품 비율 (그중 일부는 필드 일부만 누락)
+    """
+
+    def __init__(
+        self,
+        seed: int = 42,
+        brand_count: int = 20,
+        collision_rate: float = 0.02,
+        price_change_rate: float = 0.1,
+        availability_change_rate: float = 0.01,
+        missing_nutrition_rate: float = 0.3,
+    ):
+        self.seed = seed
+        self.collision_rate = collision_rate
+        self.price_change_rate = price_change_rate
+        self.availability_change_rate = availability_change_rate
+        self.missing_nutrition_rate = missing_nutrition_rate
+        self.brands = self._build_brands(max(1, brand_count))
+        self._brand_weights = list(
+            accumulate(1 / (rank + 1) for rank in range(len(self.brands)))
+        )
+
+    def items(
+        self, count: int, revision: int = 0, chunk_size: int = 10000
+    ) -> Iterator[Dict[str, Any]]:
+        """count개 제품을 하나씩 지연 생성 (revision마다 가격/판매 여부 일부 변경)"""
+        for chunk in self.chunks(count, revision, chunk_size):
+            yield from chunk
+
+    def chunks(
+        self, count: int, revision: int = 0, chunk_size: int = 10000
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """chunk_size개씩 묶어 생성 (청크마다 독립적으로 계산)"""
+        for start in range(0, count, max(1, chunk_size)):
+            yield self.chunk(start, min(count, start + chunk_size), revision)
+
+    def chunk(self, start: int, stop: int, revision: int = 0) -> List[Dict[str, Any]]:
+        """제품 번호 start ~ stop-1 생성"""
+        return [self.item(number, revision) for number in range(start, stop)]
+
+    def item(self, number: int, revision: int = 0) -> Dict[str, Any]:
+        """number번째 제품 (같은 시드/번호/리비전이면 항상 같은 값)"""
+        product = self._canonical(number)
+        item = self._product(product, revision)
+        if product != number:
+            # 다시 나온 제품 - 내용은 같고 이름 표기만 다름 (정규화하면 같은 이름)
+            item["name"] = self._name_variant(item["name"], number)
+        return item
+
+    def _canonical(self, number: int) -> int:
+        """중복으로 다시 나온 제품이면 원래 제품 번호, 아니면 자기 번호"""
+        while number > 0 and _uniform(self.seed, _SALT_COLLISION, number) < self.collision_rate:
+            number = _mix(self.seed, _SALT_COLLISION_TARGET, number) % number
+        return number
+
+    def _product(self, product: int, revision: int) -> Dict[str, Any]:
+        seed = self.seed
+        brand = self.brands[
+            bisect(
+                self._brand_weights,
+                _uniform(seed, _SALT_BRAND, product) * self._brand_weights[-1],
+            )
+        ]
+        name_hash = _mix(seed, _SALT_NAME, product)
+        name = (
+            f"{ADJECTIVES[name_hash % len(ADJECTIVES)]} "
+            f"{MAINS[(name_hash >> 8) % len(MAINS)]}"
+            f"{SUFFIXES[(name_hash >> 16) % len(SUFFIXES)]} No.{product + 1}"
+        )
+
+        price = 3000 + _mix(seed, _SALT_PRICE, product) % 121 * 100
+        available = True
+        for rev in range(1, revision + 1):
+            if _uniform(seed, _SALT_PRICE_CHANGE, product, rev) < self.price_change_rate:
+                price += 100 * (1 + _mix(seed, _SALT_PRICE_CHANGE, rev, product) % 5)
+            if (
+                _uniform(seed, _SALT_AVAILABILITY, product, rev)
+                < self.availability_change_rate
+            ):
+                available = not available
+
+        patty_hash = _mix(seed, _SALT_PATTY, product)
+        return {
+            "name": name,
+            "brand_name": brand["name"],
+            "brand_name_eng": brand["name_eng"],
+            "description": DESCRIPTIONS[name_hash % len(DESCRIPTIONS)],
+            "description_full": (
+                f"{DESCRIPTIONS[(name_hash >> 24) % len(DESCRIPTIONS)]} "
+                "더 자세한 설명과 함께 맛있는 재료들이 풍부하게 들어있습니다."
+            ),
+            "image_url": f"{brand['url']}/images/burger_{product + 1}.jpg",
+            "price": price,
+            "set_price": price + 2000 + _mix(seed, _SALT_SET_PRICE, product) % 11 * 100,
+            "available": available,
+            "category": CATEGORIES[_mix(seed, _SALT_CATEGORY, product) % len(CATEGORIES)],
+            "shop_url": f"{brand['url']}/menu/burger_{product + 1}",
+            "released_at": RELEASED_FROM
+            + timedelta(days=_mix(seed, _SALT_RELEASED, product) % 2000),
+            "patty": PATTIES[patty_hash % len(PATTIES)],
+            "brand_description": f"{brand['name']} 브랜드 설명",
+            "brand_logo_url": f"{brand['url']}/logo.png",
+            "brand_website_url": brand["url"],
+            "nutrition": self._nutrition(product),
+        }
+
+    def _nutrition(self, product: int) -> Optional[Dict[str, Any]]:
+        roll = _uniform(self.seed, _SALT_NUTRITION, product)
+        if roll < self.missing_nutrition_rate:
+            return None
+
+        values = _mix(self.seed, _SALT_NUTRITION, product, 1)
+        nutrition = {
+            "calories": 300 + values % 501,
+            "fat": round(10 + (values >> 10) % 301 / 10, 1),
+            "protein": round(15 + (values >> 20) % 201 / 10, 1),
+            "sugar": round(2 + (values >> 30) % 131 / 10, 1),
+            "sodium": 500 + (values >> 40) % 1001,
+        }
+        # 영양정보가 있는 제품 중 일부는 일부 필드만 누락
+        if roll < self.missing_nutrition_rate + 0.05:
+            nutrition[("fat", "sugar", "sodium")[(values >> 50) % 3]] = None
+        return nutrition
+
+    def _name_variant(self, name: str, number: int) -> str:
+        variant = _mix(self.seed, _SALT_VARIANT, number) % 3
+        if variant == 0:
+            return f"{name} "
+        if variant == 1:
+            return name.replace(" ", "  ", 1)
+        # 전각 숫자 (NFKC 정규화 시 반각과 같음)
+        return name.translate(_FULLWIDTH_DIGITS)
+
+    def _build_brands(self, count: int) -> List[Dict[str, str]]:
+        brands = BASE_BRANDS[:count]
+        for index in range(len(brands), count):
+            brands.append(
+                {
+                    "name": f"합성버거 {index + 1:03d}",
+                    "name_eng": f"synthetic_{index + 1:03d}",
+                    "url": f"https://synthetic-{index + 1:03d}.example.com",
+                }
+            )
+        return brands
@@ -0,0 +1,295 @@
+"""
+비동기 Supabase 연동 - 비동기 PostgREST 클라이언트와 동시 요청 수 제한
+SupabaseManager와 같은 행 생성 함수와 재시도/서킷 브레이커를 사용
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+from postgrest import AsyncPostgrestClient
+
+from config import settings
+from src.database import (
+    _chunked,
+    build_brand_data,
+    build_nutrition_data,
+    build_product_data,
+    match_inserted_rows,
+    serialize_row,
+)
+from src.resilience import CircuitBreaker, ResilientExecutor, RetryPolicy
+
+
+class AsyncSupabaseManager:
+    """
+    SupabaseManager의 비동기 버전
+    여러 크롤러가 같은 이벤트 루프에서 서로 막지 않고 저장할 수 있도록
+    요청은 동시에 보내되 세마포어로 최대 동시 요청 수를 제한한다
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        key: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        # url/key를 넘기면 설정 대신 사용 (로컬 PostgREST 대체 서버 등)
+        url = url or settings.supabase_url
+        key = key or settings.supabase_key
+        self.client = AsyncPostgrestClient(
+            f"{url}/rest/v1",
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "apikey": key,
+                "Authorization": f"Bearer {key}",
+            },
+        )
+        self._semaphore = asyncio.Semaphore(
+            max(1, max_concurrency or settings.db_max_concurrency)
+        )
+        # 브랜드명 -> 브랜드 ID 캐시
+        self._brand_cache: Dict[str, int] = {}
+        self._brand_lock = asyncio.Lock()
+        self._executor = ResilientExecutor(
+            RetryPolicy(
+                max_attempts=settings.db_retry_attempts,
+                base_delay=settings.db_retry_base_delay,
+                max_delay=settings.db_retry_max_delay,
+            ),
+            CircuitBreaker(
+                failure_threshold=settings.db_circuit_failure_threshold,
+                reset_timeout=settings.db_circuit_reset_seconds,
+            ),
+        )
+        logger.info("Async Supabase client initialized")
+
+    async def __aenter__(self) -> "AsyncSupabaseManager":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def get_or_create_brand(self, brand_data: Dict[str, Any]) -> Optional[int]:
+        """
+        브랜드를 조회하거나 생성 (프로세스 내 캐시 사용)
+        """
+        brand_id = self._brand_cache.get(brand_data["name"])
+        if brand_id:
+            return brand_id
+
+        # 같은 브랜드를 동시에 생성하지 않도록 조회/생성은 락 안에서 수행
+        async with self._brand_lock:
+            try:
+                brand_id = self._brand_cache.get(brand_data["name"])
+                if brand_id:
+                    return brand_id
+
+                result = await self._execute(
+                    self.client.table("Brand")
+                    .select("id")
+                    .eq("name", brand_data["name"])
+                )
+
+                if result.data:
+                    brand_id = result.data[0]["id"]
+                    logger.info(
+                        f"Found existing brand: {brand_data['name']} (ID: {brand_id})"
+                    )
+                else:
+                    # 새 브랜드 생성
+                    result = await self._execute(
+                        self.client.table("Brand").insert(brand_data),
+                        idempotent=False,
+                    )
+                    brand_id = result.data[0]["id"]
+                    logger.info(
+                        f"Created new brand: {brand_data['name']} (ID: {brand_id})"
+                    )
+
+                self._brand_cache[brand_data["name"]] = brand_id
+                return brand_id
+
+            except Exception as e:
+                logger.error(f"Failed to get or create brand: {str(e)}")
+                return None
+
+    async def insert_bulk_burger_data(self, data_list: List[Dict[str, Any]]) -> bool:
+        """
+        여러 햄버거 데이터를 일괄 삽입
+        """
+        product_ids = await self.insert_burger_batch(data_list)
+        return len(product_ids) > 0
+
+    async def insert_burger_batch(
+        self, data_list: List[Dict[str, Any]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        햄버거 데이터를 다중 행 insert로 일괄 삽입 (청크는 동시에 전송)
+        반환값: {data_list 인덱스: product_id} (영양정보 저장에 실패한 항목은 제외)
+        """
+        batch_size = batch_size or settings.db_batch_size
+        product_ids: Dict[int, int] = {}
+
+        try:
+            # 1. 브랜드별로 한 번씩만 확인/생성
+            brand_rows: Dict[str, Dict[str, Any]] = {}
+            for burger_data in data_list:
+                brand_rows.setdefault(
+                    burger_data["brand_name"], build_brand_data(burger_data)
+                )
+            brand_ids = dict(
+                zip(
+                    brand_rows,
+                    await asyncio.gather(
+                        *(self.get_or_create_brand(row) for row in brand_rows.values())
+                    ),
+                )
+            )
+            valid_indexes = [
+                index
+                for index, burger_data in enumerate(data_list)
+                if brand_ids.get(burger_data["brand_name"])
+            ]
+
+            # 2. 제품 다중 행 삽입
+            async def insert_products(chunk: List[int]):
+                rows = [
+                    serialize_row(build_product_data(data_list[index]))
+                    for index in chunk
+                ]
+                try:
+                    result = await self._execute(
+                        self.client.table("Product").insert(rows), idempotent=False
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to insert product chunk: {str(e)}")
+                    return
+                product_ids.update(match_inserted_rows(data_list, chunk, result.data))
+
+            await asyncio.gather(
+                *(
+                    insert_products(chunk)
+                    for chunk in _chunked(valid_indexes, batch_size)
+                )
+            )
+
+            # 3. 영양정보 다중 행 upsert (product_id 기준이라 재시도해도 안전)
+            nutrition_indexes = [
+                index for index in product_ids if data_list[index].get("nutrition")
+            ]
+            failed_indexes: List[int] = []
+
+            async def upsert_nutrition(chunk: List[int]):
+                rows = [
+                    serialize_row(
+                        build_nutrition_data(
+                            product_ids[index], data_list[index]["nutrition"]
+                        )
+                    )
+                    for index in chunk
+                ]
+                try:
+                    await self._execute(
+                        self.client.table("Nutrition").upsert(
+                            rows, on_conflict="product_id"
+                        )
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to upsert nutrition chunk: {str(e)}")
+                    failed_indexes.extend(chunk)
+
+            await asyncio.gather(
+                *(
+                    upsert_nutrition(chunk)
+                    for chunk in _chunked(nutrition_indexes, batch_size)
+                )
+            )
+            # 영양정보가 빠진 제품은 저장 실패로 반환
+            for index in failed_indexes:
+                del product_ids[index]
+
+            logger.info(
+                f"Bulk insert completed: {len(product_ids)}/{len(data_list)} items successful"
+            )
+            return product_ids
+
+        except Exception as e:
+            logger.error(f"Failed to insert bulk data: {str(e)}")
+            return product_ids
+
+    async def get_latest_products(
+        self, limit: int = 10, brand_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        최신 제품 데이터 조회
+        """
+        try:
+            query = (
+                self.client.table("Product")
+                .select("*")
+                .order("created_at", desc=True)
+                .limit(limit)
+            )
+
+            if brand_name:
+                query = query.eq("brand_name", brand_name)
+
+            result = await self._execute(query)
+            return result.data
+        except Exception as e:
+            logger.error(f"Failed to get latest products: {str(e)}")
+            return []
+
+    async def get_product_with_nutrition(
+        self, product_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """
+        제품과 영양정보를 함께 조회 (두 요청을 동시에 전송)
+        """
+        try:
+            product_result, nutrition_result = await asyncio.gather(
+                self._execute(
+                    self.client.table("Product")
+                    .select("*")
+                    .eq("product_id", product_id)
+                ),
+                self._execute(
+                    self.client.table("Nutrition")
+                    .select("*")
+                    .eq("product_id", product_id)
+                ),
+            )
+            if not product_result.data:
+                return None
+
+            product = product_result.data[0]
+            if nutrition_result.data:
+                product["nutrition"] = nutrition_result.data[0]
+
+            return product
+
+        except Exception as e:
+            logger.error(f"Failed to get product with nutrition: {str(e)}")
+            return None
+
+    def get_resilience_metrics(self) -> Dict[str, int]:
+        """DB 호출/재시도/실패/서킷 차단 횟수"""
+        return self._executor.metrics.snapshot()
+
+    async def _execute(self, query: Any, idempotent: bool = True) -> Any:
+        """
+        쿼리 실행 - 동시 요청 수 제한과 재시도/서킷 브레이커 적용
+        """
+
+        async def run():
+            async with self._semaphore:
+                return await query.execute()
+
+        return await self._executor.call_async(
+            run, idempotent=idempotent, label=query.path
+        )
@@ -3,14 +3,19 @@ Burger Crawler - 브랜드별 크롤러 패키지
 """
 
 from .base import BaseCrawler
+from .async_base import AsyncBaseCrawler, AsyncHttpClient, run_in_daemon_thread
 from .lotteria import LotteriaCrawler
 from .burger_king import BurgerKingCrawler
 from .nobrand_burger import NoBrandBurgerCrawler
 from .kfc import KFCCrawler
 from .factory import get_crawler, get_available_brands, register_crawler
+from .driver_pool import DriverPool, get_driver_pool
 
 __all__ = [
     "BaseCrawler",
+    "AsyncBaseCrawler",
+    "AsyncHttpClient",
+    "run_in_daemon_thread",
     "LotteriaCrawler",
     "BurgerKingCrawler",
     "NoBrandBurgerCrawler",
@@ -18,4 +23,6 @@ __all__ = [
     "get_crawler",
     "get_available_brands",
     "register_crawler",
+    "DriverPool",
+    "get_driver_pool",
 ]
@@ -0,0 +1,183 @@
+"""
+비동기 크롤링 엔진 - 풀링된 비동기 HTTP 클라이언트와 비동기 기본 크롤러
+"""
+
+import asyncio
+import threading
+from abc import abstractmethod
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from loguru import logger
+
+from config import settings
+from src.metrics import STAGE_FETCH
+from .base import BaseCrawler
+from .http_cache import CachedResponse, body_hash
+
+
+async def run_in_daemon_thread(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    동기 함수를 데몬 스레드에서 실행하고 결과를 기다림
+    asyncio.to_thread(기본 실행기)와 달리 타임아웃으로 취소된 뒤 남은 스레드를
+    asyncio.run 종료나 프로세스 종료 때 기다리지 않음
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(setter: Callable[[Any], None], value: Any):
+        if not future.done():
+            setter(value)
+
+    def run():
+        try:
+            outcome = (future.set_result, func(*args, **kwargs))
+        except Exception as e:
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(resolve, *outcome)
+        except RuntimeError:
+            pass  # 이벤트 루프가 이미 종료됨
+
+    threading.Thread(target=run, daemon=True).start()
+    return await future
+
+
+class AsyncHttpClient:
+    """연결 풀을 공유하는 비동기 HTTP 클라이언트 (호스트별 동시 요청 수 제한)"""
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        max_connections: Optional[int] = None,
+        per_host_limit: Optional[int] = None,
+        timeout: float = 10,
+    ):
+        max_connections = max_connections or settings.async_max_connections
+        self.per_host_limit = per_host_limit or settings.async_per_host_limit
+        self._client = httpx.AsyncClient(
+            headers=headers,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            timeout=timeout,
+            follow_redirects=True,
+        )
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        # 응답을 받을 때마다 호출 (픽스처 기록 등)
+        self.response_hooks: List[Callable[[httpx.Response], None]] = []
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_semaphores[host]
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        """호스트별 동시 요청 제한을 지키며 GET 요청"""
+        async with self._host_semaphore(url):
+            response = await self._client.get(url, **kwargs)
+        for hook in self.response_hooks:
+            hook(response)
+        return response
+
+    async def fetch_text(self, url: str) -> Optional[str]:
+        """응답 본문 텍스트 반환 (실패 시 None)"""
+        try:
+            response = await self.get(url)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            logger.debug(f"Async fetch failed for {url}: {e}")
+            return None
+
+    async def fetch_many(self, urls: List[str]) -> List[Optional[str]]:
+        """여러 URL을 동시에 요청 (입력 순서대로 반환)"""
+        return await asyncio.gather(*(self.fetch_text(url) for url in urls))
+
+
+class AsyncBaseCrawler(BaseCrawler):
+    """
+    비동기 crawl_async()를 구현하는 크롤러
+    스케줄러는 이벤트 루프에서 crawl_async()를 직접 실행하고,
+    동기 호출자는 기존처럼 crawl()을 사용할 수 있다
+    """
+
+    @abstractmethod
+    async def crawl_async(self) -> List[Dict[str, Any]]:
+        """각 브랜드별 비동기 크롤링 구현"""
+        pass
+
+    def crawl(self) -> List[Dict[str, Any]]:
+        """동기 호출용 진입점 (새 이벤트 루프에서 crawl_async 실행)"""
+        return asyncio.run(self.crawl_async())
+
+    async def fetch_cached(self, client: AsyncHttpClient, url: str) -> CachedResponse:
+        """
+        풀링된 클라이언트로 조건부 GET 요청 (ETag/Last-Modified)
+        304 응답이거나 본문 해시가 캐시와 같으면 changed=False
+        캐시 반영은 결과 저장 후 CachedResponse.commit()으로 수행
+        """
+        with self.span(STAGE_FETCH):
+            response = await self._fetch_cached(client, url)
+        self.count_page()
+        return response
+
+    async def _fetch_cached(self, client: AsyncHttpClient, url: str) -> CachedResponse:
+        cache = self.http_cache
+        meta = cache.load(url) if cache else None
+        headers = cache.conditional_headers(meta) if cache else {}
+
+        response = await client.get(url, headers=headers)
+
+        if response.status_code == 304 and meta:
+            body = cache.read_body(url)
+            if body is not None:
+                logger.info(f"Not modified (304): {url}")
+                return CachedResponse(
+                    url,
+                    body.decode(meta.get("encoding") or "utf-8", errors="replace"),
+                    changed=False,
+                    from_cache=True,
+                    commit=lambda: cache.touch(url),
+                )
+            # 본문이 사라진 경우 조건 없이 다시 요청
+            response = await client.get(url)
+
+        response.raise_for_status()
+
+        if not cache:
+            return CachedResponse(
+                url, response.text, changed=True, from_cache=False, commit=lambda: None
+            )
+
+        changed = not meta or meta.get("body_hash") != body_hash(response.content)
+        if not changed:
+            logger.info(f"Response body unchanged: {url}")
+        return CachedResponse(
+            url,
+            response.text,
+            changed=changed,
+            from_cache=False,
+            commit=lambda: cache.store(
+                url, response.content, response.headers, response.encoding
+            ),
+        )
+
+    def create_http_client(self) -> AsyncHttpClient:
+        """세션과 같은 헤더를 사용하는 비동기 HTTP 클라이언트 생성"""
+        client = AsyncHttpClient(headers=dict(self.session.headers))
+        if self.recorder:
+            client.response_hooks.append(self.recorder.record_httpx_response)
+        return client
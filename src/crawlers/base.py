@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set, Iterable
 import requests
 import re
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime
 from loguru import logger
 
@@ -12,18 +14,119 @@ from selenium.webdriver.edge.options import Options
 from fake_useragent import UserAgent
 
 from config import settings
+from src.metrics import STAGE_DRIVER_STARTUP, get_metrics
+from src.product_index import normalize_name
+from .driver_pool import get_driver_pool
+from .waits import WaitTimings, wait_until
+from .scripts import FieldSpec, TABLE_ROWS_SCRIPT, build_bulk_extract_script
+from .http_cache import CachedResponse, HttpCache
 
 
 class BaseCrawler(ABC):
+    # DevTools Network.setBlockedURLs로 차단할 리소스 (이미지/미디어/폰트/분석/광고)
+    BLOCKED_URL_PATTERNS = [
+        "*.png",
+        "*.jpg",
+        "*.jpeg",
+        "*.gif",
+        "*.webp",
+        "*.svg",
+        "*.ico",
+        "*.mp4",
+        "*.webm",
+        "*.mp3",
+        "*.woff",
+        "*.woff2",
+        "*.ttf",
+        "*.otf",
+        "*.eot",
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*doubleclick.net*",
+        "*googlesyndication.com*",
+        "*googleadservices.com*",
+        "*facebook.net*",
+        "*connect.facebook.com*",
+        "*analytics.tiktok.com*",
+        "*criteo.com*",
+        "*criteo.net*",
+        "*hotjar.com*",
+        "*clarity.ms*",
+        "*wcs.naver.net*",
+    ]
+
+    # 크롤러별로 차단하지 않을 패턴 (BLOCKED_URL_PATTERNS 중 예외)
+    resource_allowlist: List[str] = []
+
+    brand_name = ""
+    # 지표 라벨로도 쓰는 브랜드 키 (get_crawler 키와 같음)
+    brand_name_eng = ""
+
     def __init__(self):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": settings.user_agent})
+        self.wait_timings = WaitTimings()
+        self.http_cache = (
+            HttpCache(
+                settings.http_cache_dir,
+                ttl_seconds=settings.http_cache_ttl_hours * 3600,
+                max_bytes=settings.http_cache_max_mb * 1024 * 1024,
+            )
+            if settings.http_cache_enabled
+            else None
+        )
+        # 메뉴 페이지가 이전 실행과 같아 크롤링을 생략했는지 여부
+        self.menu_unchanged = False
+        # 결과 저장이 끝난 뒤 캐시에 반영할 응답
+        self._pending_cache_commits: List[CachedResponse] = []
+        # 이미 저장된 제품명 - 정규화된 이름 (증분 크롤링 시 상세 페이지 수집 생략)
+        self.known_products: Set[str] = set()
+        # 오프라인 픽스처 기록기 (src.replay.FixtureRecorder)와 재생 여부
+        self.recorder = None
+        self.replay_mode = False
 
     @abstractmethod
     def crawl(self) -> List[Dict[str, Any]]:
         """각 브랜드별 크롤링 구현"""
         pass
 
+    def set_known_products(self, names: Iterable[str]):
+        """증분 크롤링용 기존 제품명 설정"""
+        self.known_products = {normalize_name(name) for name in names}
+
+    def needs_detail(self, burger_data: Dict[str, Any]) -> bool:
+        """
+        상세/영양 정보 수집이 필요한 제품인지 확인
+        이미 저장된 제품은 목록 정보만 유지하고 detail_skipped로 표시
+        """
+        if normalize_name(burger_data["name"]) in self.known_products:
+            burger_data["detail_skipped"] = True
+            return False
+        return True
+
+    def snapshot_dom(self, driver):
+        """기록 모드에서 현재 페이지의 렌더링된 DOM 저장 (안정된 시점에 호출)"""
+        if self.recorder:
+            self.recorder.record_dom(driver.current_url, driver.page_source)
+
+    def defer_cache_commit(self, response: CachedResponse):
+        """크롤링 결과가 저장된 뒤 캐시에 반영하도록 예약"""
+        self._pending_cache_commits.append(response)
+
+    def commit_http_cache(self):
+        """예약된 응답을 캐시에 반영 (결과 저장 성공 후 호출)"""
+        for response in self._pending_cache_commits:
+            response.commit()
+        self._pending_cache_commits = []
+
+    def span(self, stage: str, product: Optional[str] = None):
+        """이 크롤러 브랜드의 단계별 소요 시간 기록 (with 블록)"""
+        return get_metrics().span(stage, self.brand_name_eng, product)
+
+    def count_page(self, count: int = 1):
+        """불러온 페이지 수 기록"""
+        get_metrics().increment("pages_loaded", count, self.brand_name_eng)
+
     def get_selenium_driver(self):
         """Selenium WebDriver 설정 (최적화된 성능 설정)"""
         try:
@@ -38,8 +141,6 @@ class BaseCrawler(ABC):
             options.add_argument("--no-sandbox")
             options.add_argument("--disable-dev-shm-usage")
             options.add_argument("--disable-gpu")
-            options.add_argument("--disable-images")  # 이미지 로드 비활성화로 속도 향상
-            options.add_argument("--disable-css")  # CSS 로드 비활성화
             options.add_argument("--disable-plugins")
             options.add_argument("--disable-extensions")
             options.add_argument("--disable-logging")
@@ -87,6 +188,72 @@ class BaseCrawler(ABC):
             logger.error(f"Failed to create Edge driver: {e}")
             raise
 
+    @contextmanager
+    def lease_driver(self):
+        """드라이버 풀에서 WebDriver 대여 (with 블록 종료 시 반납)"""
+        started = time.monotonic()
+        with get_driver_pool().lease(self.get_selenium_driver) as driver:
+            get_metrics().record_span(
+                STAGE_DRIVER_STARTUP, time.monotonic() - started, self.brand_name_eng
+            )
+            # 풀의 드라이버는 여러 크롤러가 공유하므로 대여할 때마다 차단 규칙 적용
+            self.apply_resource_blocking(driver)
+            yield driver
+
+    def get_blocked_url_patterns(self) -> List[str]:
+        """허용 목록을 제외한 차단 URL 패턴"""
+        return [
+            pattern
+            for pattern in self.BLOCKED_URL_PATTERNS
+            if pattern not in self.resource_allowlist
+        ]
+
+    def apply_resource_blocking(self, driver):
+        """DevTools 프로토콜로 이미지/폰트/트래커 등 불필요한 요청 차단"""
+        if not settings.block_resources:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd(
+                "Network.setBlockedURLs", {"urls": self.get_blocked_url_patterns()}
+            )
+        except Exception as e:
+            logger.warning(f"Failed to apply resource blocking: {e}")
+
+    def wait_for(self, driver, condition, timeout: float, label: str):
+        """
+        조건 predicate가 만족될 때까지 대기하고 실제 대기 시간을 기록
+        타임아웃 시 None 반환
+        """
+        result, elapsed = wait_until(driver, condition, timeout)
+        self.wait_timings.record(label, elapsed, timed_out=result is None)
+        if result is None:
+            logger.debug(f"Wait '{label}' timed out after {elapsed:.2f}s")
+        return result
+
+    def bulk_extract(
+        self,
+        driver,
+        elements: List[Any],
+        fields: Dict[str, FieldSpec],
+        computed: Optional[Dict[str, str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        execute_script 한 번으로 요소 목록의 필드를 일괄 추출
+        fields: {필드명: (CSS 셀렉터, 'text' 또는 속성명)}
+        computed: {필드명: 요소를 받아 값을 반환하는 JS 함수 소스}
+        """
+        if not elements:
+            return []
+        script = build_bulk_extract_script(computed or {})
+        return driver.execute_script(
+            script, elements, {name: list(spec) for name, spec in fields.items()}
+        )
+
+    def extract_table(self, driver, table) -> List[List[str]]:
+        """execute_script 한 번으로 테이블의 행별 셀 텍스트 추출"""
+        return driver.execute_script(TABLE_ROWS_SCRIPT, table)
+
     def clean_text(self, text: str) -> str:
         """텍스트 정리"""
         if not text:
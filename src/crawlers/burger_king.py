@@ -1,5 +1,4 @@
 from typing import List, Dict, Any
-import time
 import re
 from loguru import logger
 from selenium.webdriver.common.by import By
@@ -8,10 +7,78 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 from .base import BaseCrawler
+from .waits import (
+    document_ready,
+    element_texts,
+    elements_changed,
+    elements_present,
+    modal_hidden,
+    modal_visible,
+    new_element_visible,
+    table_rows_populated,
+    url_changed,
+    url_is,
+    visible_elements,
+)
 from src.__mock__.dummy_data import get_brand_dummy_data
+from src.metrics import (
+    STAGE_DETAIL_PAGE,
+    STAGE_FETCH,
+    STAGE_LIST_PARSE,
+    STAGE_NUTRITION_MODAL,
+)
 
 
 class BurgerKingCrawler(BaseCrawler):
+    MENU_ITEMS = (By.CSS_SELECTOR, ".menu_list_wrap li")
+    MENU_ITEMS_PRESENT = elements_present(MENU_ITEMS)
+    NEW_PRODUCT_TAG = (By.XPATH, "//*[contains(text(), '신제품')]")
+    NUTRITION_TABLE = (
+        By.XPATH,
+        "//h2[contains(text(), '영양성분')]/following-sibling::table",
+    )
+
+    # 목록 항목(li)에서 상세 URL 추출 (href -> data 속성 -> Vue 컴포넌트 상태 순)
+    DETAIL_URL_JS = """(li) => {
+        const detailPath = '/menu/detail/';
+        const idKeys = ['menuCd', 'menuCode', 'menuId', 'menuSeq', 'prdCd', 'id'];
+        const toUrl = (id) => id ? location.origin + detailPath + id : null;
+
+        const link = li.querySelector('a[href*="' + detailPath + '"]');
+        if (link) return link.href;
+
+        const nodes = [li, ...li.querySelectorAll('.btn_detail, [data-menu-cd], [data-id]')];
+        for (const node of nodes) {
+            for (const [key, value] of Object.entries(node.dataset || {})) {
+                if (value && /(menu|prd|id|cd|code|seq)/i.test(key)) {
+                    return value.includes(detailPath) ? new URL(value, location.origin).href : toUrl(value);
+                }
+            }
+        }
+
+        let node = li;
+        for (let depth = 0; node && depth < 3; depth++, node = node.parentElement) {
+            const vm = node.__vue__ || (node.__vueParentComponent && node.__vueParentComponent.proxy);
+            const props = vm && (vm.$props || vm);
+            const item = props && (props.item || props.menu || props.product || props);
+            if (item) {
+                for (const key of idKeys) {
+                    if (item[key]) return toUrl(item[key]);
+                }
+            }
+        }
+        return null;
+    }"""
+
+    # 목록 항목에서 일괄 추출할 필드
+    PRODUCT_FIELDS = {
+        "name": (".cont .tit span", "text"),
+        "image_url": (".prd_image img", "src"),
+    }
+
+    # 파생 제품 제외 키워드
+    EXCLUDE_KEYWORDS = ["세트", "라지세트", "팩", "콤보", "더블", "라지", "패키지"]
+
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.burgerking.co.kr"
@@ -24,33 +91,40 @@ class BurgerKingCrawler(BaseCrawler):
         logger.info(f"Starting {self.brand_name} crawling...")
 
         try:
-            # 브라우저 드라이버 시작
-            driver = self.get_selenium_driver()
-
-            # 메뉴 페이지로 이동
-            logger.info(f"Navigating to {self.menu_url}")
-            driver.get(self.menu_url)
-
-            # 페이지 로딩 대기 (시간 단축)
-            WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            # 풀에서 브라우저 드라이버 대여
+            with self.lease_driver() as driver:
+                # 메뉴 페이지로 이동
+                logger.info(f"Navigating to {self.menu_url}")
+                with self.span(STAGE_FETCH):
+                    driver.get(self.menu_url)
+
+                    # 페이지 로딩 대기 (시간 단축)
+                    WebDriverWait(driver, 5).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "body"))
+                    )
+                self.count_page()
 
-            # 키워드 버튼 클릭하여 모달 열기
-            self._open_keyword_modal(driver)
+                # 재생 모드의 메뉴 페이지는 필터가 적용된 상태로 기록되어 있음
+                if not self.replay_mode:
+                    # 키워드 버튼 클릭하여 모달 열기
+                    new_product_tag = self._open_keyword_modal(driver)
 
-            # #신제품 태그 클릭 및 적용
-            self._apply_new_product_filter(driver)
+                    # #신제품 태그 클릭 및 적용
+                    self._apply_new_product_filter(driver, new_product_tag)
+                self.snapshot_dom(driver)
 
-            # 신제품 데이터 수집
-            products = self._collect_new_products(driver)
+                # 신제품 데이터 수집
+                products = self._collect_new_products(driver)
 
-            # 각 제품의 영양정보 수집
-            products_with_nutrition = self._collect_nutrition_info(driver, products)
+                # 각 제품의 영양정보 수집
+                products_with_nutrition = self._collect_nutrition_info(
+                    driver, products
+                )
 
             logger.info(
                 f"Finished {self.brand_name} crawling. Found {len(products_with_nutrition)} items"
             )
+            logger.debug(f"Wait timings: {self.wait_timings.summary()}")
             return products_with_nutrition
 
         except Exception as e:
@@ -59,12 +133,8 @@ class BurgerKingCrawler(BaseCrawler):
             logger.warning("Using dummy data due to error")
             return get_brand_dummy_data("burger_king", 3)
 
-        finally:
-            if "driver" in locals():
-                driver.quit()
-
     def _open_keyword_modal(self, driver):
-        """키워드 버튼을 클릭하여 모달창 열기"""
+        """키워드 버튼을 클릭하여 모달창 열기 (모달의 #신제품 태그 반환, 못 찾으면 None)"""
         try:
             # 키워드 버튼 찾기
             keyword_button = None
@@ -86,9 +156,17 @@ class BurgerKingCrawler(BaseCrawler):
                         break
 
             if keyword_button:
+                # 메뉴 카드 등에 이미 보이는 '신제품' 텍스트와 구분하기 위해 클릭 전 상태 기록
+                visible_tags = visible_elements(driver, self.NEW_PRODUCT_TAG)
                 driver.execute_script("arguments[0].click();", keyword_button)
-                time.sleep(0.8)
+                new_product_tag = self.wait_for(
+                    driver,
+                    new_element_visible(self.NEW_PRODUCT_TAG, visible_tags),
+                    3,
+                    "keyword_modal",
+                )
                 logger.info("키워드 모달 열기 완료")
+                return new_product_tag
             else:
                 raise NoSuchElementException("키워드 버튼을 찾을 수 없습니다")
 
@@ -96,18 +174,14 @@ class BurgerKingCrawler(BaseCrawler):
             logger.error(f"키워드 모달 열기 실패: {str(e)}")
             raise
 
-    def _apply_new_product_filter(self, driver):
-        """#신제품 태그 클릭 및 적용"""
+    def _apply_new_product_filter(self, driver, new_product_tag=None):
+        """#신제품 태그 클릭 및 적용 (new_product_tag: 키워드 모달에서 찾은 태그)"""
         try:
-            # #신제품 태그 찾기
-            new_product_tag = None
-
             try:
-                new_product_tag = WebDriverWait(driver, 3).until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH, "//*[contains(text(), '신제품')]")
+                if new_product_tag is None:
+                    new_product_tag = WebDriverWait(driver, 3).until(
+                        EC.element_to_be_clickable(self.NEW_PRODUCT_TAG)
                     )
-                )
             except TimeoutException:
                 # 다른 셀렉터들 시도
                 selectors = [
@@ -128,8 +202,10 @@ class BurgerKingCrawler(BaseCrawler):
                         continue
 
             if new_product_tag:
+                # 필터 적용 전 목록 - 적용 후 목록이 다시 그려졌는지 비교하는 기준
+                menu_texts = element_texts(driver, self.MENU_ITEMS)
                 driver.execute_script("arguments[0].click();", new_product_tag)
-                self._click_apply_button_fast(driver)
+                self._click_apply_button_fast(driver, menu_texts)
                 logger.info("신제품 필터 적용 완료")
             else:
                 raise NoSuchElementException("#신제품 태그를 찾을 수 없습니다")
@@ -138,8 +214,14 @@ class BurgerKingCrawler(BaseCrawler):
             logger.error(f"신제품 필터 적용 실패: {str(e)}")
             raise
 
-    def _click_apply_button_fast(self, driver):
-        """적용 버튼을 빠르게 찾아서 클릭"""
+    def _click_apply_button_fast(self, driver, menu_texts=None):
+        """
+        적용 버튼을 빠르게 찾아서 클릭
+        menu_texts: 필터 적용 전 메뉴 목록 텍스트 (없으면 클릭 직전 목록 사용)
+        """
+        if menu_texts is None:
+            menu_texts = element_texts(driver, self.MENU_ITEMS)
+
         try:
             apply_button = None
 
@@ -160,17 +242,14 @@ class BurgerKingCrawler(BaseCrawler):
 
             if apply_button:
                 driver.execute_script("arguments[0].click();", apply_button)
-                time.sleep(1.5)
-            else:
-                time.sleep(1)  # 자동 적용 대기
 
         except Exception as e:
             logger.warning(f"적용 버튼 클릭 실패: {str(e)}")
-            time.sleep(1)
 
-    def _click_apply_button(self, driver):
-        """적용 버튼 클릭 (기존 메서드 - 호환성 유지)"""
-        self._click_apply_button_fast(driver)
+        # 필터 적용 전에도 목록이 있으므로 목록이 다시 그려질 때까지 대기
+        self.wait_for(
+            driver, elements_changed(self.MENU_ITEMS, menu_texts), 5, "menu_list_filtered"
+        )
 
     def _collect_new_products(self, driver):
         """신제품 데이터 수집"""
@@ -198,9 +277,10 @@ class BurgerKingCrawler(BaseCrawler):
 
             if all_products:
                 logger.info(f"총 {len(all_products)}개 제품 발견")
-                parsed_products = self._parse_product_data_with_urls(
-                    driver, all_products
-                )
+                with self.span(STAGE_LIST_PARSE):
+                    parsed_products = self._parse_product_data_with_urls(
+                        driver, all_products
+                    )
                 return parsed_products
             else:
                 logger.warning("신제품을 찾을 수 없어 더미 데이터를 사용합니다")
@@ -236,105 +316,72 @@ class BurgerKingCrawler(BaseCrawler):
             logger.error(f"{category_name} 카테고리 수집 실패: {str(e)}")
             return []
 
-    def _parse_product_data(self, product_elements):
-        """제품 요소들을 파싱해서 데이터 추출 - 파생 제품 제외"""
-        products = []
-
-        # 제외할 키워드 목록
-        exclude_keywords = ["세트", "라지세트", "팩", "콤보", "더블", "라지", "패키지"]
-
-        for product_element in product_elements:
-            try:
-                # 제품명을 먼저 추출해서 필터링 검사
-                try:
-                    name_element = product_element.find_element(
-                        By.CSS_SELECTOR, ".cont .tit span"
-                    )
-                    product_name = self.clean_text(name_element.text)
-                except:
-                    product_name = "Unknown Product"
-
-                # 파생 제품 필터링 - 제외할 키워드가 포함된 제품은 스킵
-                if any(keyword in product_name for keyword in exclude_keywords):
-                    logger.debug(f"Excluding derived product: {product_name}")
-                    continue
+    def _extract_product_rows(self, driver, product_elements):
+        """execute_script 한 번으로 제품명/이미지/상세 URL 일괄 추출"""
+        try:
+            return self.bulk_extract(
+                driver,
+                product_elements,
+                self.PRODUCT_FIELDS,
+                computed={"detail_url": self.DETAIL_URL_JS},
+            )
+        except Exception as e:
+            logger.error(f"제품 목록 일괄 추출 실패: {str(e)}")
+            return []
 
-                product_data = self.create_burger_data_template(
-                    "", self.brand_name, self.brand_name_eng
-                )
+    def _build_products(self, rows, product_elements):
+        """추출한 행을 제품 데이터로 변환 - 파생 제품 제외 (제품, 요소) 쌍 반환"""
+        products = []
 
-                # 제품명 설정
-                product_data["name"] = product_name
+        for row, product_element in zip(rows, product_elements):
+            product_name = self.clean_text(row.get("name")) or "Unknown Product"
 
-                # 이미지 URL 추출
-                try:
-                    img_element = product_element.find_element(
-                        By.CSS_SELECTOR, ".prd_image img"
-                    )
-                    product_data["image_url"] = img_element.get_attribute("src")
-                except:
-                    product_data["image_url"] = None
+            # 파생 제품 필터링 - 제외할 키워드가 포함된 제품은 스킵
+            if any(keyword in product_name for keyword in self.EXCLUDE_KEYWORDS):
+                logger.debug(f"Excluding derived product: {product_name}")
+                continue
 
-                # description은 상세 페이지에서 추출하므로 기본값 설정
-                product_data["description"] = None
-                product_data["description_full"] = None
+            product_data = self.create_burger_data_template(
+                product_name, self.brand_name, self.brand_name_eng
+            )
+            product_data["image_url"] = row.get("image_url") or None
 
-                # dev_comment는 공란으로 설정
-                product_data["dev_comment"] = None
+            # description은 상세 페이지에서 추출하므로 기본값 설정
+            product_data["description"] = None
+            product_data["description_full"] = None
 
-                # 상세 페이지 링크는 나중에 별도로 수집
-                product_data["shop_url"] = None
+            # dev_comment는 공란으로 설정
+            product_data["dev_comment"] = None
 
-                # 기본값 설정
-                product_data["price"] = 0  # 가격 정보가 없음
-                product_data["available"] = True
-                product_data["category"] = "버거"
+            # 목록 DOM에서 찾은 상세 페이지 링크 (없으면 None)
+            product_data["shop_url"] = row.get("detail_url")
 
-                products.append(product_data)
-                logger.info(f"Parsed product: {product_data['name']}")
+            # 기본값 설정
+            product_data["price"] = 0  # 가격 정보가 없음
+            product_data["available"] = True
+            product_data["category"] = "버거"
 
-            except Exception as e:
-                logger.error(f"Error parsing product element: {str(e)}")
-                continue
+            products.append((product_data, product_element))
+            logger.info(f"Parsed product: {product_data['name']}")
 
         logger.info(f"Filtered out derived products. Final count: {len(products)}")
         return products
 
     def _parse_product_data_with_urls(self, driver, product_elements):
         """제품 요소들을 파싱하고 URL도 수집"""
-        # 먼저 기본 데이터 파싱
-        products = self._parse_product_data(product_elements)
-
-        # 각 제품의 URL 수집
-        filtered_index = 0
-        exclude_keywords = ["세트", "라지세트", "팩", "콤보", "더블", "라지", "패키지"]
+        rows = self._extract_product_rows(driver, product_elements)
+        products = []
 
-        for i, product_element in enumerate(product_elements):
+        for product, product_element in self._build_products(rows, product_elements):
             try:
-                # 제품명 추출
-                try:
-                    name_element = product_element.find_element(
-                        By.CSS_SELECTOR, ".cont .tit span"
-                    )
-                    product_name = self.clean_text(name_element.text)
-                except:
-                    continue
-
-                # 파생 제품 제외
-                if any(keyword in product_name for keyword in exclude_keywords):
-                    continue
-
-                # URL 수집
-                if filtered_index < len(products):
-                    current_product = products[filtered_index]
-                    detail_url = self._get_detail_url(driver, product_element)
-                    if detail_url:
-                        current_product["shop_url"] = detail_url
-                        logger.info(f"{current_product['name']} URL 수집 완료")
-                    filtered_index += 1
-
-            except Exception as e:
-                continue
+                # 목록 DOM에서 찾지 못한 신제품만 클릭 후 URL 확인
+                if not product["shop_url"] and self.needs_detail(product):
+                    product["shop_url"] = self._get_detail_url(driver, product_element)
+                if product["shop_url"]:
+                    logger.info(f"{product['name']} URL 수집 완료")
+            except Exception:
+                pass
+            products.append(product)
 
         return products
 
@@ -346,31 +393,20 @@ class BurgerKingCrawler(BaseCrawler):
             # 현재 URL 저장
             current_url = driver.current_url
 
-            # 상세 버튼 클릭
+            # 상세 버튼 클릭 후 URL이 바뀔 때까지 대기
             driver.execute_script("arguments[0].click();", detail_btn)
-            time.sleep(2)  # 페이지 로딩 대기
+            new_url = self.wait_for(driver, url_changed(current_url), 3, "detail_url")
 
-            # 새 URL 확인
-            new_url = driver.current_url
-            if new_url != current_url and "/menu/detail/" in new_url:
-                # 다시 원래 페이지로 돌아가기
-                driver.back()
-                time.sleep(1)
+            # 클릭이 작동하지 않은 경우
+            if not new_url:
+                return None
 
-                # 메뉴 리스트가 다시 로드될 때까지 대기
-                WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "menu_list_wrap"))
-                )
+            # 다시 원래 페이지로 돌아가 메뉴 리스트가 다시 로드될 때까지 대기
+            driver.back()
+            self.wait_for(driver, url_is(current_url), 5, "detail_back")
+            self.wait_for(driver, self.MENU_ITEMS_PRESENT, 5, "menu_list_reload")
 
-                return new_url
-            else:
-                # 클릭이 작동하지 않은 경우 돌아가기
-                if new_url == current_url:
-                    return None
-                else:
-                    driver.back()
-                    time.sleep(1)
-                    return None
+            return new_url if "/menu/detail/" in new_url else None
 
         except Exception as e:
             logger.debug(f"Error getting detail URL: {str(e)}")
@@ -383,10 +419,14 @@ class BurgerKingCrawler(BaseCrawler):
 
         for product in products:
             try:
-                if product.get("shop_url") and "/menu/detail/" in product["shop_url"]:
-                    result_data = self._get_product_nutrition(
-                        driver, product["shop_url"]
-                    )
+                # 이미 저장된 제품은 상세 페이지 방문 생략 (증분 크롤링)
+                if not self.needs_detail(product):
+                    logger.debug(f"{product['name']} 기존 제품 - 상세 수집 생략")
+                elif product.get("shop_url") and "/menu/detail/" in product["shop_url"]:
+                    with self.span(STAGE_DETAIL_PAGE, product["name"]):
+                        result_data = self._get_product_nutrition(
+                            driver, product["shop_url"], product["name"]
+                        )
 
                     if result_data:
                         if (
@@ -403,8 +443,6 @@ class BurgerKingCrawler(BaseCrawler):
                             product["nutrition"] = result_data
 
                         logger.info(f"{product['name']} 영양정보 수집 완료")
-
-                    time.sleep(1)
                 else:
                     logger.warning(f"{product['name']} 상세 URL 없음")
 
@@ -419,16 +457,14 @@ class BurgerKingCrawler(BaseCrawler):
 
         return products_with_nutrition
 
-    def _get_product_nutrition(self, driver, detail_url):
+    def _get_product_nutrition(self, driver, detail_url, product_name=None):
         """제품 상세 페이지에서 영양정보와 설명 추출"""
         try:
             driver.get(detail_url)
+            self.count_page()
 
             # 페이지 로딩 대기
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-            time.sleep(3)
+            self.wait_for(driver, document_ready(), 10, "detail_page_ready")
 
             # 상세 설명 먼저 추출
             description_data = self._extract_description_from_detail_page(driver)
@@ -441,22 +477,27 @@ class BurgerKingCrawler(BaseCrawler):
                     {"description_info": description_data} if description_data else None
                 )
 
-            driver.execute_script("arguments[0].click();", nutrition_button)
-            time.sleep(5)
-
-            # 모달 대기
-            try:
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CLASS_NAME, "modalWrap"))
-                )
-            except:
-                return (
-                    {"description_info": description_data} if description_data else None
-                )
+            with self.span(STAGE_NUTRITION_MODAL, product_name or detail_url):
+                driver.execute_script("arguments[0].click();", nutrition_button)
+
+                # 모달 표시 대기
+                if not self.wait_for(
+                    driver,
+                    modal_visible((By.CLASS_NAME, "modalWrap")),
+                    10,
+                    "nutrition_modal",
+                ):
+                    return (
+                        {"description_info": description_data}
+                        if description_data
+                        else None
+                    )
 
-            # 영양정보 추출
-            nutrition_data = self._extract_nutrition_from_modal(driver)
-            self._close_nutrition_modal(driver)
+                # 영양정보 추출 (기록 모드에서는 모달이 열린 상태의 DOM 저장)
+                nutrition_data = self._extract_nutrition_from_modal(driver)
+                self.snapshot_dom(driver)
+                if not self.replay_mode:
+                    self._close_nutrition_modal(driver)
 
             # 결과 데이터 구성
             result = {}
@@ -521,75 +562,16 @@ class BurgerKingCrawler(BaseCrawler):
     def _extract_nutrition_from_modal(self, driver):
         """모달에서 영양정보 추출"""
         try:
-            # 모달 완전 로딩 대기
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "modalWrap"))
+            # 영양성분 테이블 행이 채워질 때까지 대기
+            data_rows = self.wait_for(
+                driver,
+                table_rows_populated(self.NUTRITION_TABLE),
+                15,
+                "nutrition_table_rows",
             )
-            time.sleep(3)
-
-            # 영양성분 테이블 찾기
-            nutrition_table = driver.find_element(
-                By.XPATH,
-                "//h2[contains(text(), '영양성분')]/following-sibling::table",
-            )
-
-            tbody = nutrition_table.find_element(By.TAG_NAME, "tbody")
-            data_rows = tbody.find_elements(By.TAG_NAME, "tr")
 
             if data_rows:
-                first_row = data_rows[0]
-                cells = first_row.find_elements(By.TAG_NAME, "td")
-
-                if len(cells) >= 7:
-                    nutrition_data = {}
-
-                    # 영양정보 추출 (괄호 안 숫자 제거)
-                    try:
-                        nutrition_data["calories"] = self._parse_number(
-                            cells[1].text.strip()
-                        )
-                    except:
-                        nutrition_data["calories"] = None
-
-                    try:
-                        protein_text = cells[2].text.strip()
-                        protein_value = (
-                            protein_text.split("(")[0]
-                            if "(" in protein_text
-                            else protein_text
-                        )
-                        nutrition_data["protein"] = self._parse_number(protein_value)
-                    except:
-                        nutrition_data["protein"] = None
-
-                    try:
-                        sodium_text = cells[3].text.strip()
-                        sodium_value = (
-                            sodium_text.split("(")[0]
-                            if "(" in sodium_text
-                            else sodium_text
-                        )
-                        nutrition_data["sodium"] = self._parse_number(sodium_value)
-                    except:
-                        nutrition_data["sodium"] = None
-
-                    try:
-                        nutrition_data["sugar"] = self._parse_number(
-                            cells[4].text.strip()
-                        )
-                    except:
-                        nutrition_data["sugar"] = None
-
-                    try:
-                        fat_text = cells[5].text.strip()
-                        fat_value = (
-                            fat_text.split("(")[0] if "(" in fat_text else fat_text
-                        )
-                        nutrition_data["fat"] = self._parse_number(fat_value)
-                    except:
-                        nutrition_data["fat"] = None
-
-                    return nutrition_data
+                return self._parse_nutrition_cells(data_rows[0])
 
             return None
 
@@ -597,6 +579,19 @@ class BurgerKingCrawler(BaseCrawler):
             logger.error(f"영양정보 추출 실패: {str(e)}")
             return None
 
+    def _parse_nutrition_cells(self, cells):
+        """영양성분 테이블 첫 행의 셀 텍스트를 영양정보로 변환 (괄호 안 숫자 제거)"""
+        if len(cells) < 7:
+            return None
+
+        return {
+            "calories": self._parse_number(cells[1]),
+            "protein": self._parse_number(cells[2].split("(")[0]),
+            "sodium": self._parse_number(cells[3].split("(")[0]),
+            "sugar": self._parse_number(cells[4]),
+            "fat": self._parse_number(cells[5].split("(")[0]),
+        }
+
     def _close_nutrition_modal(self, driver):
         """영양정보 모달 닫기"""
         try:
@@ -616,7 +611,12 @@ class BurgerKingCrawler(BaseCrawler):
 
                     if close_btn.is_displayed():
                         driver.execute_script("arguments[0].click();", close_btn)
-                        time.sleep(1)
+                        self.wait_for(
+                            driver,
+                            modal_hidden((By.CLASS_NAME, "modalWrap")),
+                            3,
+                            "nutrition_modal_close",
+                        )
                         logger.info("Closed nutrition modal")
                         return
                 except:
@@ -626,7 +626,12 @@ class BurgerKingCrawler(BaseCrawler):
             from selenium.webdriver.common.keys import Keys
 
             driver.find_element(By.TAG_NAME, "body").send_keys(Keys.ESCAPE)
-            time.sleep(1)
+            self.wait_for(
+                driver,
+                modal_hidden((By.CLASS_NAME, "modalWrap")),
+                3,
+                "nutrition_modal_close",
+            )
 
         except Exception as e:
             logger.warning(f"Could not close nutrition modal: {str(e)}")
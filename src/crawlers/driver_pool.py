@@ -0,0 +1,218 @@
+"""
+WebDriver 풀 - 크롤러와 실행 간 브라우저 프로세스 재사용
+"""
+
+import atexit
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional
+
+import psutil
+from loguru import logger
+
+from config import settings
+
+
+class PooledDriver:
+    """풀에서 관리하는 드라이버와 사용 정보"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.window_size = None
+        self.baseline_memory_mb: Optional[float] = None
+
+        try:
+            self.window_size = driver.get_window_size()
+        except Exception:
+            pass
+        self.baseline_memory_mb = self.memory_mb()
+
+    def memory_mb(self) -> Optional[float]:
+        """드라이버 서비스와 브라우저 자식 프로세스의 RSS 합계 (MB)"""
+        try:
+            process = psutil.Process(self.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return None
+
+    def memory_growth_mb(self) -> float:
+        """생성 시점 대비 메모리 증가량 (MB)"""
+        current = self.memory_mb()
+        if current is None or self.baseline_memory_mb is None:
+            return 0.0
+        return current - self.baseline_memory_mb
+
+
+class DriverPool:
+    """
+    웜 상태의 WebDriver를 크롤러에 대여하는 풀
+    반납 시 쿠키/스토리지/창 상태를 초기화하고, 사용 횟수나 메모리 증가량이
+    한도를 넘으면 드라이버를 종료하고 새로 만든다
+    """
+
+    def __init__(
+        self,
+        max_idle: int = 2,
+        max_uses: int = 20,
+        max_memory_growth_mb: int = 300,
+    ):
+        self.max_idle = max_idle
+        self.max_uses = max_uses
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self._idle: List[PooledDriver] = []
+        self._lock = threading.Lock()
+        self._metrics = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "recycled": 0,
+            "discarded": 0,
+        }
+
+    @contextmanager
+    def lease(self, factory: Callable[[], Any]):
+        """드라이버 대여 (with 블록 종료 시 자동 반납)"""
+        pooled = self._acquire(factory)
+        try:
+            yield pooled.driver
+        finally:
+            self._release(pooled)
+
+    def get_metrics(self) -> Dict[str, int]:
+        """풀 히트/미스 등 통계 반환"""
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics["idle"] = len(self._idle)
+        return metrics
+
+    def close_all(self):
+        """대기 중인 모든 드라이버 종료"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for pooled in idle:
+            self._quit(pooled)
+        if idle:
+            logger.info(f"Closed {len(idle)} pooled drivers")
+
+    def _acquire(self, factory: Callable[[], Any]) -> PooledDriver:
+        """대기 중인 드라이버를 꺼내거나 새로 생성"""
+        while True:
+            with self._lock:
+                pooled = self._idle.pop() if self._idle else None
+
+            if pooled is None:
+                break
+
+            if self._is_alive(pooled):
+                with self._lock:
+                    self._metrics["hits"] += 1
+                return pooled
+
+            # 응답 없는 드라이버는 버리고 다음 후보 확인
+            self._discard(pooled)
+
+        driver = factory()
+        with self._lock:
+            self._metrics["misses"] += 1
+            self._metrics["created"] += 1
+        return PooledDriver(driver)
+
+    def _release(self, pooled: PooledDriver):
+        """드라이버 반납 (초기화 후 풀에 보관하거나 재생성 대상으로 종료)"""
+        pooled.uses += 1
+
+        if pooled.uses >= self.max_uses:
+            logger.info(f"Recycling driver after {pooled.uses} uses")
+            self._recycle(pooled)
+            return
+
+        growth = pooled.memory_growth_mb()
+        if growth > self.max_memory_growth_mb:
+            logger.info(f"Recycling driver after memory growth of {growth:.0f}MB")
+            self._recycle(pooled)
+            return
+
+        if not self._reset(pooled):
+            self._discard(pooled)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(pooled)
+                return
+
+        self._discard(pooled)
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """다음 대여를 위해 쿠키/스토리지/창 상태 초기화"""
+        driver = pooled.driver
+        try:
+            # 추가로 열린 탭/창 정리
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+
+            driver.delete_all_cookies()
+            try:
+                driver.execute_script(
+                    "window.localStorage.clear(); window.sessionStorage.clear();"
+                )
+            except Exception:
+                # about:blank 등 스토리지 접근이 불가능한 페이지
+                pass
+
+            driver.get("about:blank")
+            if pooled.window_size:
+                driver.set_window_size(
+                    pooled.window_size["width"], pooled.window_size["height"]
+                )
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled driver: {e}")
+            return False
+
+    def _is_alive(self, pooled: PooledDriver) -> bool:
+        """드라이버 세션 응답 여부 확인"""
+        try:
+            pooled.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _recycle(self, pooled: PooledDriver):
+        with self._lock:
+            self._metrics["recycled"] += 1
+        self._quit(pooled)
+
+    def _discard(self, pooled: PooledDriver):
+        with self._lock:
+            self._metrics["discarded"] += 1
+        self._quit(pooled)
+
+    def _quit(self, pooled: PooledDriver):
+        try:
+            pooled.driver.quit()
+        except Exception:
+            pass
+
+
+_driver_pool: Optional[DriverPool] = None
+_driver_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """프로세스 전역 드라이버 풀 반환"""
+    global _driver_pool
+    with _driver_pool_lock:
+        if _driver_pool is None:
+            _driver_pool = DriverPool(
+                max_idle=settings.driver_pool_size,
+                max_uses=settings.driver_max_uses,
+                max_memory_growth_mb=settings.driver_max_memory_growth_mb,
+            )
+            atexit.register(_driver_pool.close_all)
+        return _driver_pool
@@ -0,0 +1,164 @@
+"""
+HTTP 응답 디스크 캐시 - ETag/Last-Modified 조건부 요청과 본문 해시 비교
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from loguru import logger
+
+
+class CachedResponse:
+    """조건부 요청 결과 (본문, 변경 여부, 캐시 반영 함수)"""
+
+    def __init__(
+        self,
+        url: str,
+        text: str,
+        changed: bool,
+        from_cache: bool,
+        commit: Callable[[], None],
+    ):
+        self.url = url
+        self.text = text
+        self.changed = changed
+        self.from_cache = from_cache
+        self._commit = commit
+
+    def commit(self):
+        """
+        크롤링 결과가 저장된 뒤 호출해 캐시에 반영
+        실패한 크롤링이 '변경 없음'으로 기록되지 않도록 조회와 저장을 분리
+        """
+        try:
+            self._commit()
+        except Exception as e:
+            logger.warning(f"Failed to update HTTP cache for {self.url}: {e}")
+
+
+class HttpCache:
+    """
+    URL별 응답 본문과 검증 헤더를 디스크에 저장
+    TTL이 지난 항목은 무시하고, 전체 크기가 max_bytes를 넘으면 오래된 항목부터 삭제
+    """
+
+    def __init__(self, cache_dir: str, ttl_seconds: int, max_bytes: int):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def load(self, url: str) -> Optional[Dict[str, Any]]:
+        """유효한 캐시 메타데이터 반환 (없거나 만료되면 None)"""
+        key = self._key(url)
+        try:
+            with open(self._meta_path(key), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - meta.get("stored_at", 0) > self.ttl_seconds:
+            self._remove(key)
+            return None
+        return meta
+
+    def read_body(self, url: str) -> Optional[bytes]:
+        try:
+            with open(self._body_path(self._key(url)), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def conditional_headers(self, meta: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """캐시 메타데이터로 If-None-Match / If-Modified-Since 헤더 생성"""
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def store(
+        self,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        encoding: Optional[str] = None,
+    ):
+        """응답 본문과 검증 헤더 저장"""
+        key = self._key(url)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "encoding": encoding,
+            "body_hash": body_hash(body),
+            "size": len(body),
+            "stored_at": time.time(),
+        }
+        with self._lock:
+            with open(self._body_path(key), "wb") as f:
+                f.write(body)
+            with open(self._meta_path(key), "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+            self._evict()
+
+    def touch(self, url: str):
+        """변경 없음이 확인된 항목의 저장 시각 갱신"""
+        key = self._key(url)
+        with self._lock:
+            try:
+                with open(self._meta_path(key), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                meta["stored_at"] = time.time()
+                with open(self._meta_path(key), "w", encoding="utf-8") as f:
+                    json.dump(meta, f)
+            except (OSError, ValueError):
+                pass
+
+    def _evict(self):
+        """전체 본문 크기가 한도를 넘으면 오래된 항목부터 삭제"""
+        entries = []
+        total = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, name), "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+            except (OSError, ValueError):
+                continue
+            entries.append((meta.get("stored_at", 0), name[:-5], meta.get("size", 0)))
+            total += meta.get("size", 0)
+
+        for _, key, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(key)
+            total -= size
+
+    def _remove(self, key: str):
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.body")
+
+
+def body_hash(body: bytes) -> str:
+    """응답 본문 해시"""
+    return hashlib.sha256(body).hexdigest()
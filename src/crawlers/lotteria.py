@@ -1,244 +1,244 @@
 from typing import List, Dict, Any, Optional
-import requests
+import asyncio
+import queue
+import httpx
 from bs4 import BeautifulSoup
 from loguru import logger
-import time
 import re
 import json
+import time
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from .base import BaseCrawler
+from .async_base import AsyncBaseCrawler, run_in_daemon_thread
+from config import settings
+from src.metrics import STAGE_DETAIL_PAGE, STAGE_LIST_PARSE, get_metrics
 
 
-class LotteriaCrawler(BaseCrawler):
+class LotteriaCrawler(AsyncBaseCrawler):
     def __init__(self):
         super().__init__()
         self.base_url = "https://www.lotteeatz.com"
         self.brand_name = "롯데리아"
         self.brand_name_eng = "lotteria"
 
-    def crawl(self) -> List[Dict[str, Any]]:
+    async def crawl_async(self) -> List[Dict[str, Any]]:
         """롯데리아 신제품 크롤링 (최적화된 버전)"""
         logger.info(f"Starting {self.brand_name} crawling...")
         burgers = []
-        driver = None
 
         menu_url = f"{self.base_url}/brand/ria"
 
         try:
-            response = self.session.get(menu_url)
-            response.raise_for_status()
-            html_content = response.text
-
-            # pList 데이터를 정규식으로 추출
-            match = re.search(r"var pList = (.*?);", html_content, re.DOTALL)
-            if match:
-                json_str = match.group(1)
-                product_list = json.loads(json_str)
-
-                # 버거 제품들만 필터링
-                burger_items = [
-                    item
-                    for item in product_list
-                    if item.get("displayCategoryNm") == "버거"
-                ]
-                logger.info(f"Found {len(burger_items)} burger items to process")
-
-                # 드라이버 한 번만 생성
-                if burger_items:
-                    driver = self.get_selenium_driver()
-                    logger.info(
-                        "Created single driver instance for all nutrition crawling"
-                    )
-
-                for i, item in enumerate(burger_items):
-                    logger.info(
-                        f"Processing burger {i+1}/{len(burger_items)}: {item.get('presPrdNm')}"
-                    )
-
-                    burger_data = self.create_burger_data_template(
-                        name=item.get("presPrdNm"),
-                        brand_name=self.brand_name,
-                        brand_name_eng=self.brand_name_eng,
-                    )
-                    burger_data["price"] = self.extract_price(
-                        str(item.get("sellPrice"))
-                    )
-                    burger_data["image_url"] = (
-                        f"https://img.lotteeatz.com{item.get('imgPath')}{item.get('imgSystemFileNm')}.{item.get('imgExtsn')}"
-                    )
-                    burger_data["description"] = item.get("dispNm")
-                    burger_data["shop_url"] = (
-                        f"{self.base_url}/products/introductions/{item.get('presPrdId')}"
-                    )
-
-                    # 영양 정보 크롤링 (기존 드라이버 재사용)
-                    if driver:
-                        nutrition_info = self._get_nutrition_info_with_driver(
-                            driver, burger_data["shop_url"]
-                        )
-                        if nutrition_info:
-                            burger_data["nutrition"] = nutrition_info
-
-                    burgers.append(burger_data)
-            else:
-                logger.warning("Could not find pList data in the HTML.")
+            # 메뉴 페이지와 상세 페이지 모두 풀링된 비동기 클라이언트로 요청
+            async with self.create_http_client() as client:
+                burgers = await self._crawl_with_client(client, menu_url)
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Error during crawling {self.brand_name}: {e}")
         except json.JSONDecodeError as e:
             logger.error(f"Error decoding JSON from pList: {e}")
         except Exception as e:
             logger.error(f"An unexpected error occurred: {e}")
-        finally:
-            # 드라이버 정리
-            if driver:
-                try:
-                    driver.quit()
-                    logger.info("Driver closed successfully")
-                except:
-                    pass
 
         logger.info(f"Finished {self.brand_name} crawling. Found {len(burgers)} items")
         return burgers
 
-    def _get_nutrition_info_with_driver(
-        self, driver, product_url: str
-    ) -> Optional[Dict[str, Any]]:
-        """기존 드라이버를 재사용하여 영양 정보 크롤링 (성능 최적화)"""
-        logger.info(f"Crawling nutrition info for: {product_url}")
-        try:
-            driver.get(product_url)
-
-            # 영양 정보 테이블이 로드될 때까지 대기 (타임아웃 단축)
-            try:
-                WebDriverWait(driver, 8).until(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "table.tbl-row-info")
-                    )
-                )
-            except:
-                logger.warning(f"Nutrition table not found for: {product_url}")
-                return None
+    async def _crawl_with_client(self, client, menu_url: str) -> List[Dict[str, Any]]:
+        """메뉴 페이지 조건부 요청 후 pList 파싱과 영양 정보 수집"""
+        menu_page = await self.fetch_cached(client, menu_url)
+
+        # 메뉴가 이전 실행과 같으면 이후 파싱/영양 정보 수집 생략
+        if not menu_page.changed:
+            self.menu_unchanged = True
+            self.defer_cache_commit(menu_page)
+            logger.info(f"{self.brand_name} menu unchanged, skipping crawl")
+            return []
+
+        # pList 데이터를 정규식으로 추출
+        with self.span(STAGE_LIST_PARSE):
+            burgers = self._parse_product_list(menu_page.text)
+        if burgers is None:
+            logger.warning("Could not find pList data in the HTML.")
+            return []
+
+        logger.info(f"Found {len(burgers)} burger items to process")
+
+        # 이미 저장된 제품은 상세 페이지를 받지 않음 (증분 크롤링)
+        targets = [burger for burger in burgers if self.needs_detail(burger)]
+        logger.info(
+            f"Fetching details for {len(targets)} new items "
+            f"({len(burgers) - len(targets)} known items skipped)"
+        )
+
+        # 1차: 정적 HTML을 동시에 받아 영양 정보 추출 (브라우저 없이)
+        pages = await asyncio.gather(
+            *(self._fetch_detail_page(client, burger) for burger in targets)
+        )
+        for burger_data, page in zip(targets, pages):
+            burger_data["nutrition"] = self._parse_nutrition_table(page) if page else None
+
+        # 2차: 정적 파싱에 실패한 제품만 여러 드라이버로 병렬 수집
+        fallback = [burger for burger in targets if not burger["nutrition"]]
+        if fallback:
+            logger.info(
+                f"Static parsing failed for {len(fallback)} items, falling back to browser"
+            )
+            nutrition_results = await self._fetch_nutrition_parallel(
+                [burger["shop_url"] for burger in fallback]
+            )
+            for burger_data, nutrition_info in zip(fallback, nutrition_results):
+                if nutrition_info:
+                    burger_data["nutrition"] = nutrition_info
+
+        # 결과가 저장된 뒤에만 메뉴 페이지를 캐시에 반영
+        self.defer_cache_commit(menu_page)
+        return burgers
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            nutrition_table = soup.select_one("table.tbl-row-info")
-
-            nutrition_data = {}
-            if nutrition_table:
-                rows = nutrition_table.find_all("tr")
-
-                for row in rows:
-                    th = row.find("th")
-                    td = row.find("td")
-
-                    if th and td:
-                        key = th.get_text(strip=True)
-                        value = td.get_text(strip=True)
-
-                        if "열량" in key:
-                            nutrition_data["calories"] = self._parse_nutrition_value(
-                                value
-                            )
-                        elif "포화지방" in key:
-                            nutrition_data["fat"] = self._parse_nutrition_value(value)
-                        elif "단백질" in key:
-                            nutrition_data["protein"] = self._parse_nutrition_value(
-                                value
-                            )
-                        elif "당류" in key:
-                            nutrition_data["sugar"] = self._parse_nutrition_value(value)
-                        elif "나트륨" in key:
-                            nutrition_data["sodium"] = self._parse_nutrition_value(
-                                value
-                            )
-
-                logger.debug(f"Parsed nutrition data: {nutrition_data}")
-
-            return nutrition_data if nutrition_data else None
+    async def _fetch_detail_page(self, client, burger_data: Dict[str, Any]) -> Optional[str]:
+        """제품 상세 페이지 정적 HTML 요청 (제품별 소요 시간 기록)"""
+        started = time.monotonic()
+        page = await client.fetch_text(burger_data["shop_url"])
+        get_metrics().record_span(
+            STAGE_DETAIL_PAGE,
+            time.monotonic() - started,
+            self.brand_name_eng,
+            burger_data["name"],
+        )
+        if page:
+            self.count_page()
+        return page
+
+    def _parse_product_list(self, html: str) -> Optional[List[Dict[str, Any]]]:
+        """메뉴 페이지 HTML의 pList에서 버거 제품만 추출 (pList가 없으면 None)"""
+        match = re.search(r"var pList = (.*?);", html, re.DOTALL)
+        if not match:
+            return None
 
-        except Exception as e:
-            logger.error(f"Error crawling nutrition info from {product_url}: {e}")
+        product_list = json.loads(match.group(1))
+
+        # 버거 제품들만 필터링
+        return [
+            self._build_burger_data(item)
+            for item in product_list
+            if item.get("displayCategoryNm") == "버거"
+        ]
+
+    def _build_burger_data(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """pList 항목을 버거 데이터로 변환"""
+        burger_data = self.create_burger_data_template(
+            name=item.get("presPrdNm"),
+            brand_name=self.brand_name,
+            brand_name_eng=self.brand_name_eng,
+        )
+        burger_data["price"] = self.extract_price(str(item.get("sellPrice")))
+        burger_data["image_url"] = (
+            f"https://img.lotteeatz.com{item.get('imgPath')}{item.get('imgSystemFileNm')}.{item.get('imgExtsn')}"
+        )
+        burger_data["description"] = item.get("dispNm")
+        burger_data["shop_url"] = (
+            f"{self.base_url}/products/introductions/{item.get('presPrdId')}"
+        )
+        return burger_data
+
+    async def _fetch_nutrition_parallel(
+        self, product_urls: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        제한된 수의 드라이버로 영양 정보를 병렬 수집 (입력 순서대로 반환)
+        워커는 데몬 스레드에서 실행해 브라우저가 멈춰도 타임아웃/종료를 막지 않음
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(product_urls)
+        if not product_urls:
+            return results
+
+        work_queue: queue.Queue = queue.Queue()
+        for index, url in enumerate(product_urls):
+            work_queue.put((index, url))
+
+        def worker():
+            # 워커마다 드라이버를 하나씩 빌려 큐가 빌 때까지 재사용
+            with self.lease_driver() as driver:
+                while True:
+                    try:
+                        index, url = work_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    logger.info(f"Processing burger {index+1}/{len(product_urls)}")
+                    results[index] = self._get_nutrition_info_with_driver(driver, url)
+
+        worker_count = max(1, min(settings.nutrition_workers, len(product_urls)))
+        logger.info(f"Fetching nutrition info with {worker_count} browser workers")
+        outcomes = await asyncio.gather(
+            *(run_in_daemon_thread(worker) for _ in range(worker_count)),
+            return_exceptions=True,
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                # 드라이버 생성 실패 등 - 남은 작업은 다른 워커가 처리
+                logger.error(f"Nutrition worker failed: {outcome}")
+
+        return results
+
+    def _parse_nutrition_table(self, html: str) -> Optional[Dict[str, Any]]:
+        """상세 페이지 HTML의 영양 정보 테이블(table.tbl-row-info) 파싱"""
+        soup = BeautifulSoup(html, "html.parser")
+        nutrition_table = soup.select_one("table.tbl-row-info")
+        if not nutrition_table:
             return None
 
-    def _get_nutrition_info(self, product_url: str) -> Optional[Dict[str, Any]]:
-        """개별 제품 상세 페이지에서 영양 정보 크롤링 (단일 사용용)"""
+        nutrition_data = {}
+        for row in nutrition_table.find_all("tr"):
+            th = row.find("th")
+            td = row.find("td")
+
+            if th and td:
+                key = th.get_text(strip=True)
+                value = td.get_text(strip=True)
+
+                if "열량" in key:
+                    nutrition_data["calories"] = self._parse_nutrition_value(value)
+                elif "포화지방" in key:
+                    nutrition_data["fat"] = self._parse_nutrition_value(value)
+                elif "단백질" in key:
+                    nutrition_data["protein"] = self._parse_nutrition_value(value)
+                elif "당류" in key:
+                    nutrition_data["sugar"] = self._parse_nutrition_value(value)
+                elif "나트륨" in key:
+                    nutrition_data["sodium"] = self._parse_nutrition_value(value)
+
+        logger.debug(f"Parsed nutrition data: {nutrition_data}")
+        return nutrition_data if nutrition_data else None
+
+    def _get_nutrition_info_with_driver(
+        self, driver, product_url: str
+    ) -> Optional[Dict[str, Any]]:
+        """기존 드라이버를 재사용하여 영양 정보 크롤링 (성능 최적화)"""
         logger.info(f"Crawling nutrition info for: {product_url}")
-        driver = None
         try:
-            driver = self.get_selenium_driver()
-            driver.get(product_url)
-
-            # 페이지 로드 대기 시간 단축
-            time.sleep(2)  # 5초 -> 2초로 단축
+            with self.span(STAGE_DETAIL_PAGE, product_url):
+                driver.get(product_url)
+                self.count_page()
 
-            # 영양 정보 테이블이 로드될 때까지 대기 (타임아웃 단축)
-            try:
-                WebDriverWait(driver, 8).until(  # 15초 -> 8초로 단축
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "table.tbl-row-info")
+                # 영양 정보 테이블이 로드될 때까지 대기 (타임아웃 단축)
+                try:
+                    WebDriverWait(driver, 8).until(
+                        EC.presence_of_element_located(
+                            (By.CSS_SELECTOR, "table.tbl-row-info")
+                        )
                     )
-                )
-                logger.info("Found nutrition table with correct selector")
-            except:
-                logger.warning(f"Nutrition table not found for: {product_url}")
-                return None
+                except:
+                    logger.warning(f"Nutrition table not found for: {product_url}")
+                    return None
+                self.snapshot_dom(driver)
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            nutrition_table = soup.select_one("table.tbl-row-info")
-
-            nutrition_data = {}
-            if nutrition_table:
-                logger.info("Found nutrition table, parsing data...")
-                rows = nutrition_table.find_all("tr")
-
-                for row in rows:
-                    # 각 행에서 th와 td 요소 찾기
-                    th = row.find("th")
-                    td = row.find("td")
-
-                    if th and td:
-                        key = th.get_text(strip=True)
-                        value = td.get_text(strip=True)
-
-                        if "열량" in key:
-                            nutrition_data["calories"] = self._parse_nutrition_value(
-                                value
-                            )
-                        elif "포화지방" in key:
-                            nutrition_data["fat"] = self._parse_nutrition_value(value)
-                        elif "단백질" in key:
-                            nutrition_data["protein"] = self._parse_nutrition_value(
-                                value
-                            )
-                        elif "당류" in key:
-                            nutrition_data["sugar"] = self._parse_nutrition_value(value)
-                        elif "나트륨" in key:
-                            nutrition_data["sodium"] = self._parse_nutrition_value(
-                                value
-                            )
-
-                logger.info(f"Parsed nutrition data: {nutrition_data}")
-            else:
-                logger.warning("No nutrition table found in page")
-
-            return nutrition_data if nutrition_data else None
+            return self._parse_nutrition_table(driver.page_source)
 
         except Exception as e:
             logger.error(f"Error crawling nutrition info from {product_url}: {e}")
-            import traceback
-
-            logger.error(f"Full traceback: {traceback.format_exc()}")
             return None
-        finally:
-            if driver:
-                try:
-                    driver.quit()
-                except:
-                    pass
 
     def _parse_nutrition_value(self, text: str) -> Optional[float]:
         """영양 정보 텍스트에서 숫자(float) 추출"""
@@ -0,0 +1,57 @@
+"""
+DOM 일괄 추출용 JavaScript 스니펫 - execute_script 한 번으로 구조화된 데이터 반환
+"""
+
+from typing import Dict, Tuple
+
+# (CSS 셀렉터, 속성) - 셀렉터가 빈 문자열이면 요소 자신
+FieldSpec = Tuple[str, str]
+
+# arguments[0]: 테이블 요소
+# 반환값: 내용이 있는 tbody 행별 td 텍스트 목록
+TABLE_ROWS_SCRIPT = """
+    const table = arguments[0];
+    return Array.from(table.querySelectorAll('tbody tr'))
+        .map((row) => Array.from(row.querySelectorAll('td')).map((cell) => cell.innerText.trim()))
+        .filter((cells) => cells.some((text) => text));
+"""
+
+# arguments[0]: 요소 목록
+# 반환값: 요소별 innerText (목록이 다시 그려졌는지 비교하는 서명)
+ELEMENT_TEXTS_SCRIPT = """
+    return arguments[0].map((el) => el.innerText.trim());
+"""
+
+# arguments[0]: 요소 목록, arguments[1]: {필드명: [CSS 셀렉터, 속성]}
+# 속성이 'text'이면 innerText, 그 외에는 DOM 프로퍼티(없으면 attribute) 값
+BULK_EXTRACT_TEMPLATE = """
+    const [elements, fields] = arguments;
+    const computed = {%(computed)s};
+    return elements.map((el) => {
+        const row = {};
+        for (const [name, [selector, attr]] of Object.entries(fields)) {
+            const target = selector ? el.querySelector(selector) : el;
+            if (!target) {
+                row[name] = null;
+            } else if (attr === 'text') {
+                row[name] = target.innerText.trim();
+            } else {
+                row[name] = target[attr] !== undefined ? target[attr] : target.getAttribute(attr);
+            }
+        }
+        for (const [name, fn] of Object.entries(computed)) {
+            try {
+                row[name] = fn(el);
+            } catch (e) {
+                row[name] = null;
+            }
+        }
+        return row;
+    });
+"""
+
+
+def build_bulk_extract_script(computed: Dict[str, str]) -> str:
+    """계산 필드(JS 함수 소스)를 포함한 일괄 추출 스크립트 생성"""
+    entries = ", ".join(f"{name}: {source}" for name, source in computed.items())
+    return BULK_EXTRACT_TEMPLATE % {"computed": entries}
@@ -0,0 +1,203 @@
+"""
+이벤트 기반 대기 - 고정 sleep 대신 페이지 상태 조건(predicate)으로 대기
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+from .scripts import ELEMENT_TEXTS_SCRIPT, TABLE_ROWS_SCRIPT
+
+Locator = Tuple[str, str]
+
+
+def document_ready():
+    """document.readyState가 interactive/complete가 될 때까지"""
+
+    def _predicate(driver):
+        state = driver.execute_script("return document.readyState")
+        return state in ("interactive", "complete")
+
+    return _predicate
+
+
+def elements_present(locator: Locator, min_count: int = 1):
+    """locator에 해당하는 요소가 min_count개 이상 존재할 때까지 (요소 목록 반환)"""
+
+    def _predicate(driver):
+        elements = driver.find_elements(*locator)
+        return elements if len(elements) >= min_count else False
+
+    return _predicate
+
+
+def element_texts(driver, locator: Locator) -> List[str]:
+    """locator 요소들의 텍스트 목록 (elements_changed의 비교 기준)"""
+    elements = driver.find_elements(*locator)
+    if not elements:
+        return []
+    return driver.execute_script(ELEMENT_TEXTS_SCRIPT, elements)
+
+
+def elements_changed(locator: Locator, previous_texts: List[str]):
+    """
+    locator 요소 목록이 previous_texts와 달라질 때까지 (요소 목록 반환)
+    필터 적용 전에도 목록이 있으므로 존재 여부가 아니라 내용 변화로 판단
+    """
+
+    def _predicate(driver):
+        elements = driver.find_elements(*locator)
+        if not elements:
+            return False
+        texts = driver.execute_script(ELEMENT_TEXTS_SCRIPT, elements)
+        return elements if texts != previous_texts else False
+
+    return _predicate
+
+
+def visible_elements(driver, locator: Locator) -> List[Any]:
+    """현재 화면에 표시된 locator 요소 (new_element_visible의 비교 기준)"""
+    visible = []
+    for element in driver.find_elements(*locator):
+        try:
+            if element.is_displayed():
+                visible.append(element)
+        except StaleElementReferenceException:
+            continue
+    return visible
+
+
+def new_element_visible(locator: Locator, previous: List[Any]):
+    """
+    previous에 없던 locator 요소가 화면에 표시될 때까지 (요소 반환)
+    같은 텍스트가 이미 페이지에 있어도 새로 열린 모달의 요소만 인정
+    """
+
+    def _predicate(driver):
+        for element in driver.find_elements(*locator):
+            try:
+                if element not in previous and element.is_displayed():
+                    return element
+            except StaleElementReferenceException:
+                continue
+        return False
+
+    return _predicate
+
+
+def modal_visible(locator: Locator):
+    """모달 요소가 화면에 표시될 때까지 (요소 반환)"""
+
+    def _predicate(driver):
+        try:
+            element = driver.find_element(*locator)
+            return element if element.is_displayed() else False
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+    return _predicate
+
+
+def modal_hidden(locator: Locator):
+    """모달 요소가 사라지거나 숨겨질 때까지"""
+
+    def _predicate(driver):
+        try:
+            return not any(e.is_displayed() for e in driver.find_elements(*locator))
+        except StaleElementReferenceException:
+            return True
+
+    return _predicate
+
+
+def table_rows_populated(table_locator: Locator, min_rows: int = 1):
+    """테이블 tbody에 내용이 채워진 행이 min_rows개 이상일 때까지 (행별 셀 텍스트 반환)"""
+
+    def _predicate(driver):
+        try:
+            table = driver.find_element(*table_locator)
+            rows = driver.execute_script(TABLE_ROWS_SCRIPT, table)
+            return rows if len(rows) >= min_rows else False
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+    return _predicate
+
+
+def url_changed(old_url: str, contains: str = ""):
+    """현재 URL이 old_url과 달라질 때까지 (새 URL 반환)"""
+
+    def _predicate(driver):
+        current = driver.current_url
+        if current != old_url and contains in current:
+            return current
+        return False
+
+    return _predicate
+
+
+def url_is(expected_url: str):
+    """현재 URL이 expected_url이 될 때까지 (뒤로 가기 확인용)"""
+
+    def _predicate(driver):
+        return driver.current_url == expected_url
+
+    return _predicate
+
+
+class WaitTimings:
+    """대기 라벨별 실제 소요 시간 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings: Dict[str, List[float]] = {}
+        self._timeouts: Dict[str, int] = {}
+
+    def record(self, label: str, elapsed: float, timed_out: bool = False):
+        with self._lock:
+            self._timings.setdefault(label, []).append(elapsed)
+            if timed_out:
+                self._timeouts[label] = self._timeouts.get(label, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """라벨별 횟수/합계/평균/최대 대기 시간과 타임아웃 횟수"""
+        with self._lock:
+            return {
+                label: {
+                    "count": len(values),
+                    "total": round(sum(values), 3),
+                    "avg": round(sum(values) / len(values), 3),
+                    "max": round(max(values), 3),
+                    "timeouts": self._timeouts.get(label, 0),
+                }
+                for label, values in self._timings.items()
+            }
+
+
+def wait_until(
+    driver,
+    condition: Callable[[Any], Any],
+    timeout: float,
+    poll_interval: float = 0.1,
+) -> Tuple[Any, float]:
+    """
+    조건이 참이 될 때까지 폴링
+    반환값: (조건 결과 또는 None, 실제 대기 시간)
+    """
+    started = time.monotonic()
+    deadline = started + timeout
+    while True:
+        try:
+            result = condition(driver)
+        except (NoSuchElementException, StaleElementReferenceException):
+            result = False
+        if result:
+            return result, time.monotonic() - started
+        if time.monotonic() >= deadline:
+            return None, time.monotonic() - started
+        time.sleep(poll_interval)
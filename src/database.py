@@ -1,48 +1,252 @@
 from supabase import create_client, Client
+from postgrest.types import ReturnMethod
 from loguru import logger
 from config import settings
-from typing import List, Dict, Any, Optional
-import json
+from src.resilience import CircuitBreaker, ResilientExecutor, RetryPolicy
+from typing import List, Dict, Any, Optional, Set, Callable, Tuple
+import threading
 from decimal import Decimal
 from datetime import datetime
 
 
+# PostgREST 기본 최대 응답 행 수
+PAGE_SIZE = 1000
+
+# in_() 필터 한 번에 넣을 ID 수 (URL 길이 제한)
+IN_FILTER_SIZE = 200
+
+NUTRITION_FIELDS = ["calories", "fat", "protein", "sugar", "sodium"]
+
+
+def build_brand_data(burger_data: Dict[str, Any]) -> Dict[str, Any]:
+    """크롤링 데이터에서 Brand 테이블 행 생성"""
+    return {
+        "name": burger_data["brand_name"],
+        "name_eng": burger_data.get(
+            "brand_name_eng", burger_data["brand_name"].lower()
+        ),
+        "description": burger_data.get("brand_description"),
+        "logo_url": burger_data.get("brand_logo_url"),
+        "website_url": burger_data.get("brand_website_url"),
+    }
+
+
+def build_product_data(burger_data: Dict[str, Any]) -> Dict[str, Any]:
+    """크롤링 데이터에서 Product 테이블 행 생성"""
+    return {
+        "name": burger_data["name"],
+        "description": burger_data.get("description"),
+        "description_full": burger_data.get("description_full"),
+        "image_url": burger_data.get("image_url"),
+        "price": burger_data["price"],
+        "set_price": burger_data.get("set_price"),
+        "available": burger_data.get("available", True),
+        "category": burger_data.get("category", "버거"),
+        "shop_url": burger_data.get("shop_url"),
+        "brand_name": burger_data["brand_name"],
+        "released_at": burger_data.get("released_at"),
+        "patty": burger_data.get("patty", "undefined"),
+    }
+
+
+def build_product_update_data(
+    product_id: int, brand_name: str, snapshot: Dict[str, Any]
+) -> Dict[str, Any]:
+    """변경 감지 스냅샷에서 Product upsert 행 생성 (released_at, patty 등은 유지)"""
+
+    def _to_int(value):
+        return int(value) if value is not None else None
+
+    return {
+        "product_id": product_id,
+        "name": snapshot["name"],
+        "description": snapshot.get("description"),
+        "description_full": snapshot.get("description_full"),
+        "image_url": snapshot.get("image_url"),
+        "price": _to_int(snapshot.get("price")),
+        "set_price": _to_int(snapshot.get("set_price")),
+        "available": snapshot.get("available", True),
+        "category": snapshot.get("category"),
+        "shop_url": snapshot.get("shop_url"),
+        "brand_name": brand_name,
+    }
+
+
+def build_nutrition_data(product_id: int, nutrition: Dict[str, Any]) -> Dict[str, Any]:
+    """크롤링 영양정보에서 Nutrition 테이블 행 생성"""
+    nutrition_data: Dict[str, Any] = {"product_id": product_id}
+    for field in NUTRITION_FIELDS:
+        nutrition_data[field] = (
+            Decimal(str(nutrition[field])) if nutrition.get(field) else None
+        )
+    return nutrition_data
+
+
+def build_price_history_data(
+    product_id: int, burger_data: Dict[str, Any], observed_at: datetime
+) -> Dict[str, Any]:
+    """크롤링 데이터(또는 변경 스냅샷)에서 PriceHistory 테이블 행 생성"""
+
+    def _to_int(value):
+        return int(value) if value is not None else None
+
+    return {
+        "product_id": product_id,
+        "price": _to_int(burger_data.get("price")),
+        "set_price": _to_int(burger_data.get("set_price")),
+        "available": burger_data.get("available", True),
+        "observed_at": observed_at,
+    }
+
+
+def serialize_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """데이터를 JSON 직렬화 가능한 형태로 변환"""
+    serialized = {}
+    for key, value in data.items():
+        if isinstance(value, datetime):
+            # datetime을 ISO 형식 문자열로 변환
+            serialized[key] = value.isoformat()
+        elif isinstance(value, Decimal):
+            # Decimal을 float로 변환
+            serialized[key] = float(value)
+        elif value is None:
+            serialized[key] = None
+        else:
+            serialized[key] = value
+    return serialized
+
+
+def match_inserted_rows(
+    data_list: List[Dict[str, Any]], indexes: List[int], rows: List[Dict[str, Any]]
+) -> Dict[int, int]:
+    """
+    insert 응답 행을 (brand_name, name)으로 입력 항목에 매핑 {data_list 인덱스: product_id}
+    PostgREST는 응답 행 순서를 보장하지 않으므로 위치가 아닌 키로 매핑
+    (같은 키가 여러 번 나오면 product_id 순서대로 배정)
+    """
+    returned: Dict[Tuple[str, str], List[int]] = {}
+    for row in rows:
+        returned.setdefault((row["brand_name"], row["name"]), []).append(
+            row["product_id"]
+        )
+    for ids in returned.values():
+        ids.sort(reverse=True)
+
+    product_ids: Dict[int, int] = {}
+    for index in indexes:
+        ids = returned.get((data_list[index]["brand_name"], data_list[index]["name"]))
+        if ids:
+            product_ids[index] = ids.pop()
+    return product_ids
+
+
+def _chunked(items: List[Any], size: int) -> List[List[Any]]:
+    """리스트를 size 크기의 청크로 분할"""
+    return [items[i : i + size] for i in range(0, len(items), max(1, size))]
+
+
 class SupabaseManager:
-    def __init__(self):
-        self.client: Client = create_client(
-            settings.supabase_url, settings.supabase_key
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None):
+        # url/key를 넘기면 설정 대신 사용 (로컬 PostgREST 대체 서버 등)
+        self.url = url or settings.supabase_url
+        self.key = key or settings.supabase_key
+        self.client: Client = create_client(self.url, self.key)
+        # 브랜드명 -> 브랜드 ID 캐시 (최초 사용 시 Brand 테이블에서 한 번 로드)
+        self._brand_cache: Dict[str, int] = {}
+        self._brand_cache_loaded = False
+        self._brand_lock = threading.Lock()
+        # 모든 쿼리에 공통으로 적용하는 재시도/서킷 브레이커
+        self._executor = ResilientExecutor(
+            RetryPolicy(
+                max_attempts=settings.db_retry_attempts,
+                base_delay=settings.db_retry_base_delay,
+                max_delay=settings.db_retry_max_delay,
+            ),
+            CircuitBreaker(
+                failure_threshold=settings.db_circuit_failure_threshold,
+                reset_timeout=settings.db_circuit_reset_seconds,
+            ),
         )
         logger.info("Supabase client initialized")
 
     def get_or_create_brand(self, brand_data: Dict[str, Any]) -> Optional[int]:
         """
-        브랜드를 조회하거나 생성
+        브랜드를 조회하거나 생성 (프로세스 내 캐시 사용)
         """
-        try:
-            # 기존 브랜드 조회
-            result = (
-                self.client.table("Brand")
-                .select("id")
-                .eq("name", brand_data["name"])
-                .execute()
-            )
+        brand_id = self._brand_cache.get(brand_data["name"])
+        if brand_id:
+            return brand_id
 
-            if result.data:
-                brand_id = result.data[0]["id"]
-                logger.info(
-                    f"Found existing brand: {brand_data['name']} (ID: {brand_id})"
+        # 동시에 같은 브랜드를 생성하지 않도록 조회/생성은 락 안에서 수행
+        with self._brand_lock:
+            try:
+                if not self._brand_cache_loaded:
+                    self._load_brand_cache()
+
+                brand_id = self._brand_cache.get(brand_data["name"])
+                if brand_id:
+                    return brand_id
+
+                # 캐시 로드 이후 다른 프로세스가 만든 브랜드가 있는지 확인
+                result = self._execute(
+                    self.client.table("Brand")
+                    .select("id")
+                    .eq("name", brand_data["name"])
                 )
-                return brand_id
-            else:
-                # 새 브랜드 생성
-                result = self.client.table("Brand").insert(brand_data).execute()
-                brand_id = result.data[0]["id"]
-                logger.info(f"Created new brand: {brand_data['name']} (ID: {brand_id})")
+
+                if result.data:
+                    brand_id = result.data[0]["id"]
+                    logger.info(
+                        f"Found existing brand: {brand_data['name']} (ID: {brand_id})"
+                    )
+                else:
+                    # 새 브랜드 생성
+                    result = self._execute(
+                        self.client.table("Brand").insert(brand_data),
+                        idempotent=False,
+                    )
+                    brand_id = result.data[0]["id"]
+                    logger.info(
+                        f"Created new brand: {brand_data['name']} (ID: {brand_id})"
+                    )
+
+                self._brand_cache[brand_data["name"]] = brand_id
                 return brand_id
 
-        except Exception as e:
-            logger.error(f"Failed to get or create brand: {str(e)}")
-            return None
+            except Exception as e:
+                logger.error(f"Failed to get or create brand: {str(e)}")
+                return None
+
+    def get_brand_ids(self) -> Dict[str, int]:
+        """
+        브랜드명 -> 브랜드 ID (캐시가 비어 있으면 Brand 테이블에서 로드)
+        """
+        with self._brand_lock:
+            try:
+                if not self._brand_cache_loaded:
+                    self._load_brand_cache()
+            except Exception as e:
+                logger.error(f"Failed to load brands: {str(e)}")
+            return dict(self._brand_cache)
+
+    def seed_brand_cache(self, brand_ids: Dict[str, int]):
+        """
+        로컬 인덱스 등 외부에서 알고 있는 브랜드 ID로 캐시 채우기
+        """
+        with self._brand_lock:
+            for name, brand_id in brand_ids.items():
+                self._brand_cache.setdefault(name, brand_id)
+
+    def _load_brand_cache(self):
+        """
+        Brand 테이블 전체를 한 번 조회해 캐시에 적재
+        """
+        rows = self._fetch_all_pages(
+            lambda: self.client.table("Brand").select("id, name").order("id")
+        )
+        self._brand_cache.update({row["name"]: row["id"] for row in rows})
+        self._brand_cache_loaded = True
+        logger.info(f"Loaded {len(rows)} brands into cache")
 
     def insert_product_data(self, product_data: Dict[str, Any]) -> Optional[int]:
         """
@@ -51,7 +255,10 @@ class SupabaseManager:
         try:
             # 데이터 직렬화
             serialized_data = self._serialize_data(product_data)
-            result = self.client.table("Product").insert(serialized_data).execute()
+            result = self._execute(
+                self.client.table("Product").insert(serialized_data),
+                idempotent=False,
+            )
             product_id = result.data[0]["product_id"]
             logger.info(
                 f"Product inserted successfully: {product_data.get('name', 'Unknown')} (ID: {product_id})"
@@ -68,7 +275,11 @@ class SupabaseManager:
         try:
             # 데이터 직렬화
             serialized_data = self._serialize_data(nutrition_data)
-            result = self.client.table("Nutrition").insert(serialized_data).execute()
+            result = self._execute(
+                self.client.table("Nutrition").upsert(
+                    serialized_data, on_conflict="product_id"
+                )
+            )
             logger.info(
                 f"Nutrition data inserted successfully for product_id: {nutrition_data.get('product_id')}"
             )
@@ -83,72 +294,20 @@ class SupabaseManager:
         """
         try:
             # 1. 브랜드 확인/생성
-            brand_data = {
-                "name": burger_data["brand_name"],
-                "name_eng": burger_data.get(
-                    "brand_name_eng", burger_data["brand_name"].lower()
-                ),
-                "description": burger_data.get("brand_description"),
-                "logo_url": burger_data.get("brand_logo_url"),
-                "website_url": burger_data.get("brand_website_url"),
-            }
-
-            brand_id = self.get_or_create_brand(brand_data)
+            brand_id = self.get_or_create_brand(build_brand_data(burger_data))
             if not brand_id:
                 return False
 
-            # 2. 제품 데이터 준비
-            product_data = {
-                "name": burger_data["name"],
-                "description": burger_data.get("description"),
-                "description_full": burger_data.get("description_full"),
-                "image_url": burger_data.get("image_url"),
-                "price": burger_data["price"],
-                "set_price": burger_data.get("set_price"),
-                "available": burger_data.get("available", True),
-                "category": burger_data.get("category", "버거"),
-                "shop_url": burger_data.get("shop_url"),
-                "brand_name": burger_data["brand_name"],
-                "released_at": burger_data.get("released_at"),
-                "patty": burger_data.get("patty", "undefined"),
-            }
-
-            # 3. 제품 삽입
-            product_id = self.insert_product_data(product_data)
+            # 2. 제품 삽입
+            product_id = self.insert_product_data(build_product_data(burger_data))
             if not product_id:
                 return False
 
-            # 4. 영양 정보가 있으면 삽입
+            # 3. 영양 정보가 있으면 삽입
             if burger_data.get("nutrition"):
-                nutrition_data = {
-                    "product_id": product_id,
-                    "calories": (
-                        Decimal(str(burger_data["nutrition"]["calories"]))
-                        if burger_data["nutrition"].get("calories")
-                        else None
-                    ),
-                    "fat": (
-                        Decimal(str(burger_data["nutrition"]["fat"]))
-                        if burger_data["nutrition"].get("fat")
-                        else None
-                    ),
-                    "protein": (
-                        Decimal(str(burger_data["nutrition"]["protein"]))
-                        if burger_data["nutrition"].get("protein")
-                        else None
-                    ),
-                    "sugar": (
-                        Decimal(str(burger_data["nutrition"]["sugar"]))
-                        if burger_data["nutrition"].get("sugar")
-                        else None
-                    ),
-                    "sodium": (
-                        Decimal(str(burger_data["nutrition"]["sodium"]))
-                        if burger_data["nutrition"].get("sodium")
-                        else None
-                    ),
-                }
-                self.insert_nutrition_data(nutrition_data)
+                self.insert_nutrition_data(
+                    build_nutrition_data(product_id, burger_data["nutrition"])
+                )
 
             return True
 
@@ -160,37 +319,300 @@ class SupabaseManager:
         """
         여러 햄버거 데이터를 일괄 삽입
         """
+        product_ids = self.insert_burger_batch(data_list)
+        return len(product_ids) > 0
+
+    def insert_burger_batch(
+        self, data_list: List[Dict[str, Any]], batch_size: Optional[int] = None
+    ) -> Dict[int, int]:
+        """
+        햄버거 데이터를 다중 행 insert로 일괄 삽입
+        브랜드는 한 번씩만 확인하고, 제품/영양정보는 청크 단위로 삽입
+        반환값: {data_list 인덱스: product_id} (영양정보 저장에 실패한 항목은 제외)
+        """
+        batch_size = batch_size or settings.db_batch_size
+        product_ids: Dict[int, int] = {}
+
         try:
-            success_count = 0
-            for burger_data in data_list:
-                if self.insert_complete_burger_data(burger_data):
-                    success_count += 1
+            # 1. 브랜드별로 한 번씩만 확인/생성
+            valid_indexes = []
+            brand_ids: Dict[str, Optional[int]] = {}
+            for index, burger_data in enumerate(data_list):
+                brand_name = burger_data["brand_name"]
+                if brand_name not in brand_ids:
+                    brand_ids[brand_name] = self.get_or_create_brand(
+                        build_brand_data(burger_data)
+                    )
+                if brand_ids[brand_name]:
+                    valid_indexes.append(index)
+
+            # 2. 제품 다중 행 삽입 (응답 행은 브랜드/제품명으로 매핑)
+            for chunk in _chunked(valid_indexes, batch_size):
+                rows = [
+                    self._serialize_data(build_product_data(data_list[index]))
+                    for index in chunk
+                ]
+                try:
+                    result = self._execute(
+                        self.client.table("Product").insert(rows), idempotent=False
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to insert product chunk: {str(e)}")
+                    continue
+
+                product_ids.update(match_inserted_rows(data_list, chunk, result.data))
+
+            # 3. 영양정보 다중 행 upsert (product_id 기준이라 재시도해도 안전)
+            nutrition_indexes = [
+                index for index in product_ids if data_list[index].get("nutrition")
+            ]
+            for chunk in _chunked(nutrition_indexes, batch_size):
+                rows = [
+                    self._serialize_data(
+                        build_nutrition_data(
+                            product_ids[index], data_list[index]["nutrition"]
+                        )
+                    )
+                    for index in chunk
+                ]
+                try:
+                    self._execute(
+                        self.client.table("Nutrition").upsert(
+                            rows, on_conflict="product_id"
+                        )
+                    )
+                except Exception as e:
+                    # 영양정보가 빠진 제품은 저장 실패로 반환해 인덱스 기록/스풀 확인을 막고
+                    # 다음 실행의 변경 감지에서 영양정보를 다시 쓰도록 함
+                    logger.error(f"Failed to upsert nutrition chunk: {str(e)}")
+                    for index in chunk:
+                        del product_ids[index]
 
             logger.info(
-                f"Bulk insert completed: {success_count}/{len(data_list)} items successful"
+                f"Bulk insert completed: {len(product_ids)}/{len(data_list)} items successful"
             )
-            return success_count > 0
+            return product_ids
 
         except Exception as e:
             logger.error(f"Failed to insert bulk data: {str(e)}")
-            return False
+            return product_ids
+
+    def upsert_changed_products(
+        self, changes: List[Dict[str, Any]], batch_size: Optional[int] = None
+    ) -> Set[int]:
+        """
+        변경된 기존 제품을 다중 행 upsert로 갱신 (product_id 기준)
+        영양정보는 값이 바뀐 제품만 upsert
+        changes: product_index.find_changes() 결과, 반환값: 갱신에 성공한 product_id
+        """
+        batch_size = batch_size or settings.db_batch_size
+        updated: Set[int] = set()
+
+        for chunk in _chunked(changes, batch_size):
+            rows = [
+                self._serialize_data(
+                    build_product_update_data(
+                        change["product_id"], change["brand_name"], change["snapshot"]
+                    )
+                )
+                for change in chunk
+            ]
+            try:
+                self._execute(
+                    self.client.table("Product").upsert(rows, on_conflict="product_id")
+                )
+            except Exception as e:
+                logger.error(f"Failed to upsert product chunk: {str(e)}")
+                continue
+            updated.update(change["product_id"] for change in chunk)
+
+        nutrition_rows = [
+            self._serialize_data(
+                build_nutrition_data(
+                    change["product_id"], change["snapshot"]["nutrition"]
+                )
+            )
+            for change in changes
+            if change["product_id"] in updated
+            and "nutrition" in change["changed_fields"]
+            and change["snapshot"].get("nutrition")
+        ]
+        for chunk in _chunked(nutrition_rows, batch_size):
+            try:
+                self._execute(
+                    self.client.table("Nutrition").upsert(chunk, on_conflict="product_id")
+                )
+            except Exception as e:
+                logger.error(f"Failed to upsert nutrition chunk: {str(e)}")
+                updated.difference_update(row["product_id"] for row in chunk)
+
+        logger.info(f"Upsert completed: {len(updated)}/{len(changes)} changed items")
+        return updated
+
+    def append_price_history(
+        self, rows: List[Dict[str, Any]], batch_size: Optional[int] = None
+    ) -> int:
+        """
+        가격/판매 여부 관측값을 PriceHistory에 다중 행 insert (추가 전용)
+        반환값: 저장된 행 수
+        """
+        batch_size = batch_size or settings.db_batch_size
+        saved = 0
+        for chunk in _chunked(rows, batch_size):
+            try:
+                self._execute(
+                    self.client.table("PriceHistory").insert(
+                        [self._serialize_data(row) for row in chunk],
+                        returning=ReturnMethod.minimal,
+                    ),
+                    idempotent=False,
+                )
+                saved += len(chunk)
+            except Exception as e:
+                logger.error(f"Failed to insert price history chunk: {str(e)}")
+
+        if rows:
+            logger.info(f"Price history appended: {saved}/{len(rows)} rows")
+        return saved
+
+    def get_price_history(
+        self,
+        product_id: int,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        제품의 가격 이력을 관측 시각 순으로 조회 (기간 필터는 서버에서 적용)
+        """
+        histories = self.get_price_histories([product_id], since, until)
+        return histories.get(product_id, [])
+
+    def get_price_histories(
+        self,
+        product_ids: List[int],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        여러 제품의 가격 이력 조회 {product_id: 관측값 목록}
+        product_id는 in_ 필터 청크로, 각 청크는 페이지 단위로 조회
+        """
+        histories: Dict[int, List[Dict[str, Any]]] = {}
+        try:
+            for chunk in _chunked(list(product_ids), IN_FILTER_SIZE):
+
+                def build_query():
+                    query = (
+                        self.client.table("PriceHistory")
+                        .select("product_id, price, set_price, available, observed_at")
+                        .in_("product_id", chunk)
+                    )
+                    if since:
+                        query = query.gte("observed_at", since.isoformat())
+                    if until:
+                        query = query.lte("observed_at", until.isoformat())
+                    return query.order("observed_at").order("id")
+
+                for row in self._fetch_all_pages(build_query):
+                    histories.setdefault(row["product_id"], []).append(row)
+            return histories
+
+        except Exception as e:
+            logger.error(f"Failed to get price history: {str(e)}")
+            return histories
+
+    def get_observed_product_ids(self, product_ids: List[int]) -> Optional[Set[int]]:
+        """
+        PriceHistory 행이 하나 이상 있는 product_id 조회
+        조회에 실패하면 None (관측값이 없는 것으로 오인하지 않도록)
+        """
+        observed: Set[int] = set()
+        try:
+            for chunk in _chunked(list(product_ids), IN_FILTER_SIZE):
+                observed.update(
+                    row["product_id"]
+                    for row in self._fetch_all_pages(
+                        lambda: self.client.table("PriceHistory")
+                        .select("product_id")
+                        .in_("product_id", chunk)
+                        .order("id")
+                    )
+                )
+            return observed
+
+        except Exception as e:
+            logger.error(f"Failed to get observed products: {str(e)}")
+            return None
 
     def check_duplicate_product(self, name: str, brand_name: str) -> bool:
         """
         중복 제품 확인
         """
         try:
-            result = (
+            result = self._execute(
                 self.client.table("Product")
                 .select("product_id")
                 .eq("name", name)
                 .eq("brand_name", brand_name)
-                .execute()
             )
             return len(result.data) > 0
         except Exception as e:
+            # 조회 실패를 '중복 아님'으로 처리하면 중복 삽입되므로 호출자에게 전달
             logger.error(f"Failed to check duplicate product: {str(e)}")
-            return False
+            raise
+
+    def get_existing_product_names(self, brand_name: str) -> Optional[Set[str]]:
+        """
+        브랜드의 기존 제품명을 한 번에 조회 (페이지 단위 일괄 조회)
+        조회 실패 시 None 반환
+        """
+        try:
+            rows = self._fetch_all_pages(
+                lambda: self.client.table("Product")
+                .select("product_id, name")
+                .eq("brand_name", brand_name)
+                .order("product_id")
+            )
+            return {row["name"] for row in rows}
+        except Exception as e:
+            logger.error(f"Failed to get existing product names: {str(e)}")
+            return None
+
+    def get_products_with_nutrition(
+        self, brand_name: Optional[str] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        제품 전체와 영양정보를 페이지 단위로 조회 (product["nutrition"]에 영양정보)
+        조회 실패 시 None 반환
+        """
+        try:
+
+            def build_query():
+                query = self.client.table("Product").select("*").order("product_id")
+                if brand_name:
+                    query = query.eq("brand_name", brand_name)
+                return query
+
+            products = self._fetch_all_pages(build_query)
+
+            nutrition_by_id = {}
+            product_ids = [product["product_id"] for product in products]
+            for chunk in _chunked(product_ids, IN_FILTER_SIZE):
+                result = self._execute(
+                    self.client.table("Nutrition")
+                    .select("*")
+                    .in_("product_id", chunk)
+                )
+                for row in result.data:
+                    nutrition_by_id[row["product_id"]] = row
+
+            for product in products:
+                product["nutrition"] = nutrition_by_id.get(product["product_id"])
+            return products
+
+        except Exception as e:
+            logger.error(f"Failed to get products with nutrition: {str(e)}")
+            return None
 
     def get_latest_products(
         self, limit: int = 10, brand_name: Optional[str] = None
@@ -209,7 +631,7 @@ class SupabaseManager:
             if brand_name:
                 query = query.eq("brand_name", brand_name)
 
-            result = query.execute()
+            result = self._execute(query)
             return result.data
         except Exception as e:
             logger.error(f"Failed to get latest products: {str(e)}")
@@ -221,11 +643,10 @@ class SupabaseManager:
         """
         try:
             # 제품 정보 조회
-            product_result = (
+            product_result = self._execute(
                 self.client.table("Product")
                 .select("*")
                 .eq("product_id", product_id)
-                .execute()
             )
             if not product_result.data:
                 return None
@@ -233,11 +654,10 @@ class SupabaseManager:
             product = product_result.data[0]
 
             # 영양정보 조회
-            nutrition_result = (
+            nutrition_result = self._execute(
                 self.client.table("Nutrition")
                 .select("*")
                 .eq("product_id", product_id)
-                .execute()
             )
             if nutrition_result.data:
                 product["nutrition"] = nutrition_result.data[0]
@@ -248,20 +668,37 @@ class SupabaseManager:
             logger.error(f"Failed to get product with nutrition: {str(e)}")
             return None
 
+    def _execute(self, query: Any, idempotent: bool = True) -> Any:
+        """
+        쿼리 실행 - 멱등 쿼리(조회, upsert)만 일시적 오류에 재시도
+        서킷이 열려 있으면 CircuitOpenError 발생
+        """
+        return self._executor.call(
+            query.execute, idempotent=idempotent, label=query.path
+        )
+
+    def get_resilience_metrics(self) -> Dict[str, int]:
+        """DB 호출/재시도/실패/서킷 차단 횟수"""
+        return self._executor.metrics.snapshot()
+
+    def _fetch_all_pages(
+        self, build_query: Callable[[], Any], page_size: int = PAGE_SIZE
+    ) -> List[Dict[str, Any]]:
+        """
+        limit/offset 기반 페이지네이션으로 조회 결과 전체 수집
+        (postgrest-py 버전마다 range()의 끝 인덱스 포함 여부가 달라 사용하지 않음)
+        """
+        rows = []
+        start = 0
+        while True:
+            result = self._execute(build_query().limit(page_size).offset(start))
+            rows.extend(result.data)
+            if len(result.data) < page_size:
+                return rows
+            start += page_size
+
     def _serialize_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         데이터를 JSON 직렬화 가능한 형태로 변환
         """
-        serialized = {}
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                # datetime을 ISO 형식 문자열로 변환
-                serialized[key] = value.isoformat()
-            elif isinstance(value, Decimal):
-                # Decimal을 float로 변환
-                serialized[key] = float(value)
-            elif value is None:
-                serialized[key] = None
-            else:
-                serialized[key] = value
-        return serialized
+        return serialize_row(data)
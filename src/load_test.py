@@ -0,0 +1,123 @@
+"""
+부하 테스트 - 로컬 PostgREST 대체 서버에 대규모 카탈로그를 저장하며
+일괄 삽입, 중복 제거, 변경 감지(upsert), 재시도/스풀 재처리 경로를 측정
+"""
+
+import json
+import tempfile
+import time
+from typing import Any, Dict, Iterable, List
+
+from loguru import logger
+
+from config import settings
+from src.__mock__.postgrest_server import LOCAL_KEY, LocalPostgrest
+from src.__mock__.synthetic_catalog import SyntheticCatalog
+from src.database import SupabaseManager
+from src.scheduler import CrawlerScheduler
+
+
+def _save_round(
+    scheduler: CrawlerScheduler, name: str, chunks: Iterable[List[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """청크마다 브랜드별로 크롤링 결과 저장 경로를 실행하고 처리량 기록"""
+    items = 0
+    results = []
+    started = time.monotonic()
+    for chunk in chunks:
+        items_by_brand: Dict[str, List[Dict[str, Any]]] = {}
+        for item in chunk:
+            items_by_brand.setdefault(item["brand_name_eng"], []).append(item)
+        items += len(chunk)
+        results.extend(
+            scheduler.save_items(brand, brand_items)
+            for brand, brand_items in items_by_brand.items()
+        )
+    elapsed = time.monotonic() - started
+
+    stats = {
+        "round": name,
+        "items": items,
+        "seconds": round(elapsed, 3),
+        "items_per_second": round(items / elapsed, 1) if elapsed else None,
+        "new_items": sum(result["new_items"] for result in results),
+        "saved": sum(result["saved"] for result in results),
+        "updated": sum(result["updated"] for result in results),
+        "failed_brands": sorted(
+            {
+                result["brand"]
+                for result in results
+                if result["status"] != "success"
+                or result["error"]
+                or result["saved"] < result["new_items"]
+            }
+        ),
+    }
+    logger.info(f"Load test round: {json.dumps(stats, ensure_ascii=False)}")
+    return stats
+
+
+def run_load_test(count: int) -> Dict[str, Any]:
+    """
+    합성 카탈로그 count개로 부하 테스트 실행 (배치 크기는 DB_BATCH_SIZE 설정)
+    1) 최초 저장 2) 같은 카탈로그 재저장(중복 제거) 3) 다음 리비전 저장(가격 변경 upsert/이력)
+    카탈로그는 LOAD_TEST_CHUNK_SIZE개씩 생성해 저장하므로 메모리에 전체를 올리지 않음
+    이후 실패로 스풀에 남은 항목이 있으면 재처리
+    """
+    server = LocalPostgrest(
+        latency=settings.load_test_latency_ms / 1000,
+        jitter=settings.load_test_jitter_ms / 1000,
+        error_rate=settings.load_test_error_rate,
+        lost_write_rate=settings.load_test_lost_write_rate,
+        # 응답 행 순서에 의존하지 않는지 함께 확인
+        shuffle_returning=True,
+        seed=settings.load_test_seed,
+    )
+    catalog = SyntheticCatalog(
+        seed=settings.load_test_seed,
+        brand_count=settings.load_test_brand_count,
+        collision_rate=settings.load_test_collision_rate,
+    )
+    chunk_size = settings.load_test_chunk_size
+    logger.info(
+        f"Load test: {count} items, {len(catalog.brands)} brands, "
+        f"batch size {settings.db_batch_size}, "
+        f"latency {settings.load_test_latency_ms}ms, "
+        f"error rate {settings.load_test_error_rate}, "
+        f"lost write rate {settings.load_test_lost_write_rate}"
+    )
+
+    with server, tempfile.TemporaryDirectory() as work_dir:
+        db_manager = SupabaseManager(url=server.url, key=LOCAL_KEY)
+        # 실제 인덱스/스풀을 오염시키지 않도록 임시 파일 사용
+        scheduler = CrawlerScheduler(
+            db_manager=db_manager,
+            product_index_path=f"{work_dir}/product_index.sqlite3",
+            spool_path=f"{work_dir}/crawl_spool.jsonl",
+        )
+
+        # 제품별 로그는 수만 줄이 되므로 테스트 중에는 끔
+        logger.disable("src.scheduler")
+        try:
+            rounds = [
+                _save_round(scheduler, "initial", catalog.chunks(count, 0, chunk_size)),
+                _save_round(scheduler, "repeat", catalog.chunks(count, 0, chunk_size)),
+                _save_round(
+                    scheduler, "price_change", catalog.chunks(count, 1, chunk_size)
+                ),
+            ]
+            spool = scheduler.replay_spool()
+        finally:
+            logger.enable("src.scheduler")
+
+        report = {
+            "count": count,
+            "rounds": rounds,
+            "spool": spool,
+            "spool_pending": len(scheduler.spool.pending()) if scheduler.spool else 0,
+            "resilience": db_manager.get_resilience_metrics(),
+            "server": server.stats(),
+        }
+
+    logger.info(f"Load test report: {json.dumps(report, ensure_ascii=False)}")
+    return report
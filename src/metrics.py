@@ -0,0 +1,197 @@
+"""
+실행 지표 - 단계별 소요 시간(span)과 카운터를 브랜드/제품 단위로 수집해
+JSON 실행 리포트와 Prometheus textfile로 내보낸다
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# 단계 이름
+STAGE_FETCH = "fetch"
+STAGE_DRIVER_STARTUP = "driver_startup"
+STAGE_LIST_PARSE = "list_parse"
+STAGE_DETAIL_PAGE = "detail_page"
+STAGE_NUTRITION_MODAL = "nutrition_modal"
+STAGE_DEDUP = "dedup"
+STAGE_DB_WRITE = "db_write"
+STAGE_CRAWL = "crawl"
+
+PROMETHEUS_PREFIX = "burger_crawler"
+
+
+class RunMetrics:
+    """한 번의 실행 동안의 단계별 span과 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.finished_at: Optional[float] = None
+        # (브랜드, 단계) -> [소요 시간]
+        self._stages: Dict[Tuple[str, str], List[float]] = {}
+        # 제품 단위 span
+        self._product_spans: List[Dict[str, Any]] = []
+        # (브랜드, 카운터) -> 값
+        self._counters: Dict[Tuple[str, str], float] = {}
+        # (브랜드, 이름) -> 리포트에 그대로 넣을 부가 정보
+        self._info: Dict[Tuple[str, str], Any] = {}
+
+    @contextmanager
+    def span(self, stage: str, brand: str = "", product: Optional[str] = None):
+        """with 블록의 소요 시간을 단계별로 기록"""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record_span(stage, time.monotonic() - started, brand, product)
+
+    def record_span(
+        self, stage: str, seconds: float, brand: str = "", product: Optional[str] = None
+    ):
+        with self._lock:
+            self._stages.setdefault((brand, stage), []).append(seconds)
+            if product is not None:
+                self._product_spans.append(
+                    {
+                        "brand": brand,
+                        "product": product,
+                        "stage": stage,
+                        "seconds": round(seconds, 3),
+                    }
+                )
+
+    def increment(self, counter: str, value: float = 1, brand: str = ""):
+        with self._lock:
+            key = (brand, counter)
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_counter(self, counter: str, value: float, brand: str = ""):
+        with self._lock:
+            self._counters[(brand, counter)] = value
+
+    def set_info(self, name: str, value: Any, brand: str = ""):
+        """리포트에 그대로 넣을 부가 정보 (대기 시간 요약, 드라이버 풀 지표 등)"""
+        with self._lock:
+            self._info[(brand, name)] = value
+
+    def finish(self):
+        self.finished_at = time.time()
+
+    def report(self) -> Dict[str, Any]:
+        """JSON 실행 리포트"""
+        with self._lock:
+            brands: Dict[str, Dict[str, Any]] = {}
+            for (brand, stage), values in self._stages.items():
+                stages = brands.setdefault(brand or "_run", {}).setdefault("stages", {})
+                stages[stage] = {
+                    "count": len(values),
+                    "total": round(sum(values), 3),
+                    "avg": round(sum(values) / len(values), 3),
+                    "max": round(max(values), 3),
+                }
+            for (brand, counter), value in self._counters.items():
+                counters = brands.setdefault(brand or "_run", {}).setdefault(
+                    "counters", {}
+                )
+                counters[counter] = value
+            for (brand, name), value in self._info.items():
+                brands.setdefault(brand or "_run", {})[name] = value
+
+            finished_at = self.finished_at or time.time()
+            return {
+                "started_at": _isoformat(self.started_at),
+                "finished_at": _isoformat(finished_at),
+                "duration": round(finished_at - self.started_at, 3),
+                "brands": brands,
+                "products": list(self._product_spans),
+            }
+
+    def prometheus_text(self) -> str:
+        """Prometheus textfile collector 형식"""
+        lines = []
+        with self._lock:
+            stages = dict(self._stages)
+            counters = dict(self._counters)
+
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds_total counter")
+        for (brand, stage), values in sorted(stages.items()):
+            labels = _labels(brand=brand, stage=stage)
+            lines.append(f"{PROMETHEUS_PREFIX}_stage_seconds_total{labels} {sum(values):.3f}")
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_stage_count counter")
+        for (brand, stage), values in sorted(stages.items()):
+            labels = _labels(brand=brand, stage=stage)
+            lines.append(f"{PROMETHEUS_PREFIX}_stage_count{labels} {len(values)}")
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_stage_seconds_max gauge")
+        for (brand, stage), values in sorted(stages.items()):
+            labels = _labels(brand=brand, stage=stage)
+            lines.append(f"{PROMETHEUS_PREFIX}_stage_seconds_max{labels} {max(values):.3f}")
+
+        for counter in sorted({counter for _, counter in counters}):
+            lines.append(f"# TYPE {PROMETHEUS_PREFIX}_{counter}_total counter")
+            for (brand, name), value in sorted(counters.items()):
+                if name == counter:
+                    lines.append(
+                        f"{PROMETHEUS_PREFIX}_{counter}_total{_labels(brand=brand)} {value:g}"
+                    )
+
+        finished_at = self.finished_at or time.time()
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_run_duration_seconds gauge")
+        lines.append(
+            f"{PROMETHEUS_PREFIX}_run_duration_seconds {finished_at - self.started_at:.3f}"
+        )
+        lines.append(f"# TYPE {PROMETHEUS_PREFIX}_last_run_timestamp_seconds gauge")
+        lines.append(f"{PROMETHEUS_PREFIX}_last_run_timestamp_seconds {finished_at:.0f}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, path: str):
+        _atomic_write(path, json.dumps(self.report(), ensure_ascii=False, indent=2))
+
+    def write_prometheus(self, path: str):
+        # textfile collector가 쓰는 도중의 파일을 읽지 않도록 교체 방식으로 저장
+        _atomic_write(path, self.prometheus_text())
+
+
+def _labels(**labels: str) -> str:
+    parts = [
+        f'{name}="{_escape(value)}"' for name, value in labels.items() if value
+    ]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _isoformat(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat()
+
+
+def _atomic_write(path: str, content: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+_metrics = RunMetrics()
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> RunMetrics:
+    """현재 실행의 지표"""
+    return _metrics
+
+
+def reset_metrics() -> RunMetrics:
+    """새 실행 시작 - 지표 초기화"""
+    global _metrics
+    with _metrics_lock:
+        _metrics = RunMetrics()
+        return _metrics
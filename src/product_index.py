@@ -0,0 +1,406 @@
+"""
+로컬 제품 인덱스 - 브랜드 + 정규화된 제품명 기준으로 저장된 제품과 내용 해시를 SQLite에 보관
+Supabase 조회 없이 신제품/변경 여부를 판단하고, Supabase 장애 중에도 마지막 상태로 동작
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import unicodedata
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from src.database import NUTRITION_FIELDS
+
+# 목록 단계에서 얻는 제품 필드 (상세 단계에서는 description_full, nutrition 추가)
+LIST_FIELDS = [
+    "name",
+    "description",
+    "image_url",
+    "price",
+    "set_price",
+    "available",
+    "category",
+    "shop_url",
+]
+
+
+def normalize_name(name: str) -> str:
+    """제품명 정규화 (유니코드 NFKC, 공백 정리, 대소문자 무시)"""
+    if not name:
+        return ""
+    return " ".join(unicodedata.normalize("NFKC", name).split()).casefold()
+
+
+def is_dummy(item: Dict[str, Any]) -> bool:
+    """크롤링 실패 시 대신 반환된 더미 데이터인지 (실제 가격/영양정보가 아님)"""
+    return bool(item.get("is_dummy"))
+
+
+def _normalize_number(value: Any) -> Optional[float]:
+    if value is None or value == "":
+        return None
+    try:
+        return round(float(value), 2)
+    except (TypeError, ValueError, ArithmeticError):
+        return None
+
+
+def product_snapshot(item: Dict[str, Any]) -> Dict[str, Any]:
+    """크롤링 데이터 또는 DB 행에서 비교용 정규화 필드 추출"""
+    snapshot: Dict[str, Any] = {}
+    for field in LIST_FIELDS + ["description_full"]:
+        value = item.get(field)
+        if field in ("price", "set_price"):
+            value = _normalize_number(value)
+        elif field == "available":
+            value = True if value is None else bool(value)
+        elif isinstance(value, str):
+            value = " ".join(unicodedata.normalize("NFKC", value).split()) or None
+        snapshot[field] = value
+
+    nutrition = item.get("nutrition")
+    snapshot["nutrition"] = (
+        {field: _normalize_number(nutrition.get(field)) for field in NUTRITION_FIELDS}
+        if nutrition
+        else None
+    )
+    return snapshot
+
+
+def merge_snapshot(stored: Dict[str, Any], item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    저장된 스냅샷 위에 크롤링으로 얻은 값만 덮어쓴 스냅샷
+    상세 페이지를 생략했거나 수집에 실패한 필드(None)는 저장된 값 유지
+    """
+    crawled = product_snapshot(item)
+    merged = dict(stored)
+    for field, value in crawled.items():
+        if field == "nutrition":
+            if value:
+                nutrition = {
+                    name: (stored.get("nutrition") or {}).get(name)
+                    for name in NUTRITION_FIELDS
+                }
+                nutrition.update({k: v for k, v in value.items() if v is not None})
+                merged["nutrition"] = nutrition
+        elif value is not None:
+            merged[field] = value
+    return merged
+
+
+def find_changes(
+    entries: Dict[str, Dict[str, Any]], items: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    기존 제품 중 내용 해시가 달라진 항목 찾기 (더미 대체 데이터는 제외)
+    entries: get_entries() 결과, 반환값: {product_id, brand_name, snapshot, changed_fields}
+    """
+    changes = []
+    seen = set()
+    for item in items:
+        if is_dummy(item):
+            continue
+        name_key = normalize_name(item["name"])
+        entry = entries.get(name_key)
+        if not entry or not entry.get("product_id") or name_key in seen:
+            continue
+        seen.add(name_key)
+
+        merged = merge_snapshot(entry["snapshot"], item)
+        if content_hash(merged) == entry["content_hash"]:
+            continue
+
+        changes.append(
+            {
+                "product_id": entry["product_id"],
+                "brand_name": item["brand_name"],
+                "snapshot": merged,
+                "changed_fields": [
+                    field
+                    for field, value in merged.items()
+                    if entry["snapshot"].get(field) != value
+                ],
+            }
+        )
+    return changes
+
+
+def build_entries(rows: Iterable[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """DB 행(영양정보 포함)으로 get_entries()와 같은 형태의 항목 생성"""
+    entries = {}
+    for row in rows:
+        snapshot = product_snapshot(row)
+        entries[normalize_name(row["name"])] = {
+            "product_id": row["product_id"],
+            "content_hash": content_hash(snapshot),
+            "snapshot": snapshot,
+        }
+    return entries
+
+
+def content_hash(snapshot: Dict[str, Any]) -> str:
+    """정규화 필드의 내용 해시"""
+
+    def _default(value):
+        if isinstance(value, Decimal):
+            return float(value)
+        return str(value)
+
+    payload = json.dumps(snapshot, sort_keys=True, ensure_ascii=False, default=_default)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ProductIndex:
+    """브랜드별 저장된 제품의 로컬 인덱스 (SQLite)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS products (
+                    brand_name TEXT NOT NULL,
+                    name_key TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    product_id INTEGER,
+                    content_hash TEXT NOT NULL,
+                    snapshot TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (brand_name, name_key)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS brands (
+                    name TEXT PRIMARY KEY,
+                    brand_id INTEGER,
+                    synced_at REAL
+                )
+                """
+            )
+            # 삽입 응답을 받지 못해 첫 가격 관측값을 기록하지 못한 제품
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS unconfirmed_inserts (
+                    brand_name TEXT NOT NULL,
+                    name_key TEXT NOT NULL,
+                    PRIMARY KEY (brand_name, name_key)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def synced_at(self, brand_name: str) -> Optional[float]:
+        """브랜드를 마지막으로 Supabase와 동기화한 시각 (없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT synced_at FROM brands WHERE name = ?", (brand_name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, brand_name: str, max_age_seconds: float) -> bool:
+        synced_at = self.synced_at(brand_name)
+        return synced_at is not None and time.time() - synced_at <= max_age_seconds
+
+    def invalidate(self, brand_name: str):
+        """다음 조회 때 Supabase에서 다시 구성하도록 동기화 시각 초기화"""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE brands SET synced_at = NULL WHERE name = ?", (brand_name,)
+            )
+
+    def known_names(self, brand_name: str) -> Set[str]:
+        """브랜드의 저장된 제품명 (정규화된 이름)"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name_key FROM products WHERE brand_name = ?", (brand_name,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def is_known(self, brand_name: str, name: str) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM products WHERE brand_name = ? AND name_key = ?",
+                (brand_name, normalize_name(name)),
+            ).fetchone()
+        return row is not None
+
+    def get_entries(self, brand_name: str) -> Dict[str, Dict[str, Any]]:
+        """브랜드의 인덱스 항목 {정규화된 이름: {product_id, content_hash, snapshot}}"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name_key, product_id, content_hash, snapshot "
+                "FROM products WHERE brand_name = ?",
+                (brand_name,),
+            ).fetchall()
+        return {
+            name_key: {
+                "product_id": product_id,
+                "content_hash": hash_value,
+                "snapshot": json.loads(snapshot),
+            }
+            for name_key, product_id, hash_value, snapshot in rows
+        }
+
+    def upsert(self, records: Iterable[Tuple[str, Optional[int], Dict[str, Any]]]):
+        """
+        제품 항목 저장/갱신
+        records: (브랜드명, product_id, 크롤링 데이터 또는 DB 행) 목록
+        """
+        rows = self._build_rows(records)
+        if not rows:
+            return
+        with self._connect() as conn:
+            self._write_rows(conn, rows)
+
+    def _build_rows(
+        self, records: Iterable[Tuple[str, Optional[int], Dict[str, Any]]]
+    ) -> List[Tuple]:
+        """저장할 행 (스냅샷/해시 계산) - 연결을 열기 전에 계산"""
+        now = time.time()
+        rows = []
+        for brand_name, product_id, item in records:
+            snapshot = product_snapshot(item)
+            rows.append(
+                (
+                    brand_name,
+                    normalize_name(item["name"]),
+                    item["name"],
+                    product_id,
+                    content_hash(snapshot),
+                    json.dumps(snapshot, ensure_ascii=False),
+                    now,
+                )
+            )
+        return rows
+
+    def _write_rows(self, conn: sqlite3.Connection, rows: List[Tuple]):
+        conn.executemany(
+            """
+            INSERT INTO products
+                (brand_name, name_key, name, product_id, content_hash, snapshot, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (brand_name, name_key) DO UPDATE SET
+                name = excluded.name,
+                product_id = COALESCE(excluded.product_id, products.product_id),
+                content_hash = excluded.content_hash,
+                snapshot = excluded.snapshot,
+                updated_at = excluded.updated_at
+            """,
+            rows,
+        )
+
+    def brand_ids(self) -> Dict[str, int]:
+        """저장된 브랜드명 -> 브랜드 ID"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name, brand_id FROM brands WHERE brand_id IS NOT NULL"
+            ).fetchall()
+        return {name: brand_id for name, brand_id in rows}
+
+    def store_brand_ids(self, brand_ids: Dict[str, int]):
+        with self._connect() as conn:
+            self._write_brand_ids(conn, brand_ids)
+
+    def _write_brand_ids(self, conn: sqlite3.Connection, brand_ids: Dict[str, int]):
+        conn.executemany(
+            """
+            INSERT INTO brands (name, brand_id) VALUES (?, ?)
+            ON CONFLICT (name) DO UPDATE SET brand_id = excluded.brand_id
+            """,
+            list(brand_ids.items()),
+        )
+
+    def rebuild(self, db_manager, brand_name: str) -> bool:
+        """
+        Supabase에서 브랜드의 제품/영양정보를 받아 인덱스 재구성
+        삭제/삽입/동기화 시각 갱신을 한 트랜잭션으로 처리해, 중간에 실패하면
+        이전 인덱스가 그대로 남고 비었거나 일부만 채워진 인덱스가 최신으로 표시되지 않음
+        """
+        products = db_manager.get_products_with_nutrition(brand_name)
+        if products is None:
+            logger.warning(f"Could not rebuild product index for {brand_name}")
+            return False
+
+        try:
+            rows = self._build_rows((brand_name, row["product_id"], row) for row in products)
+        except Exception as e:
+            logger.warning(f"Could not rebuild product index for {brand_name}: {e}")
+            return False
+        brand_ids = db_manager.get_brand_ids()
+
+        with self._connect() as conn:
+            conn.execute("DELETE FROM products WHERE brand_name = ?", (brand_name,))
+            self._write_rows(conn, rows)
+            conn.execute(
+                """
+                INSERT INTO brands (name, synced_at) VALUES (?, ?)
+                ON CONFLICT (name) DO UPDATE SET synced_at = excluded.synced_at
+                """,
+                (brand_name, time.time()),
+            )
+            self._write_brand_ids(conn, brand_ids)
+
+        logger.info(f"Rebuilt product index for {brand_name}: {len(products)} products")
+        return True
+
+    def record_changes(self, changes: List[Dict[str, Any]]):
+        """DB 갱신에 성공한 변경 항목의 스냅샷/해시 반영"""
+        self.upsert(
+            (change["brand_name"], change["product_id"], change["snapshot"])
+            for change in changes
+        )
+
+    def record_unconfirmed(self, items: List[Dict[str, Any]]):
+        """
+        삽입 결과(product_id)를 확인하지 못한 항목 기록
+        실제로 저장되었다면 다음 재구성 때 찾아 첫 가격 관측값을 기록
+        """
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO unconfirmed_inserts (brand_name, name_key) "
+                "VALUES (?, ?)",
+                [(item["brand_name"], normalize_name(item["name"])) for item in items],
+            )
+
+    def unconfirmed_names(self, brand_name: str) -> Set[str]:
+        """브랜드의 삽입 결과를 확인하지 못한 제품명 (정규화된 이름)"""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT name_key FROM unconfirmed_inserts WHERE brand_name = ?",
+                (brand_name,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def clear_unconfirmed(self, brand_name: str, name_keys: Iterable[str]):
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM unconfirmed_inserts WHERE brand_name = ? AND name_key = ?",
+                [(brand_name, name_key) for name_key in name_keys],
+            )
+
+    def record_inserted(self, items: List[Dict[str, Any]], product_ids: Dict[int, int]):
+        """DB 삽입에 성공한 항목을 인덱스에 반영 (product_ids: 항목 인덱스 -> product_id)"""
+        self.upsert(
+            (items[index]["brand_name"], product_id, items[index])
+            for index, product_id in product_ids.items()
+        )
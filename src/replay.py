@@ -0,0 +1,266 @@
+"""
+오프라인 기록/재생 - 크롤러가 받은 HTTP 응답과 렌더링된 DOM을 픽스처로 기록하고,
+로컬 서버로 재생해 네트워크 없이 크롤링/파싱 성능을 측정
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from loguru import logger
+
+from config import settings
+from src.metrics import get_metrics, reset_metrics
+
+# requests 세션/비동기 클라이언트가 보내는 채널 헤더 (없으면 Selenium의 DOM 채널)
+REPLAY_CHANNEL_HEADER = "X-Replay-Channel"
+CHANNEL_HTTP = "http"
+CHANNEL_DOM = "dom"
+
+MANIFEST_FILE = "manifest.json"
+
+# DOM 스냅샷은 이미 렌더링된 결과이므로 재생 시 스크립트가 다시 실행되지 않도록 제거
+SCRIPT_TAG = re.compile(r"<script\b[^>]*>.*?</script>", re.IGNORECASE | re.DOTALL)
+
+
+def _split_url(url: str) -> Tuple[str, str]:
+    """URL -> (origin, 경로+쿼리)"""
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+    return f"{parts.scheme}://{parts.netloc}", path
+
+
+class FixtureRecorder:
+    """HTTP 응답과 DOM 스냅샷을 브랜드별 픽스처 디렉터리에 기록"""
+
+    def __init__(self, fixture_dir: str):
+        self.fixture_dir = fixture_dir
+        self._lock = threading.Lock()
+        # (채널, URL) -> 항목 (같은 URL은 마지막 기록으로 덮어씀)
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        os.makedirs(fixture_dir, exist_ok=True)
+
+    def record_http(
+        self, url: str, status: int, content_type: Optional[str], body: bytes
+    ):
+        self._record(CHANNEL_HTTP, url, status, content_type, body)
+
+    def record_dom(self, url: str, html: str):
+        html = SCRIPT_TAG.sub("", html)
+        self._record(CHANNEL_DOM, url, 200, "text/html; charset=utf-8", html.encode("utf-8"))
+
+    def record_requests_response(self, response, *args, **kwargs):
+        """requests 세션 response 훅 (리다이렉트 전 요청 URL 기준으로 기록)"""
+        url = response.history[0].url if response.history else response.url
+        self.record_http(
+            url,
+            response.status_code,
+            response.headers.get("Content-Type"),
+            response.content,
+        )
+
+    def record_httpx_response(self, response):
+        """AsyncHttpClient 응답 훅"""
+        request = response.history[0].request if response.history else response.request
+        self.record_http(
+            str(request.url),
+            response.status_code,
+            response.headers.get("content-type"),
+            response.content,
+        )
+
+    def save(self) -> int:
+        """매니페스트 저장 (기록된 항목 수 반환)"""
+        with self._lock:
+            entries = list(self._entries.values())
+        with open(os.path.join(self.fixture_dir, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump({"entries": entries}, f, ensure_ascii=False, indent=2)
+        return len(entries)
+
+    def _record(
+        self,
+        channel: str,
+        url: str,
+        status: int,
+        content_type: Optional[str],
+        body: bytes,
+    ):
+        with self._lock:
+            key = (channel, url)
+            entry = self._entries.get(key)
+            body_file = (
+                entry["body_file"] if entry else f"{len(self._entries):04d}.body"
+            )
+            with open(os.path.join(self.fixture_dir, body_file), "wb") as f:
+                f.write(body)
+            self._entries[key] = {
+                "channel": channel,
+                "url": url,
+                "status": status,
+                "content_type": content_type,
+                "body_file": body_file,
+            }
+
+
+class ReplayServer:
+    """
+    기록된 origin마다 로컬 HTTP 서버를 하나씩 띄워 픽스처 제공
+    채널 헤더가 http면 HTTP 응답을, 아니면 DOM 스냅샷을 우선 반환
+    응답 본문의 원래 origin은 로컬 서버 주소로 바꿔 링크도 로컬로 향하게 한다
+    """
+
+    def __init__(self, fixture_dir: str):
+        self.fixture_dir = fixture_dir
+        with open(os.path.join(fixture_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            entries = json.load(f)["entries"]
+
+        # origin -> {(채널, 경로): 항목}
+        self._routes: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        for entry in entries:
+            origin, path = _split_url(entry["url"])
+            self._routes.setdefault(origin, {})[(entry["channel"], path)] = entry
+
+        self._servers: Dict[str, ThreadingHTTPServer] = {}
+        self.origin_map: Dict[str, str] = {}
+
+    def __enter__(self) -> "ReplayServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def start(self):
+        for origin in self._routes:
+            server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler(origin))
+            self._servers[origin] = server
+            self.origin_map[origin] = f"http://127.0.0.1:{server.server_address[1]}"
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(f"Replay servers started: {self.origin_map}")
+
+    def stop(self):
+        for server in self._servers.values():
+            server.shutdown()
+            server.server_close()
+        self._servers = {}
+
+    def rewrite(self, url: str) -> str:
+        """기록된 origin의 URL을 로컬 서버 URL로 변환"""
+        for origin, local in self.origin_map.items():
+            if url.startswith(origin):
+                return local + url[len(origin) :]
+        return url
+
+    def _rewrite_body(self, body: bytes) -> bytes:
+        for origin, local in self.origin_map.items():
+            body = body.replace(origin.encode("utf-8"), local.encode("utf-8"))
+        return body
+
+    def _lookup(self, origin: str, channel: str, path: str) -> Optional[Dict[str, Any]]:
+        routes = self._routes[origin]
+        other = CHANNEL_DOM if channel == CHANNEL_HTTP else CHANNEL_HTTP
+        return routes.get((channel, path)) or routes.get((other, path))
+
+    def _handler(self, origin: str):
+        replay = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                channel = (
+                    CHANNEL_HTTP
+                    if self.headers.get(REPLAY_CHANNEL_HEADER) == CHANNEL_HTTP
+                    else CHANNEL_DOM
+                )
+                entry = replay._lookup(origin, channel, self.path)
+                if entry is None:
+                    self.send_error(404)
+                    return
+
+                with open(
+                    os.path.join(replay.fixture_dir, entry["body_file"]), "rb"
+                ) as f:
+                    body = replay._rewrite_body(f.read())
+                self.send_response(entry["status"])
+                if entry.get("content_type"):
+                    self.send_header("Content-Type", entry["content_type"])
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Replay {origin}{self.path}: {format % args}")
+
+        return Handler
+
+
+def fixture_dir_for(brand: str) -> str:
+    return os.path.join(settings.fixtures_dir, brand)
+
+
+def prepare_recording(crawler, recorder: FixtureRecorder):
+    """크롤러가 받는 모든 응답과 DOM 스냅샷을 기록하도록 설정"""
+    crawler.recorder = recorder
+    # 조건부 요청(304)이 아닌 전체 응답을 기록
+    crawler.http_cache = None
+    crawler.session.hooks["response"].append(recorder.record_requests_response)
+
+
+def prepare_replay(crawler, server: ReplayServer):
+    """크롤러의 *_url 속성을 로컬 재생 서버로 바꾸고 HTTP 채널 헤더 설정"""
+    crawler.replay_mode = True
+    crawler.http_cache = None
+    crawler.session.headers[REPLAY_CHANNEL_HEADER] = CHANNEL_HTTP
+    for name, value in list(vars(crawler).items()):
+        if name.endswith("_url") and isinstance(value, str):
+            setattr(crawler, name, server.rewrite(value))
+
+
+def record_brand(brand: str) -> int:
+    """브랜드 크롤러를 실제 사이트에 한 번 실행하며 픽스처 기록 (기록된 항목 수 반환)"""
+    from src.crawlers import get_crawler
+
+    recorder = FixtureRecorder(fixture_dir_for(brand))
+    crawler = get_crawler(brand)
+    prepare_recording(crawler, recorder)
+    items = crawler.crawl()
+    count = recorder.save()
+    logger.info(f"Recorded {count} fixtures for {brand} ({len(items)} items crawled)")
+    return count
+
+
+def replay_brand(brand: str, rounds: int = 1) -> Dict[str, Any]:
+    """기록된 픽스처로 크롤러를 rounds번 실행하고 처리량 측정"""
+    from src.crawlers import get_crawler
+
+    reset_metrics()
+    durations: List[float] = []
+    item_count = 0
+    with ReplayServer(fixture_dir_for(brand)) as server:
+        for _ in range(max(1, rounds)):
+            crawler = get_crawler(brand)
+            prepare_replay(crawler, server)
+            started = time.monotonic()
+            items = crawler.crawl()
+            durations.append(time.monotonic() - started)
+            item_count = len(items)
+
+    get_metrics().finish()
+    total = sum(durations)
+    stats = {
+        "brand": brand,
+        "rounds": len(durations),
+        "items": item_count,
+        "total_seconds": round(total, 3),
+        "avg_seconds": round(total / len(durations), 3),
+        "items_per_second": round(item_count * len(durations) / total, 2) if total else None,
+        "stages": get_metrics().report()["brands"].get(brand, {}).get("stages", {}),
+    }
+    logger.info(f"Replay stats: {json.dumps(stats, ensure_ascii=False)}")
+    return stats
@@ -0,0 +1,207 @@
+"""
+DB 호출 복원력 - 지터 지수 백오프 재시도와 서킷 브레이커
+"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import httpx
+from loguru import logger
+from postgrest.exceptions import APIError
+
+# 일시적 오류로 보는 PostgreSQL 오류 코드 접두어
+# 08: 연결 오류, 53: 자원 부족, 57: 운영자 개입(쿼리 취소 등), 40: 직렬화 실패/교착
+TRANSIENT_SQLSTATE_PREFIXES = ("08", "53", "57", "40")
+
+# PostgREST 자체 연결/스키마 캐시 오류
+TRANSIENT_POSTGREST_CODES = {"PGRST000", "PGRST001", "PGRST002"}
+
+
+class CircuitOpenError(Exception):
+    """서킷 브레이커가 열려 있어 호출하지 않고 바로 실패"""
+
+
+def is_transient_error(error: Exception) -> bool:
+    """재시도하면 성공할 수 있는 오류인지 (네트워크, 5xx, 429, 연결 관련 DB 오류)"""
+    if isinstance(error, (httpx.TransportError, OSError)):
+        return True
+    if isinstance(error, APIError):
+        code = error.code
+        if isinstance(code, int):
+            return code >= 500 or code == 429
+        if not code:
+            return False
+        return code in TRANSIENT_POSTGREST_CODES or code.startswith(
+            TRANSIENT_SQLSTATE_PREFIXES
+        )
+    return False
+
+
+class RetryPolicy:
+    """지터를 적용한 지수 백오프 (full jitter)"""
+
+    def __init__(self, max_attempts: int, base_delay: float, max_delay: float):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (1부터 시작)"""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 이상이면 열리고, reset_timeout 동안 호출을 막는다
+    이후 한 번의 시험 호출(half-open)이 성공하면 닫힌다
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """호출 가능 여부 (열린 상태에서 reset_timeout이 지나면 시험 호출 1회 허용)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if (
+                self.state == self.OPEN
+                and time.monotonic() - self._opened_at >= self.reset_timeout
+            ):
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> bool:
+        """실패 기록 (이번 실패로 서킷이 열렸으면 True)"""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or (
+                self.state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                return True
+            return False
+
+
+class ResilienceMetrics:
+    """호출/재시도/실패/서킷 차단 횟수"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {
+            "calls": 0,
+            "retries": 0,
+            "failures": 0,
+            "circuit_opened": 0,
+            "circuit_rejected": 0,
+        }
+
+    def increment(self, name: str, value: int = 1):
+        with self._lock:
+            self._counts[name] = self._counts.get(name, 0) + value
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+class ResilientExecutor:
+    """재시도 정책과 서킷 브레이커를 함께 적용해 호출 실행"""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        breaker: CircuitBreaker,
+        metrics: Optional[ResilienceMetrics] = None,
+    ):
+        self.policy = policy
+        self.breaker = breaker
+        self.metrics = metrics or ResilienceMetrics()
+
+    def call(self, func: Callable[[], Any], idempotent: bool = True, label: str = "") -> Any:
+        """
+        func 실행 - 멱등 호출만 일시적 오류에 재시도
+        서킷이 열려 있으면 CircuitOpenError, 재시도 후에도 실패하면 마지막 오류를 그대로 발생
+        """
+        attempts = self.policy.max_attempts if idempotent else 1
+        for attempt in range(1, attempts + 1):
+            self._before_call(label)
+            try:
+                result = func()
+            except Exception as e:
+                time.sleep(self._after_failure(e, attempt, attempts, label))
+            else:
+                self.breaker.record_success()
+                return result
+
+    async def call_async(
+        self,
+        func: Callable[[], Awaitable[Any]],
+        idempotent: bool = True,
+        label: str = "",
+    ) -> Any:
+        """call()의 비동기 버전 (재시도 대기 중 이벤트 루프를 막지 않음)"""
+        attempts = self.policy.max_attempts if idempotent else 1
+        for attempt in range(1, attempts + 1):
+            self._before_call(label)
+            try:
+                result = await func()
+            except Exception as e:
+                await asyncio.sleep(self._after_failure(e, attempt, attempts, label))
+            else:
+                self.breaker.record_success()
+                return result
+
+    def _before_call(self, label: str):
+        if not self.breaker.allow():
+            self.metrics.increment("circuit_rejected")
+            raise CircuitOpenError(f"Circuit open, skipping {label or 'call'}")
+        self.metrics.increment("calls")
+
+    def _after_failure(
+        self, error: Exception, attempt: int, attempts: int, label: str
+    ) -> float:
+        """
+        실패 처리 - 재시도할 경우 대기 시간을 반환하고, 아니면 오류를 다시 발생
+        """
+        if not is_transient_error(error):
+            # 제약 조건 위반 등은 서비스 장애가 아니므로 서킷에 반영하지 않음
+            self.breaker.record_success()
+            raise error
+
+        self.metrics.increment("failures")
+        if self.breaker.record_failure():
+            # 서킷이 열렸으면 재시도하지 않고 바로 실패
+            self.metrics.increment("circuit_opened")
+            logger.error(f"Circuit opened after repeated failures: {str(error)}")
+            raise error
+        if attempt >= attempts:
+            raise error
+
+        delay = self.policy.delay(attempt)
+        self.metrics.increment("retries")
+        logger.warning(
+            f"Retrying {label or 'call'} in {delay:.2f}s "
+            f"({attempt}/{attempts - 1}): {str(error)}"
+        )
+        return delay
@@ -1,94 +1,808 @@
+import asyncio
+import queue
 import schedule
+import threading
 import time
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from loguru import logger
-from src.crawlers import get_crawler, get_available_brands
-from src.database import SupabaseManager
+from src.crawlers import (
+    get_crawler,
+    get_available_brands,
+    AsyncBaseCrawler,
+    run_in_daemon_thread,
+)
+from src.database import SupabaseManager, build_price_history_data
+from src.async_database import AsyncSupabaseManager
+from src.crawlers.driver_pool import get_driver_pool
+from src.metrics import (
+    STAGE_CRAWL,
+    STAGE_DB_WRITE,
+    STAGE_DEDUP,
+    get_metrics,
+    reset_metrics,
+)
+from src.spool import CrawlSpool
+from src.product_index import (
+    ProductIndex,
+    build_entries,
+    find_changes,
+    is_dummy,
+    normalize_name,
+)
 from config import settings
 
+# 값이 바뀌면 가격 이력에 기록하는 필드
+PRICE_FIELDS = {"price", "set_price", "available"}
+
 
 class CrawlerScheduler:
-    def __init__(self):
-        self.db_manager = SupabaseManager()
+    def __init__(
+        self,
+        db_manager: Optional[SupabaseManager] = None,
+        product_index_path: Optional[str] = None,
+        spool_path: Optional[str] = None,
+    ):
+        # 인자를 넘기면 설정 대신 사용 (부하 테스트에서 로컬 DB/임시 파일 사용)
+        self.db_manager = db_manager or SupabaseManager()
+        self.product_index = (
+            ProductIndex(product_index_path or settings.product_index_path)
+            if settings.use_product_index
+            else None
+        )
+        if self.product_index:
+            # 로컬 인덱스의 브랜드 ID로 캐시를 채워 브랜드 조회도 생략
+            self.db_manager.seed_brand_cache(self.product_index.brand_ids())
+        self.spool = (
+            CrawlSpool(spool_path or settings.spool_path)
+            if settings.spool_enabled
+            else None
+        )
+        # async 모드 실행 중에만 설정 - (비동기 DB 매니저, 이벤트 루프)
+        self._async_writer: Optional[
+            Tuple[AsyncSupabaseManager, asyncio.AbstractEventLoop]
+        ] = None
+        # async 모드 실행의 비동기 DB 매니저 호출 지표 (실행마다 새로 생성)
+        self._async_db_metrics: Dict[str, int] = {}
         logger.info("Crawler Scheduler initialized")
 
-    def run_single_crawler(self, brand: str, auto_confirm: bool = False):
-        """단일 브랜드 크롤링 실행"""
+    def run_single_crawler(
+        self,
+        brand: str,
+        auto_confirm: bool = False,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """
+        단일 브랜드 크롤링 실행 (브랜드별 결과 반환)
+        cancel이 설정되면(타임아웃) 크롤링이 끝나도 결과를 스풀/DB에 저장하지 않음
+        """
+        result = self._new_result(brand)
+        try:
+            logger.info(f"Starting crawl for {brand}")
+            crawler = get_crawler(brand)
+            known_products = self._preload_known_products(crawler)
+            with get_metrics().span(STAGE_CRAWL, brand):
+                burger_data = crawler.crawl()
+            self._record_crawler_metrics(brand, crawler)
+            self._mark_unchanged(crawler, result)
+            self._process_crawled_data(
+                brand, burger_data, result, auto_confirm, known_products, cancel=cancel
+            )
+            self._commit_crawler_cache(crawler, result)
+
+        except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
+            logger.error(f"Error in crawling {brand}: {str(e)}")
+
+        return result
+
+    def save_items(
+        self, brand: str, burger_data: List[Dict[str, Any]], auto_confirm: bool = True
+    ) -> Dict[str, Any]:
+        """크롤러 없이 이미 수집된 데이터를 크롤링 결과와 같은 경로로 저장 (부하 테스트 등)"""
+        result = self._new_result(brand)
+        return self._process_crawled_data(brand, burger_data, result, auto_confirm)
+
+    async def run_single_crawler_async(
+        self, brand: str, cancel: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """
+        단일 브랜드 크롤링을 이벤트 루프에서 실행
+        비동기 크롤러는 crawl_async()를 직접 await하고, 동기 크롤러와 DB 조회/저장은
+        데몬 스레드로 위임해 타임아웃 시 멈춘 작업을 기다리지 않음
+        """
+        result = self._new_result(brand)
         try:
             logger.info(f"Starting crawl for {brand}")
             crawler = get_crawler(brand)
-            burger_data = crawler.crawl()
-
-            if burger_data:
-                # 중복 체크 후 신제품 필터링
-                new_items = []
-                for item in burger_data:
-                    if not self.db_manager.check_duplicate_product(
-                        item["name"], item["brand_name"]
-                    ):
-                        new_items.append(item)
-
-                if new_items:
-                    # 신제품 정보 출력
-                    logger.info(f"\n{'='*50}")
-                    logger.info(f"발견된 신제품: {len(new_items)}개 ({brand})")
-                    logger.info(f"{'='*50}")
-
-                    for i, item in enumerate(new_items, 1):
-                        logger.info(f"\n[{i}] {item['name']}")
-                        logger.info(f"    가격: {item.get('price', 'N/A')}원")
-                        logger.info(f"    설명: {item.get('description', 'N/A')}")
-                        if item.get("image_url"):
-                            logger.info(f"    이미지: {item['image_url']}")
-
-                    logger.info(f"\n{'='*50}")
-
-                    # 사용자 확인 (auto_confirm이 False인 경우에만)
-                    if not auto_confirm:
-                        while True:
-                            user_input = (
-                                input(
-                                    f"\n이 {len(new_items)}개의 신제품을 데이터베이스에 추가하시겠습니까? (y/n): "
-                                )
-                                .strip()
-                                .lower()
-                            )
-                            if user_input in ["y", "yes", "네", "ㅇ"]:
-                                break
-                            elif user_input in ["n", "no", "아니오", "ㄴ"]:
-                                logger.info("사용자가 추가를 취소했습니다.")
-                                return
-                            else:
-                                print("y(예) 또는 n(아니오)로 답해주세요.")
-
-                    # 데이터베이스에 저장
-                    success = self.db_manager.insert_bulk_burger_data(new_items)
-                    if success:
-                        logger.info(
-                            f"Successfully saved {len(new_items)} new items for {brand}"
-                        )
-                    else:
-                        logger.error(f"Failed to save data for {brand}")
+            known_products = await run_in_daemon_thread(
+                self._preload_known_products, crawler
+            )
+            with get_metrics().span(STAGE_CRAWL, brand):
+                if isinstance(crawler, AsyncBaseCrawler):
+                    burger_data = await crawler.crawl_async()
                 else:
-                    logger.info(f"No new items found for {brand}")
-            else:
-                logger.warning(f"No data crawled for {brand}")
+                    burger_data = await run_in_daemon_thread(crawler.crawl)
+            self._record_crawler_metrics(brand, crawler)
+            self._mark_unchanged(crawler, result)
+
+            await run_in_daemon_thread(
+                self._process_crawled_data,
+                brand,
+                burger_data,
+                result,
+                True,
+                known_products,
+                cancel=cancel,
+            )
+            self._commit_crawler_cache(crawler, result)
 
         except Exception as e:
+            result["status"] = "failed"
+            result["error"] = str(e)
             logger.error(f"Error in crawling {brand}: {str(e)}")
 
-    def run_all_crawlers(self):
-        """모든 브랜드 크롤링 실행"""
-        logger.info("Starting crawl for all brands")
+        return result
+
+    def _preload_known_products(self, crawler) -> Optional[Dict[str, set]]:
+        """
+        증분 크롤링: 크롤링 전에 기존 제품명을 크롤러에 전달해 상세 페이지 수집 생략
+        같은 목록을 중복 체크에도 재사용하도록 반환
+        """
+        if not settings.incremental_crawl:
+            return None
+
+        known_products = self._load_known_products(crawler.brand_name)
+        if known_products is None:
+            logger.warning(
+                f"Could not load known products for {crawler.brand_name}, running full crawl"
+            )
+            return None
+
+        crawler.set_known_products(known_products)
+        logger.info(f"Loaded {len(known_products)} known products for incremental crawl")
+        return {crawler.brand_name: known_products}
+
+    def _load_known_products(self, brand_name: str) -> Optional[set]:
+        """
+        브랜드의 기존 제품명(정규화된 이름) 조회 - 로컬 인덱스 우선
+        인덱스가 오래되었으면 Supabase에서 재구성하고, Supabase 장애 시 마지막 인덱스 사용
+        조회할 수 없으면 None
+        """
+        index = self.product_index
+        if index is None:
+            names = self.db_manager.get_existing_product_names(brand_name)
+            return None if names is None else {normalize_name(name) for name in names}
+
+        max_age = settings.product_index_max_age_hours * 3600
+        if not index.is_fresh(brand_name, max_age):
+            if not self._rebuild_index(brand_name):
+                if index.synced_at(brand_name) is None:
+                    return None
+                logger.warning(f"Using stale local product index for {brand_name}")
+
+        return index.known_names(brand_name)
+
+    def rebuild_product_index(self) -> int:
+        """DB의 모든 브랜드에 대해 로컬 제품 인덱스 재구성 (성공한 브랜드 수 반환)"""
+        if self.product_index is None:
+            logger.warning("Product index is disabled")
+            return 0
+        rebuilt = 0
+        for brand_name in self.db_manager.get_brand_ids():
+            if self._rebuild_index(brand_name):
+                rebuilt += 1
+        return rebuilt
+
+    def _rebuild_index(self, brand_name: str) -> bool:
+        """
+        DB에서 브랜드 인덱스를 재구성하고, 삽입 결과를 확인하지 못했던 제품 중
+        실제로 저장된 제품의 첫 가격 관측값 기록
+        """
+        if not self.product_index.rebuild(self.db_manager, brand_name):
+            return False
+
+        names = self.product_index.unconfirmed_names(brand_name)
+        if names:
+            entries = self.product_index.get_entries(brand_name)
+            stored = {
+                entries[name]["product_id"]: entries[name]["snapshot"]
+                for name in names
+                if name in entries and entries[name]["product_id"]
+            }
+            # 저장되지 않은 제품은 다음 크롤링에서 신제품으로 다시 삽입됨
+            if self._record_first_observations(stored):
+                self.product_index.clear_unconfirmed(brand_name, names)
+        return True
+
+    def _record_first_observations(self, observations: Dict[int, Dict[str, Any]]) -> bool:
+        """
+        PriceHistory 행이 아직 없는 제품만 첫 관측값 기록
+        (삽입 응답이 유실되어 기존 제품으로 처리된 제품 보완, 실패하면 False)
+        """
+        if not settings.track_price_history or not observations:
+            return True
+        observed = self.db_manager.get_observed_product_ids(list(observations))
+        if observed is None:
+            return False
+        return self._record_price_history(
+            (product_id, data)
+            for product_id, data in observations.items()
+            if product_id not in observed
+        )
+
+    def _record_crawler_metrics(self, brand: str, crawler):
+        """크롤러의 대기 시간 요약을 실행 지표에 추가"""
+        get_metrics().set_info("waits", crawler.wait_timings.summary(), brand)
+
+    def _mark_unchanged(self, crawler, result: Dict[str, Any]):
+        """메뉴 페이지 변경이 없어 크롤링을 생략한 경우 결과에 표시"""
+        if crawler.menu_unchanged:
+            result["status"] = "unchanged"
+
+    def _commit_crawler_cache(self, crawler, result: Dict[str, Any]):
+        """
+        결과가 빠짐없이 저장된 경우에만 크롤러의 HTTP 캐시 반영
+        (일부라도 실패하면 다음 실행이 unchanged로 생략되지 않고 다시 크롤링)
+        """
+        if result["status"] == "unchanged" or (
+            result["status"] == "success" and self._is_saved(result)
+        ):
+            crawler.commit_http_cache()
+
+    def _new_result(self, brand: str) -> Dict[str, Any]:
+        """브랜드별 실행 결과 초기값"""
+        return {
+            "brand": brand,
+            "status": "success",
+            "crawled": 0,
+            "new_items": 0,
+            "saved": 0,
+            "updated": 0,
+            "error": None,
+        }
+
+    def _process_crawled_data(
+        self,
+        brand: str,
+        burger_data: List[Dict[str, Any]],
+        result: Dict[str, Any],
+        auto_confirm: bool,
+        known_products: Optional[Dict[str, set]] = None,
+        spool: bool = True,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """
+        크롤링 결과를 스풀에 먼저 기록한 뒤 데이터베이스에 저장
+        저장이 끝까지 성공한 경우에만 스풀 항목을 확인 처리
+        """
+        if self._is_cancelled(brand, result, cancel):
+            return result
+
+        keys = []
+        if spool and self.spool and burger_data:
+            keys = self.spool.append(brand, burger_data)
+
+        self._save_crawled_data(
+            brand, burger_data, result, auto_confirm, known_products, cancel
+        )
+
+        if keys and self._is_saved(result):
+            self.spool.ack(keys)
+        return result
+
+    def _is_cancelled(
+        self,
+        brand: str,
+        result: Dict[str, Any],
+        cancel: Optional[threading.Event],
+    ) -> bool:
+        """타임아웃으로 취소된 크롤링이면 결과를 버리고 True"""
+        if cancel is None or not cancel.is_set():
+            return False
+        result["status"] = "timeout"
+        logger.warning(f"Discarding results for {brand}: crawl timed out")
+        return True
+
+    def _is_saved(self, result: Dict[str, Any]) -> bool:
+        """크롤링 결과가 빠짐없이 처리되었는지 (사용자 취소 포함)"""
+        if result["status"] == "cancelled":
+            return True
+        return (
+            result["status"] == "success"
+            and result["error"] is None
+            and result["saved"] == result["new_items"]
+        )
+
+    def replay_spool(self) -> Dict[str, int]:
+        """이전 실행에서 저장하지 못한 스풀 항목을 재처리"""
+        if self.spool is None:
+            return {"brands": 0, "replayed": 0, "failed": 0}
+
+        stats = self.spool.replay(
+            self._replay_spooled_items,
+            max_attempts=settings.spool_replay_attempts,
+            backoff_seconds=settings.spool_retry_backoff_seconds,
+        )
+        if stats["brands"]:
+            logger.info(
+                f"Spool replay: {stats['replayed']} replayed, {stats['failed']} still pending"
+            )
+        return stats
+
+    def _replay_spooled_items(self, brand: str, items: List[Dict[str, Any]]) -> bool:
+        """
+        스풀 항목 저장 - DB 기준으로 인덱스를 다시 맞춘 뒤 처리해
+        응답만 유실된 이전 저장이 있어도 이미 있는 제품은 다시 넣지 않고,
+        그런 제품에 빠진 첫 가격 관측값을 기록
+        """
+        brand_names = {item["brand_name"] for item in items}
+        if self.product_index:
+            for brand_name in brand_names:
+                if not self._rebuild_index(brand_name):
+                    return False
+
+        result = self._new_result(brand)
+        self._process_crawled_data(brand, items, result, True, spool=False)
+        if not self._is_saved(result):
+            return False
+
+        if self.product_index is None:
+            # 인덱스가 없으면 스풀 항목 중 DB에 있는 제품을 직접 확인
+            for brand_name in brand_names:
+                products = self.db_manager.get_products_with_nutrition(brand_name)
+                if products is None:
+                    return False
+                entries = build_entries(products)
+                stored = {}
+                for item in items:
+                    entry = entries.get(normalize_name(item["name"]))
+                    if item["brand_name"] == brand_name and entry and not is_dummy(item):
+                        stored[entry["product_id"]] = entry["snapshot"]
+                if not self._record_first_observations(stored):
+                    return False
+        return True
+
+    def _save_crawled_data(
+        self,
+        brand: str,
+        burger_data: List[Dict[str, Any]],
+        result: Dict[str, Any],
+        auto_confirm: bool,
+        known_products: Optional[Dict[str, set]] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> Dict[str, Any]:
+        """크롤링 결과에서 신제품을 골라 (확인 후) 데이터베이스에 저장"""
+        result["crawled"] = len(burger_data) if burger_data else 0
+
+        if burger_data:
+            # 중복 체크 후 신제품 필터링 (브랜드별 기존 제품명 일괄 조회)
+            with get_metrics().span(STAGE_DEDUP, brand):
+                new_items = self._filter_new_items(burger_data, known_products)
+            if new_items is None:
+                result["status"] = "failed"
+                result["error"] = "Duplicate check unavailable"
+                logger.error(f"Skipping save for {brand}: duplicate check failed")
+                return result
+
+            result["new_items"] = len(new_items)
+
+            # 중복 확인 중 타임아웃되었으면 쓰기 전에 중단
+            if self._is_cancelled(brand, result, cancel):
+                return result
+
+            # 기존 제품 중 가격/설명/영양정보가 바뀐 항목 갱신
+            if settings.detect_changes:
+                self._update_changed_items(brand, burger_data, result, auto_confirm)
+
+            if new_items:
+                # 신제품 정보 출력
+                logger.info(f"\n{'='*50}")
+                logger.info(f"발견된 신제품: {len(new_items)}개 ({brand})")
+                logger.info(f"{'='*50}")
+
+                for i, item in enumerate(new_items, 1):
+                    logger.info(f"\n[{i}] {item['name']}")
+                    logger.info(f"    가격: {item.get('price', 'N/A')}원")
+                    logger.info(f"    설명: {item.get('description', 'N/A')}")
+                    if item.get("image_url"):
+                        logger.info(f"    이미지: {item['image_url']}")
+
+                logger.info(f"\n{'='*50}")
+
+                # 사용자 확인 (auto_confirm이 False인 경우에만)
+                if not auto_confirm and not self._confirm(
+                    f"이 {len(new_items)}개의 신제품을 데이터베이스에 추가하시겠습니까?"
+                ):
+                    logger.info("사용자가 추가를 취소했습니다.")
+                    result["status"] = "cancelled"
+                    return result
+
+                # 데이터베이스에 저장
+                with get_metrics().span(STAGE_DB_WRITE, brand):
+                    product_ids = self._insert_new_items(new_items)
+                get_metrics().increment("items_inserted", len(product_ids), brand)
+                if product_ids:
+                    result["saved"] = len(product_ids)
+                    if self.product_index:
+                        self.product_index.record_inserted(new_items, product_ids)
+                # 신제품의 첫 가격 관측값 (더미 대체 데이터는 실제 가격이 아니므로 제외)
+                first_observations = [
+                    (product_id, new_items[index])
+                    for index, product_id in product_ids.items()
+                    if not is_dummy(new_items[index])
+                ]
+                unconfirmed = [
+                    item
+                    for index, item in enumerate(new_items)
+                    if index not in product_ids and not is_dummy(item)
+                ]
+                if not self._record_price_history(first_observations):
+                    # 스풀 항목을 남겨 재처리 때 빠진 관측값을 다시 기록
+                    result["error"] = "Failed to record first price observations"
+                    unconfirmed.extend(item for _, item in first_observations)
+                if self.product_index and (
+                    unconfirmed or len(product_ids) < len(new_items)
+                ):
+                    # 응답을 받지 못한 청크도 실제로는 저장되었을 수 있으므로
+                    # 다음 중복 확인 때 DB에서 인덱스를 다시 구성하고, 그때 찾은 제품 중
+                    # 가격 이력이 없는 제품의 첫 관측값을 기록
+                    self.product_index.record_unconfirmed(unconfirmed)
+                    for brand_name in {item["brand_name"] for item in new_items}:
+                        self.product_index.invalidate(brand_name)
+                if product_ids:
+                    logger.info(
+                        f"Successfully saved {len(product_ids)} new items for {brand}"
+                    )
+                else:
+                    result["status"] = "failed"
+                    logger.error(f"Failed to save data for {brand}")
+            else:
+                logger.info(f"No new items found for {brand}")
+        elif result["status"] == "unchanged":
+            logger.info(f"Menu unchanged for {brand}, nothing to process")
+        else:
+            logger.warning(f"No data crawled for {brand}")
+
+        return result
+
+    def _insert_new_items(self, new_items: List[Dict[str, Any]]) -> Dict[int, int]:
+        """
+        신제품 일괄 삽입
+        async 모드에서는 (저장 스레드에서) 이벤트 루프의 비동기 매니저로 보내
+        모든 브랜드의 삽입이 DB_MAX_CONCURRENCY 제한을 공유하며 동시에 전송됨
+        """
+        if self._async_writer is None:
+            return self.db_manager.insert_burger_batch(new_items)
+        async_db, loop = self._async_writer
+        return asyncio.run_coroutine_threadsafe(
+            async_db.insert_burger_batch(new_items), loop
+        ).result()
+
+    def _update_changed_items(
+        self,
+        brand: str,
+        burger_data: List[Dict[str, Any]],
+        result: Dict[str, Any],
+        auto_confirm: bool,
+    ):
+        """저장된 내용 해시와 비교해 바뀐 기존 제품만 upsert"""
+        items_by_brand: Dict[str, List[Dict[str, Any]]] = {}
+        for item in burger_data:
+            items_by_brand.setdefault(item["brand_name"], []).append(item)
+
+        changes = []
+        with get_metrics().span(STAGE_DEDUP, brand):
+            for brand_name, items in items_by_brand.items():
+                entries = self._load_product_entries(brand_name)
+                if entries is None:
+                    logger.warning(f"Skipping change detection for {brand_name}")
+                    continue
+                changes.extend(find_changes(entries, items))
+
+        if not changes:
+            return
+
+        logger.info(f"변경된 기존 제품: {len(changes)}개 ({brand})")
+        for change in changes:
+            logger.info(
+                f"    - {change['snapshot']['name']}: {', '.join(change['changed_fields'])}"
+            )
+
+        if not auto_confirm and not self._confirm(
+            f"이 {len(changes)}개의 변경 사항을 데이터베이스에 반영하시겠습니까?"
+        ):
+            logger.info("사용자가 변경 반영을 취소했습니다.")
+            return
+
+        with get_metrics().span(STAGE_DB_WRITE, brand):
+            updated = self.db_manager.upsert_changed_products(changes)
+        get_metrics().increment("items_updated", len(updated), brand)
+        result["updated"] = len(updated)
+        applied = [change for change in changes if change["product_id"] in updated]
+        if self.product_index:
+            self.product_index.record_changes(applied)
+
+        # 가격/판매 여부가 바뀐 제품만 이력에 추가
+        self._record_price_history(
+            (change["product_id"], change["snapshot"])
+            for change in applied
+            if PRICE_FIELDS.intersection(change["changed_fields"])
+        )
+        if len(updated) < len(changes):
+            result["error"] = f"Failed to update {len(changes) - len(updated)} items"
+            logger.error(
+                f"Failed to update {len(changes) - len(updated)} changed items for {brand}"
+            )
+
+    def _record_price_history(
+        self, observations: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> bool:
+        """(product_id, 가격 정보) 관측값을 PriceHistory에 일괄 추가 (모두 저장되면 True)"""
+        if not settings.track_price_history:
+            return True
+        observed_at = datetime.now(timezone.utc)
+        rows = [
+            build_price_history_data(product_id, data, observed_at)
+            for product_id, data in observations
+        ]
+        if not rows:
+            return True
+        with get_metrics().span(STAGE_DB_WRITE):
+            return self.db_manager.append_price_history(rows) == len(rows)
+
+    def _load_product_entries(self, brand_name: str) -> Optional[Dict[str, Any]]:
+        """변경 감지용 기존 제품 항목 (로컬 인덱스, 없으면 DB에서 조회)"""
+        if self.product_index:
+            return self.product_index.get_entries(brand_name)
+
+        products = self.db_manager.get_products_with_nutrition(brand_name)
+        return None if products is None else build_entries(products)
+
+    def _confirm(self, message: str) -> bool:
+        """사용자에게 y/n 확인"""
+        while True:
+            user_input = input(f"\n{message} (y/n): ").strip().lower()
+            if user_input in ["y", "yes", "네", "ㅇ"]:
+                return True
+            elif user_input in ["n", "no", "아니오", "ㄴ"]:
+                return False
+            else:
+                print("y(예) 또는 n(아니오)로 답해주세요.")
+
+    def _filter_new_items(
+        self,
+        burger_data: List[Dict[str, Any]],
+        known_products: Optional[Dict[str, set]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """DB에 없는 신제품만 메모리에서 필터링 (조회 실패 시 None)"""
+        # 증분 크롤링 때 미리 조회한 브랜드별 목록 재사용
+        existing_by_brand: Dict[str, set] = {
+            brand_name: set(names)
+            for brand_name, names in (known_products or {}).items()
+        }
+
+        new_items = []
+        for item in burger_data:
+            brand_name = item["brand_name"]
+            if brand_name not in existing_by_brand:
+                existing = self._load_known_products(brand_name)
+                if existing is None:
+                    return None
+                existing_by_brand[brand_name] = existing
+
+            name_key = normalize_name(item["name"])
+            if name_key not in existing_by_brand[brand_name]:
+                new_items.append(item)
+                # 같은 크롤링 결과 안의 중복 제품도 제외
+                existing_by_brand[brand_name].add(name_key)
+        return new_items
+
+    def _run_timed_crawler(
+        self, brand: str, cancel: Optional[threading.Event] = None
+    ) -> Dict[str, Any]:
+        """브랜드 크롤링을 실행하고 소요 시간을 결과에 기록"""
+        started = time.monotonic()
+        # 자동 확인으로 실행
+        result = self.run_single_crawler(brand, auto_confirm=True, cancel=cancel)
+        result["duration"] = round(time.monotonic() - started, 2)
+        return result
+
+    def run_all_crawlers(self, mode: Optional[str] = None) -> List[Dict[str, Any]]:
+        """모든 브랜드 크롤링 실행 (sequential / concurrent / async)"""
+        mode = mode or settings.crawl_mode
+        brands = get_available_brands()
+        logger.info(f"Starting crawl for all brands ({mode} mode)")
         start_time = datetime.now()
+        reset_metrics()
+        # DB 호출 지표는 프로세스 누적값이므로 시작 시점 값을 빼서 이번 실행분만 기록
+        db_metrics_before = self.db_manager.get_resilience_metrics()
+        self._async_db_metrics = {}
+
+        # 이전 실행에서 DB 장애로 남은 스풀 항목 먼저 저장
+        self.replay_spool()
 
-        for brand in get_available_brands():
-            self.run_single_crawler(brand, auto_confirm=True)  # 자동 확인으로 실행
-            time.sleep(settings.request_delay)  # 요청 간 지연
+        if mode == "concurrent":
+            results = self._run_concurrent(brands)
+        elif mode == "async":
+            results = asyncio.run(self._run_async(brands))
+        else:
+            results = []
+            for brand in brands:
+                results.append(self._run_timed_crawler(brand))
+                time.sleep(settings.request_delay)  # 요청 간 지연
 
         end_time = datetime.now()
         duration = end_time - start_time
+        self._log_run_summary(results)
+        db_metrics = self._db_metrics_since(db_metrics_before)
+        logger.info(f"DB calls: {db_metrics}")
+        self._export_run_metrics(results, db_metrics)
         logger.info(f"Completed crawl for all brands in {duration}")
+        return results
+
+    def _run_concurrent(self, brands: List[str]) -> List[Dict[str, Any]]:
+        """
+        브랜드별 크롤러를 데몬 스레드에서 병렬 실행 (브랜드별 타임아웃 적용)
+        실행 슬롯은 이 루프가 관리하며, 타임아웃된 브랜드는 취소 플래그를 설정하고
+        슬롯을 바로 반납하므로 멈춘 스레드가 대기 중인 브랜드를 막지 않음
+        전체 실행 마감 시간까지 시작하지 못한 브랜드도 timeout으로 기록
+        """
+        timeout = settings.crawl_timeout_seconds
+        deadline = time.monotonic() + settings.crawl_run_timeout_seconds
+        workers = max(1, settings.max_crawl_workers)
+        finished: "queue.Queue[Tuple[str, Dict[str, Any]]]" = queue.Queue()
+        pending = list(brands)
+        running: Dict[str, Tuple[float, threading.Event]] = {}
+        results: Dict[str, Dict[str, Any]] = {}
+
+        def run(brand: str, cancel: threading.Event):
+            try:
+                result = self._run_timed_crawler(brand, cancel)
+            except Exception as e:
+                result = {"brand": brand, "status": "failed", "error": str(e)}
+            finished.put((brand, result))
+
+        while len(results) < len(brands):
+            # 빈 슬롯만큼 대기 중인 브랜드 시작
+            now = time.monotonic()
+            while pending and len(running) < workers and now < deadline:
+                brand = pending.pop(0)
+                cancel = threading.Event()
+                running[brand] = (now, cancel)
+                threading.Thread(
+                    target=run, args=(brand, cancel), name=f"crawler-{brand}", daemon=True
+                ).start()
+
+            if pending and now >= deadline:
+                for brand in pending:
+                    logger.error(f"Crawl for {brand} not started before the run deadline")
+                    results[brand] = self._timeout_result(
+                        brand, 0, "Not started before the run deadline"
+                    )
+                pending.clear()
+
+            try:
+                brand, result = finished.get(timeout=1)
+                # 이미 타임아웃 처리된 브랜드의 늦은 결과는 무시
+                if running.pop(brand, None) is not None:
+                    results[brand] = result
+            except queue.Empty:
+                pass
+
+            # 실행 시간이 타임아웃을 넘긴 브랜드는 취소하고 슬롯 반납
+            now = time.monotonic()
+            for brand, (started, cancel) in list(running.items()):
+                if now - started > timeout:
+                    cancel.set()
+                    del running[brand]
+                    logger.error(f"Crawl for {brand} timed out after {timeout}s")
+                    results[brand] = self._timeout_result(
+                        brand, now - started, f"Timed out after {timeout}s"
+                    )
+
+        return [results[brand] for brand in brands]
+
+    def _timeout_result(self, brand: str, duration: float, error: str) -> Dict[str, Any]:
+        """타임아웃된 브랜드의 실행 결과"""
+        return {
+            "brand": brand,
+            "status": "timeout",
+            "duration": round(duration, 2),
+            "error": error,
+        }
+
+    async def _run_async(self, brands: List[str]) -> List[Dict[str, Any]]:
+        """
+        하나의 이벤트 루프에서 동기/비동기 크롤러를 함께 실행 (브랜드별 타임아웃 적용)
+        전체 실행 마감 시간까지 시작하지 못한 브랜드는 timeout으로 기록
+        신제품 삽입은 AsyncSupabaseManager로 이 이벤트 루프에서 처리
+        """
+        async with AsyncSupabaseManager(
+            url=self.db_manager.url, key=self.db_manager.key
+        ) as async_db:
+            self._async_writer = (async_db, asyncio.get_running_loop())
+            try:
+                return await self._run_async_brands(brands)
+            finally:
+                self._async_writer = None
+                self._async_db_metrics = async_db.get_resilience_metrics()
+
+    async def _run_async_brands(self, brands: List[str]) -> List[Dict[str, Any]]:
+        """브랜드별 크롤링을 MAX_CRAWL_WORKERS개까지 동시에 실행"""
+        timeout = settings.crawl_timeout_seconds
+        deadline = time.monotonic() + settings.crawl_run_timeout_seconds
+        semaphore = asyncio.Semaphore(max(1, settings.max_crawl_workers))
+
+        async def run(brand: str) -> Dict[str, Any]:
+            try:
+                await asyncio.wait_for(
+                    semaphore.acquire(), max(0, deadline - time.monotonic())
+                )
+            except asyncio.TimeoutError:
+                logger.error(f"Crawl for {brand} not started before the run deadline")
+                return self._timeout_result(brand, 0, "Not started before the run deadline")
+
+            try:
+                started = time.monotonic()
+                # DB 저장 스레드가 실행 중일 때 타임아웃되면 남은 쓰기를 건너뛰도록 표시
+                cancel = threading.Event()
+                try:
+                    result = await asyncio.wait_for(
+                        self.run_single_crawler_async(brand, cancel), timeout
+                    )
+                except asyncio.TimeoutError:
+                    cancel.set()
+                    logger.error(f"Crawl for {brand} timed out after {timeout}s")
+                    result = self._timeout_result(brand, 0, f"Timed out after {timeout}s")
+                result["duration"] = round(time.monotonic() - started, 2)
+                return result
+            finally:
+                semaphore.release()
+
+        return await asyncio.gather(*(run(brand) for brand in brands))
+
+    def _db_metrics_since(self, before: Dict[str, int]) -> Dict[str, int]:
+        """이번 실행의 DB 호출/재시도/실패 횟수 (async 모드의 비동기 매니저 호출 포함)"""
+        current = self.db_manager.get_resilience_metrics()
+        db_metrics = {name: value - before.get(name, 0) for name, value in current.items()}
+        for name, value in self._async_db_metrics.items():
+            db_metrics[name] = db_metrics.get(name, 0) + value
+        return db_metrics
+
+    def _export_run_metrics(
+        self, results: List[Dict[str, Any]], db_metrics: Dict[str, int]
+    ):
+        """단계별 지표를 JSON 실행 리포트와 Prometheus textfile로 저장"""
+        if not settings.metrics_enabled:
+            return
+
+        metrics = get_metrics()
+        metrics.finish()
+        metrics.set_counter("retries", db_metrics["retries"])
+        metrics.set_counter("db_calls", db_metrics["calls"])
+        metrics.set_info("db", db_metrics)
+        metrics.set_info("driver_pool", get_driver_pool().get_metrics())
+        metrics.set_info("results", results)
+
+        try:
+            if settings.metrics_report_path:
+                metrics.write_json(settings.metrics_report_path)
+            if settings.metrics_prometheus_path:
+                metrics.write_prometheus(settings.metrics_prometheus_path)
+        except Exception as e:
+            logger.error(f"Failed to export run metrics: {str(e)}")
+
+    def _log_run_summary(self, results: List[Dict[str, Any]]):
+        """브랜드별 실행 결과 요약 출력"""
+        for result in results:
+            logger.info(
+                f"[{result['brand']}] status={result.get('status')} "
+                f"crawled={result.get('crawled', 0)} new={result.get('new_items', 0)} "
+                f"saved={result.get('saved', 0)} updated={result.get('updated', 0)} "
+                f"duration={result.get('duration', 'N/A')}s"
+            )
 
     def start_scheduler(self):
         """스케줄러 시작"""
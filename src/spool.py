@@ -0,0 +1,163 @@
+"""
+크롤링 결과 선기록(write-ahead) 스풀 - DB 저장 전에 로컬 JSONL 파일에 추가하고,
+저장에 성공하면 확인(ack) 기록을 남긴다. 확인되지 않은 항목은 다음 실행 때 재처리
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from src.product_index import content_hash, normalize_name, product_snapshot
+
+
+def idempotency_key(item: Dict[str, Any]) -> str:
+    """브랜드 + 정규화된 제품명 + 내용 해시로 만든 멱등 키"""
+    raw = "|".join(
+        [
+            item["brand_name"],
+            normalize_name(item["name"]),
+            content_hash(product_snapshot(item)),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CrawlSpool:
+    """
+    추가 전용 JSONL 스풀
+    {"op": "put", "key", "brand", "item"} 줄로 기록하고 {"op": "ack", "keys"} 줄로 확인
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def append(self, brand: str, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        크롤링 결과를 스풀에 기록 (이미 대기 중인 같은 키는 다시 쓰지 않음)
+        반환값: 항목들의 멱등 키 (저장 성공 후 ack에 사용)
+        """
+        keys = [idempotency_key(item) for item in items]
+        with self._lock:
+            pending = self._load_pending()
+            lines = []
+            for key, item in zip(keys, items):
+                if key in pending:
+                    continue
+                pending[key] = None
+                lines.append(
+                    {"op": "put", "key": key, "brand": brand, "item": item, "ts": time.time()}
+                )
+            self._write_lines(lines)
+        return keys
+
+    def ack(self, keys: List[str]):
+        """저장이 끝난 항목 확인 기록 (대기 항목이 없으면 파일 정리)"""
+        if not keys:
+            return
+        with self._lock:
+            self._write_lines([{"op": "ack", "keys": list(keys), "ts": time.time()}])
+            if not self._load_pending():
+                self._truncate()
+
+    def pending(self) -> List[Dict[str, Any]]:
+        """확인되지 않은 기록 (스풀된 순서)"""
+        with self._lock:
+            return list(self._load_pending().values())
+
+    def compact(self):
+        """확인된 기록을 제거하고 대기 중인 기록만 남기도록 파일 재작성"""
+        with self._lock:
+            records = list(self._load_pending().values())
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+
+    def replay(
+        self,
+        processor: Callable[[str, List[Dict[str, Any]]], bool],
+        max_attempts: int = 3,
+        backoff_seconds: float = 2.0,
+    ) -> Dict[str, int]:
+        """
+        대기 중인 기록을 브랜드별로 processor에 넘겨 재처리 (실패 시 지수 백오프로 재시도)
+        processor는 저장에 성공하면 True를 반환해야 하며, 중복 저장을 스스로 걸러야 한다
+        """
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        for record in self.pending():
+            grouped.setdefault(record["brand"], []).append(record)
+
+        stats = {"brands": len(grouped), "replayed": 0, "failed": 0}
+        for brand, records in grouped.items():
+            items = [record["item"] for record in records]
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    succeeded = processor(brand, items)
+                except Exception as e:
+                    logger.error(f"Spool replay failed for {brand}: {str(e)}")
+                    succeeded = False
+
+                if succeeded:
+                    self.ack([record["key"] for record in records])
+                    stats["replayed"] += len(records)
+                    break
+                if attempt < max_attempts:
+                    delay = backoff_seconds * (2 ** (attempt - 1))
+                    logger.warning(
+                        f"Retrying spool replay for {brand} in {delay}s "
+                        f"({attempt}/{max_attempts})"
+                    )
+                    time.sleep(delay)
+            else:
+                stats["failed"] += len(records)
+
+        if grouped and os.path.exists(self.path):
+            self.compact()
+        return stats
+
+    def _load_pending(self) -> Dict[str, Dict[str, Any]]:
+        """파일을 읽어 확인되지 않은 기록을 키 순서대로 반환"""
+        pending: Dict[str, Optional[Dict[str, Any]]] = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 기록 도중 중단된 마지막 줄
+                        continue
+                    if record.get("op") == "put":
+                        pending.setdefault(record["key"], record)
+                    elif record.get("op") == "ack":
+                        for key in record.get("keys", []):
+                            pending.pop(key, None)
+        except OSError:
+            pass
+        return pending
+
+    def _write_lines(self, records: List[Dict[str, Any]]):
+        """기록을 추가하고 디스크에 동기화 (fsync)"""
+        if not records:
+            return
+        with open(self.path, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _truncate(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.flush()
+            os.fsync(f.fileno())